@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from usuarios.viewsets import UsuariosViewSet
-from usuarios.views import CustomAuthToken, Logout
+from usuarios.views import AccessTokenLogin, CustomAuthToken, Logout, RefreshAccessToken
 from catalogos.viewsets import CatalogoHashTagViewSet
 from movilizaciones.viewsets import ExpedientesViewSet, RegistroViewSet, HashTagRegistroViewSet
+from tareas.viewsets import TareasViewSet
 
 router = DefaultRouter()
 router.register(r'usuarios', UsuariosViewSet, basename='usuarios')
@@ -11,9 +12,12 @@ router.register(r'catalogos/hashtags', CatalogoHashTagViewSet, basename='catalog
 router.register(r'expedientes', ExpedientesViewSet, basename='expedientes')
 router.register(r'registros', RegistroViewSet, basename='registros')
 router.register(r'hashtag-registros', HashTagRegistroViewSet, basename='hashtag-registros')
+router.register(r'tareas', TareasViewSet, basename='tareas')
 
 urlpatterns = [
     path('', include(router.urls)),
     path('auth/login/', CustomAuthToken.as_view(), name='api-login'),
     path('auth/logout/', Logout.as_view(), name='api-logout'),
+    path('auth/access/', AccessTokenLogin.as_view(), name='api-access'),
+    path('auth/refresh/', RefreshAccessToken.as_view(), name='api-refresh'),
 ]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+"""
+Benchmark de creación de registros: N llamadas a POST /api/v1/registros/
+contra una sola llamada a POST /api/v1/registros/bulk/ con los mismos N elementos
+(arreglo JSON y NDJSON).
+
+Todo se ejecuta dentro de una transacción que se revierte al final.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.bulk_registros --registros 1000
+"""
+import os
+import json
+import time
+import argparse
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from movilizaciones.models import Expedientes
+
+
+class Rollback(Exception):
+    pass
+
+
+def medir(nombre, n, funcion):
+    """Ejecuta funcion() y muestra tiempo, registros/seg y consultas"""
+    with CaptureQueriesContext(connection) as queries:
+        inicio = time.perf_counter()
+        funcion()
+        duracion = time.perf_counter() - inicio
+    print(f"  {nombre:<28} {duracion:8.3f} s  {n / duracion:10.1f} reg/s  {len(queries):7d} consultas")
+    return duracion
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, default=1000)
+    parser.add_argument('--hashtags-por-registro', type=int, default=2)
+    args = parser.parse_args()
+
+    try:
+        with transaction.atomic():
+            usuario = Usuarios.objects.create_user(
+                username='bench_bulk', password='!', apellido_paterno='Bench', apellido_materno='Bulk'
+            )
+            expediente = Expedientes.objects.create(
+                usuarios_id=usuario, asunto='bench_bulk', fecha_evento=timezone.now()
+            )
+            hashtags = [
+                CatalogoHashTag.objects.create(descripcion=f'bench_bulk_{i}')
+                for i in range(max(args.hashtags_por_registro, 1))
+            ]
+            hashtag_ids = [hashtag.id for hashtag in hashtags][:args.hashtags_por_registro]
+
+            items = [
+                {
+                    'expedientes_id': expediente.id,
+                    'ubicacion': f'Ubicación {i}',
+                    'descripcion': f'Registro de carga masiva {i}',
+                    'hashtags': hashtag_ids,
+                }
+                for i in range(args.registros)
+            ]
+
+            client = APIClient(SERVER_NAME='localhost')
+            client.force_authenticate(usuario)
+
+            def individuales():
+                for item in items:
+                    data = {key: value for key, value in item.items() if key != 'hashtags'}
+                    response = client.post('/api/v1/registros/', data, format='json')
+                    assert response.status_code == 201, response.content
+                    # La respuesta de RegistroCreateSerializer no incluye el id
+                    registro_id = Expedientes.objects.get(pk=expediente.pk).registros.latest('id').id
+                    for hashtag_id in item['hashtags']:
+                        client.post(
+                            f'/api/v1/registros/{registro_id}/agregar_hashtag/',
+                            {'id_catalogo_hashtag': hashtag_id},
+                            format='json',
+                        )
+
+            def bulk_json():
+                response = client.post('/api/v1/registros/bulk/', items, format='json')
+                assert response.json()['data']['failed'] == 0, response.content
+
+            def bulk_ndjson():
+                body = '\n'.join(json.dumps(item) for item in items).encode('utf-8')
+                response = client.post('/api/v1/registros/bulk/', body, content_type='application/x-ndjson')
+                assert response.json()['data']['failed'] == 0, response.content
+
+            print("=" * 70)
+            print(f"CREACIÓN DE {args.registros} REGISTROS ({args.hashtags_por_registro} hashtags c/u) - {connection.vendor}")
+            print("=" * 70)
+            base = medir('POST individual + hashtags', args.registros, individuales)
+            json_time = medir('POST /bulk/ (JSON)', args.registros, bulk_json)
+            ndjson_time = medir('POST /bulk/ (NDJSON)', args.registros, bulk_ndjson)
+            print(f"\n  Aceleración JSON:   x{base / json_time:.1f}")
+            print(f"  Aceleración NDJSON: x{base / ndjson_time:.1f}")
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Benchmark de exportación en streaming: memoria pico (tracemalloc) y tiempo de
+generar el CSV/NDJSON de un expediente con distintos números de registros.
+La memoria pico debe mantenerse plana al crecer el expediente; los tiempos
+incluyen el costo de tracemalloc.
+
+Todo se ejecuta dentro de una transacción que se revierte al final.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.export_registros --registros 1000 10000 100000
+"""
+import os
+import time
+import argparse
+import tracemalloc
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+from movilizaciones.export import EXPORT_CHUNK_SIZE, stream_export
+
+
+class Rollback(Exception):
+    pass
+
+
+def poblar(usuario, hashtags, n):
+    """Crea un expediente con n registros y un hashtag por registro"""
+    expediente = Expedientes.objects.create(usuarios_id=usuario, asunto=f'bench_export_{n}', fecha_evento=timezone.now())
+    for inicio in range(0, n, 5000):
+        registros = Registro.objects.bulk_create([
+            Registro(
+                expedientes_id=expediente,
+                creado_por=usuario,
+                ubicacion=f'Ubicación {i}',
+                descripcion=f'Registro de exportación {i}',
+            )
+            for i in range(inicio, min(inicio + 5000, n))
+        ])
+        HashTag_Registro.objects.bulk_create([
+            HashTag_Registro(id_registro=registro, id_catalogo_hashtag=hashtags[i % len(hashtags)])
+            for i, registro in enumerate(registros)
+        ])
+    return expediente
+
+
+def medir(queryset, formato, chunk_size):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    total_bytes = sum(len(chunk) for chunk in stream_export(queryset, formato, chunk_size))
+    duracion = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duracion, pico, total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    try:
+        with transaction.atomic():
+            usuario = Usuarios.objects.create_user(
+                username='bench_export', password='!', apellido_paterno='Bench', apellido_materno='Export'
+            )
+            hashtags = [CatalogoHashTag.objects.create(descripcion=f'bench_export_{i}') for i in range(5)]
+
+            print("=" * 78)
+            print(f"EXPORTACIÓN EN STREAMING (bloques de {args.chunk_size}) - {connection.vendor}")
+            print("=" * 78)
+            print(f"  {'registros':>10} {'formato':>8} {'tiempo':>10} {'reg/s':>12} {'memoria pico':>14} {'salida':>12}")
+            for n in args.registros:
+                expediente = poblar(usuario, hashtags, n)
+                queryset = Registro.objects.filter(expedientes_id=expediente).order_by('id')
+                for formato in ('csv', 'ndjson'):
+                    duracion, pico, total_bytes = medir(queryset, formato, args.chunk_size)
+                    print(
+                        f"  {n:>10} {formato:>8} {duracion:>9.2f}s {n / duracion:>12.0f} "
+                        f"{pico / 1024 / 1024:>11.1f} MB {total_bytes / 1024 / 1024:>9.1f} MB"
+                    )
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+"""
+Benchmark de índices: muestra los planes de consulta (EXPLAIN ANALYZE) de los
+patrones de acceso reales antes y después de los índices compuestos y parciales.
+
+Requiere PostgreSQL. Todo se ejecuta dentro de una transacción que se revierte
+al final, por lo que los datos generados y los cambios de índices no persisten.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.indexes --registros 1000000
+"""
+import os
+import argparse
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from datetime import timedelta
+from django.db import connection, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+
+
+# Índices agregados por la migración 0005 (model, nombre)
+NUEVOS_INDICES = [
+    (Expedientes, 'expedientes_usr_created_idx'),
+    (Expedientes, 'expedientes_activo_usr_idx'),
+    (Registro, 'registro_creador_created_idx'),
+    (Registro, 'registro_activo_created_idx'),
+    (Registro, 'registro_activo_fecha_idx'),
+    (HashTag_Registro, 'hashtag_reg_registro_cat_idx'),
+]
+
+# Índices de una sola columna de las FK que existían antes (model, campo)
+INDICES_FK_ANTERIORES = [
+    (Expedientes, 'usuarios_id'),
+    (Registro, 'creado_por'),
+    (HashTag_Registro, 'id_registro'),
+]
+
+
+# Patrones LIKE para identificar los datos generados
+PATRON_USUARIOS = 'bench\\_%'
+PATRON_EXPEDIENTES = 'bench\\_asunto\\_%'
+PATRON_HASHTAGS = 'bench\\_tag\\_%'
+PATRON_REGISTROS = 'bench\\_ubicacion\\_%'
+
+
+class Rollback(Exception):
+    pass
+
+
+def column(model, field_name):
+    return model._meta.get_field(field_name).column
+
+
+def generar_datos(num_usuarios, num_expedientes, num_registros, num_hashtags):
+    """Genera datos sintéticos con generate_series directamente en PostgreSQL"""
+    print(f"\nGenerando {num_usuarios} usuarios, {num_expedientes} expedientes, "
+          f"{num_registros} registros...")
+    with connection.cursor() as cursor:
+        cursor.execute(f"""
+            INSERT INTO {Usuarios._meta.db_table}
+                (password, is_superuser, username, first_name, last_name, email,
+                 is_staff, is_active, date_joined, apellido_paterno, apellido_materno, registros_count, token_version)
+            SELECT '!', false, 'bench_' || g, 'Nombre' || g, '', '', false, true, now(),
+                   'Paterno', 'Materno', 0, 0
+            FROM generate_series(1, %s) g
+        """, [num_usuarios])
+        cursor.execute(f"""
+            INSERT INTO {CatalogoHashTag._meta.db_table} (descripcion, activo, uso_count, created_at, updated_at)
+            SELECT 'bench_tag_' || g, true, 0, now(), now()
+            FROM generate_series(1, %s) g
+        """, [num_hashtags])
+        cursor.execute(f"""
+            INSERT INTO {Expedientes._meta.db_table}
+                ({column(Expedientes, 'usuarios_id')}, asunto, fecha_evento, activo,
+                 registros_count, registros_activos_count, created_at, updated_at)
+            SELECT u.ids[1 + (g % array_length(u.ids, 1))], 'bench_asunto_' || g, now(),
+                   (g % 10) <> 0, 0, 0,
+                   now() - (random() * interval '730 days'), now()
+            FROM generate_series(1, %s) g,
+                 (SELECT array_agg(id) AS ids FROM {Usuarios._meta.db_table}
+                  WHERE username LIKE %s) u
+        """, [num_expedientes, PATRON_USUARIOS])
+        cursor.execute(f"""
+            INSERT INTO {Registro._meta.db_table}
+                ({column(Registro, 'expedientes_id')}, {column(Registro, 'creado_por')},
+                 ubicacion, descripcion, fecha, hora, activo, created_at, updated_at)
+            SELECT e.ids[1 + (g % array_length(e.ids, 1))],
+                   u.ids[1 + ((g * 7) % array_length(u.ids, 1))],
+                   'bench_ubicacion_' || g, 'Descripción ' || g,
+                   t::date, t::time, (g % 10) <> 0, t, t
+            FROM generate_series(1, %s) g
+                 CROSS JOIN LATERAL (SELECT now() - (random() * interval '730 days') AS t
+                                     WHERE g > 0) ts,
+                 (SELECT array_agg(id) AS ids FROM {Expedientes._meta.db_table}
+                  WHERE asunto LIKE %s) e,
+                 (SELECT array_agg(id) AS ids FROM {Usuarios._meta.db_table}
+                  WHERE username LIKE %s) u
+        """, [num_registros, PATRON_EXPEDIENTES, PATRON_USUARIOS])
+        cursor.execute(f"""
+            INSERT INTO {HashTag_Registro._meta.db_table}
+                ({column(HashTag_Registro, 'id_catalogo_hashtag')}, {column(HashTag_Registro, 'id_registro')},
+                 created_at, updated_at)
+            SELECT h.ids[1 + ((r.id + k) % array_length(h.ids, 1))], r.id, now(), now()
+            FROM {Registro._meta.db_table} r,
+                 generate_series(0, 1) k,
+                 (SELECT array_agg(id) AS ids FROM {CatalogoHashTag._meta.db_table}
+                  WHERE descripcion LIKE %s) h
+            WHERE r.ubicacion LIKE %s
+        """, [PATRON_HASHTAGS, PATRON_REGISTROS])
+        for model in (Usuarios, CatalogoHashTag, Expedientes, Registro, HashTag_Registro):
+            cursor.execute(f"ANALYZE {model._meta.db_table}")
+    print("✓ Datos generados")
+
+
+def consultas(usuario):
+    """Consultas tal como las construyen los ViewSets"""
+    hace_un_mes = (timezone.now() - timedelta(days=30)).date()
+    registros_visibles = Registro.objects.filter(
+        Q(creado_por=usuario) | Q(expedientes_id__usuarios_id=usuario)
+    ).order_by('-created_at')
+    ids_pagina = list(registros_visibles.values_list('id', flat=True)[:20])
+    return [
+        ('RegistroViewSet.list (usuario normal)', registros_visibles[:20]),
+        ('RegistroViewSet.list ?activo=true&fecha_after=...',
+         Registro.objects.filter(activo=True, fecha__gte=hace_un_mes).order_by('-created_at')[:20]),
+        ('RegistroViewSet.list ?activo=true (superusuario)',
+         Registro.all_with_inactive.filter(activo=True).order_by('-created_at', '-id')[:20]),
+        ('ExpedientesViewSet.list (usuario normal)',
+         Expedientes.objects.filter(usuarios_id=usuario).order_by('-created_at')[:20]),
+        ('ExpedientesViewSet.list ?activo=true',
+         Expedientes.objects.filter(usuarios_id=usuario, activo=True).order_by('-created_at')[:20]),
+        ('Registros activos de un expediente (Registro.objects)',
+         Registro.objects.filter(expedientes_id__usuarios_id=usuario).order_by('expedientes_id', '-created_at', '-id')[:20]),
+        ('Prefetch de hashtags de una página',
+         HashTag_Registro.objects.filter(id_registro__in=ids_pagina)
+         .values_list('id_registro', 'id_catalogo_hashtag')),
+    ]
+
+
+def imprimir_planes(titulo, usuario):
+    print("\n" + "=" * 70)
+    print(titulo)
+    print("=" * 70)
+    for nombre, queryset in consultas(usuario):
+        print(f"\n--- {nombre}")
+        print(queryset.explain(analyze=True, buffers=True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--usuarios', type=int, default=2000)
+    parser.add_argument('--expedientes', type=int, default=50000)
+    parser.add_argument('--registros', type=int, default=1000000)
+    parser.add_argument('--hashtags', type=int, default=200)
+    args = parser.parse_args()
+
+    if connection.vendor != 'postgresql':
+        print("❌ Este benchmark requiere PostgreSQL (DB_ENGINE=django.db.backends.postgresql)")
+        return
+
+    try:
+        with transaction.atomic():
+            generar_datos(args.usuarios, args.expedientes, args.registros, args.hashtags)
+            usuario = Usuarios.objects.filter(username__startswith='bench_').order_by('id').first()
+
+            # Antes: sin los índices nuevos y con los índices de FK de una columna
+            with transaction.atomic():
+                with connection.schema_editor(atomic=False) as editor:
+                    for model, nombre in NUEVOS_INDICES:
+                        index = next(i for i in model._meta.indexes if i.name == nombre)
+                        editor.remove_index(model, index)
+                    for model, campo in INDICES_FK_ANTERIORES:
+                        editor.add_index(model, models.Index(fields=[campo], name=f'bench_{column(model, campo)}'[:30]))
+                with connection.cursor() as cursor:
+                    for model in (Expedientes, Registro, HashTag_Registro):
+                        cursor.execute(f"ANALYZE {model._meta.db_table}")
+                imprimir_planes("ANTES: índices de FK de una sola columna", usuario)
+                transaction.set_rollback(True)
+
+            imprimir_planes("DESPUÉS: índices compuestos y parciales", usuario)
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
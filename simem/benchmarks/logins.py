@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+"""
+Benchmark de login: logins por segundo en POST /api/v1/auth/login/ y costo
+del trabajo posterior a la validación de la contraseña (ruta anterior:
+get_all_permissions + consulta de grupos + save() completo, contra la ruta
+actual: perfil en caché + UPDATE de last_login).
+
+Con --hasher-rapido se usa MD5PasswordHasher para aislar el costo que no es
+PBKDF2 (solo para medir; nunca en producción).
+
+Todo se ejecuta dentro de una transacción que se revierte al final.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.logins --usuarios 200 --logins 500
+"""
+import os
+import time
+import random
+import argparse
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from usuarios.models import Usuarios
+from usuarios.permissions_cache import profiles, user_profile
+
+PASSWORD = 'bench-login-123'
+
+
+class Rollback(Exception):
+    pass
+
+
+def medir(nombre, n, funcion):
+    """Ejecuta funcion() n veces y muestra operaciones/seg y consultas por operación"""
+    with CaptureQueriesContext(connection) as queries:
+        inicio = time.perf_counter()
+        for i in range(n):
+            funcion(i)
+        duracion = time.perf_counter() - inicio
+    print(f"  {nombre:<36} {n / duracion:10.1f} /s  {len(queries) / n:6.1f} consultas c/u")
+    return duracion
+
+
+def crear_usuarios(n):
+    grupo = Group.objects.create(name='bench_login')
+    grupo.permissions.set(Permission.objects.filter(content_type__app_label='movilizaciones'))
+    # Un solo hash para todos: crear n hashes PBKDF2 tardaría más que el benchmark
+    password = make_password(PASSWORD)
+    usuarios = Usuarios.objects.bulk_create([
+        Usuarios(
+            username=f'bench_login_{i}', password=password,
+            apellido_paterno='Bench', apellido_materno='Login', numero_empleado=900000 + i,
+        )
+        for i in range(n)
+    ])
+    Usuarios.groups.through.objects.bulk_create([
+        Usuarios.groups.through(usuarios_id=usuario.pk, group_id=grupo.pk) for usuario in usuarios
+    ])
+    return usuarios
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--usuarios', type=int, default=200)
+    parser.add_argument('--logins', type=int, default=500)
+    parser.add_argument('--hasher-rapido', action='store_true', help='Usa MD5PasswordHasher para aislar el costo de PBKDF2')
+    args = parser.parse_args()
+
+    hashers = ['django.contrib.auth.hashers.MD5PasswordHasher'] if args.hasher_rapido else None
+    try:
+        with transaction.atomic(), override_settings(**({'PASSWORD_HASHERS': hashers} if hashers else {})):
+            usuarios = crear_usuarios(args.usuarios)
+            client = APIClient(SERVER_NAME='localhost')
+            rng = random.Random(42)
+
+            def login(_):
+                usuario = rng.choice(usuarios)
+                response = client.post(
+                    '/api/v1/auth/login/', {'username': usuario.username, 'password': PASSWORD}, format='json'
+                )
+                assert response.status_code == 200, response.content
+
+            def ruta_anterior(i):
+                usuario = Usuarios.objects.get(pk=usuarios[i % len(usuarios)].pk)
+                list(usuario.get_all_permissions())
+                list(usuario.groups.values_list('name', flat=True))
+                usuario.last_login = timezone.now()
+                usuario.save()
+
+            def ruta_actual(i):
+                usuario = Usuarios.objects.get(pk=usuarios[i % len(usuarios)].pk)
+                user_profile(usuario)
+                Usuarios.objects.filter(pk=usuario.pk).update(last_login=timezone.now())
+
+            hasher = 'MD5 (solo medición)' if hashers else 'configurado'
+            print("=" * 70)
+            print(f"LOGIN - {args.usuarios} usuarios, hasher {hasher} - {connection.vendor}")
+            print("=" * 70)
+            medir('POST /auth/login/', args.logins, login)
+            print("\nTrabajo posterior a la contraseña:")
+            # Se mide primero la ruta actual con la caché caliente: el save() completo
+            # de la ruta anterior invalida el perfil de cada usuario
+            profiles(usuarios)
+            actual = medir('ruta actual (perfil en caché)', args.logins, ruta_actual)
+            anterior = medir('ruta anterior', args.logins, ruta_anterior)
+            print(f"\n  Aceleración: x{anterior / actual:.1f}")
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
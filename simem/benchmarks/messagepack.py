@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+Benchmark de formatos de respuesta: tamaño del payload (también con gzip) y
+tiempo de codificar/decodificar una página de registros (envelope de
+ok_response con la salida de RegistroProjection) en JSON contra MessagePack.
+
+Requiere el paquete msgpack. Todo se ejecuta dentro de una transacción que se
+revierte al final.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.messagepack --pagina 500 --repeticiones 200
+"""
+import os
+import gzip
+import json
+import time
+import argparse
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.db import connection, transaction
+
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from helpers.messagepack import MessagePackParser, MessagePackRenderer
+from helpers.streaming import StreamingJSONRenderer
+from movilizaciones.models import Registro
+from movilizaciones.projections import RegistroProjection
+from benchmarks.projection import poblar
+
+
+class Rollback(Exception):
+    pass
+
+
+class Cuerpo:
+    """Stream mínimo para el parser"""
+
+    def __init__(self, content):
+        self.content = content
+
+    def read(self):
+        return self.content
+
+
+def medir(repeticiones, funcion):
+    funcion()
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pagina', type=int, default=500, help='Registros por página')
+    parser.add_argument('--repeticiones', type=int, default=200)
+    parser.add_argument('--hashtags-por-registro', type=int, default=3)
+    args = parser.parse_args()
+
+    try:
+        with transaction.atomic():
+            usuario = Usuarios.objects.create_user(
+                username='bench_msgpack', password='!', apellido_paterno='Bench', apellido_materno='MessagePack'
+            )
+            hashtags = [CatalogoHashTag.objects.create(descripcion=f'bench_msgpack_{i}') for i in range(10)]
+            expediente = poblar(usuario, hashtags, args.pagina, args.hashtags_por_registro)
+            projection = RegistroProjection()
+            registros = Registro.objects.filter(expedientes_id=expediente).order_by('-created_at')
+            envelope = {
+                'message': 'Acción realizada correctamente',
+                'data': projection.to_representation(projection.queryset(registros)),
+                'code': 200,
+            }
+
+            formatos = [
+                ('JSON', StreamingJSONRenderer(), json.loads),
+                ('MessagePack', MessagePackRenderer(), lambda content: MessagePackParser().parse(Cuerpo(content))),
+            ]
+            print("=" * 78)
+            print(f"JSON CONTRA MESSAGEPACK - página de {args.pagina} registros - {connection.vendor}")
+            print("=" * 78)
+            print(f"  {'formato':<12} {'tamaño':>10} {'con gzip':>10} {'codificar':>12} {'decodificar':>12}")
+            decodificados = []
+            for nombre, renderer, decodificar in formatos:
+                codificar_ms, content = medir(args.repeticiones, lambda: renderer.render(envelope))
+                decodificar_ms, decodificado = medir(args.repeticiones, lambda: decodificar(content))
+                decodificados.append(decodificado)
+                print(
+                    f"  {nombre:<12} {len(content) / 1024:>7.1f} KB {len(gzip.compress(content)) / 1024:>7.1f} KB "
+                    f"{codificar_ms:>9.2f} ms {decodificar_ms:>9.2f} ms"
+                )
+            print(f"\n  Mismo contenido decodificado: {'sí' if decodificados[0] == decodificados[1] else 'NO'}")
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
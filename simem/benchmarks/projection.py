@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+Benchmark de serialización de listados: filas por segundo de RegistroSerializer y
+HashTagRegistroSerializer (instancias + to_representation de cada campo) contra
+las proyecciones desde values_list() (movilizaciones.projections).
+
+Se mide la página completa (consultas + serialización) y se verifica que ambas
+salidas sean idénticas. Todo se ejecuta dentro de una transacción que se revierte
+al final.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.projection --pagina 100 --repeticiones 50
+"""
+import os
+import json
+import time
+import argparse
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.utils import timezone
+
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from helpers.query_plans import apply_query_plan
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+from movilizaciones.projections import HashTagRegistroProjection, RegistroProjection
+from movilizaciones.serializers import HashTagRegistroSerializer, RegistroSerializer
+from movilizaciones.viewsets import REGISTRO_LIST_PLAN
+
+
+class Rollback(Exception):
+    pass
+
+
+def poblar(usuario, hashtags, n, hashtags_por_registro):
+    expediente = Expedientes.objects.create(usuarios_id=usuario, asunto='bench_projection', fecha_evento=timezone.now())
+    registros = Registro.objects.bulk_create([
+        Registro(
+            expedientes_id=expediente,
+            creado_por=usuario,
+            ubicacion=f'Ubicación {i}',
+            descripcion=f'Registro de proyección {i}',
+        )
+        for i in range(n)
+    ])
+    HashTag_Registro.objects.bulk_create([
+        HashTag_Registro(id_registro=registro, id_catalogo_hashtag=hashtags[(i + j) % len(hashtags)])
+        for i, registro in enumerate(registros)
+        for j in range(hashtags_por_registro)
+    ])
+    return expediente
+
+
+def medir(nombre, repeticiones, filas, funcion):
+    funcion()  # calentamiento (copia del catálogo, caché de consultas)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        data = funcion()
+    duracion = time.perf_counter() - inicio
+    velocidad = repeticiones * filas / duracion
+    print(f"  {nombre:<44} {velocidad:12.0f} filas/s  {duracion / repeticiones * 1000:8.2f} ms/página")
+    return velocidad, data
+
+
+def comparar(titulo, repeticiones, filas, serializador, proyeccion):
+    print(f"\n{titulo}:")
+    lento, salida_serializer = medir('ModelSerializer', repeticiones, filas, serializador)
+    rapido, salida_proyeccion = medir('Proyección (values_list)', repeticiones, filas, proyeccion)
+    identicas = (
+        json.dumps(salida_serializer, cls=DjangoJSONEncoder) == json.dumps(salida_proyeccion, cls=DjangoJSONEncoder)
+    )
+    print(f"  Aceleración: x{rapido / lento:.1f}   salida idéntica: {'sí' if identicas else 'NO'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pagina', type=int, default=100, help='Filas por página')
+    parser.add_argument('--repeticiones', type=int, default=50)
+    parser.add_argument('--hashtags-por-registro', type=int, default=3)
+    args = parser.parse_args()
+
+    try:
+        with transaction.atomic():
+            usuario = Usuarios.objects.create_user(
+                username='bench_projection', password='!', apellido_paterno='Bench', apellido_materno='Projection'
+            )
+            hashtags = [CatalogoHashTag.objects.create(descripcion=f'bench_projection_{i}') for i in range(10)]
+            expediente = poblar(usuario, hashtags, args.pagina, args.hashtags_por_registro)
+
+            registros = Registro.objects.filter(expedientes_id=expediente).order_by('-created_at')
+            enlaces = HashTag_Registro.objects.filter(id_registro__expedientes_id=expediente).order_by('-created_at')
+            enlaces_por_pagina = args.pagina * args.hashtags_por_registro
+
+            print("=" * 78)
+            print(f"SERIALIZACIÓN DE LISTADOS - página de {args.pagina} registros - {connection.vendor}")
+            print("=" * 78)
+            comparar(
+                'Registros (RegistroSerializer)', args.repeticiones, args.pagina,
+                lambda: RegistroSerializer(list(apply_query_plan(registros, REGISTRO_LIST_PLAN)), many=True).data,
+                lambda: (lambda p: p.to_representation(p.queryset(registros)))(RegistroProjection()),
+            )
+            comparar(
+                'Hashtag-registros (HashTagRegistroSerializer)', args.repeticiones, enlaces_por_pagina,
+                lambda: HashTagRegistroSerializer(list(enlaces), many=True).data,
+                lambda: (lambda p: p.to_representation(p.queryset(enlaces)))(HashTagRegistroProjection()),
+            )
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
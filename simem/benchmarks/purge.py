@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Benchmark de eliminación de expedientes: memoria pico (tracemalloc) y tiempo de
+instance.delete() (el collector de Django carga la cascada completa) contra la
+purga por bloques de movilizaciones.purge (DELETE ... WHERE id IN (...)).
+También muestra la transacción más larga de cada camino: con delete() es toda
+la cascada, con la purga es el bloque más lento.
+
+Todo se ejecuta dentro de una transacción que se revierte al final.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.purge --registros 10000 50000 --batch-size 1000
+"""
+import os
+import time
+import argparse
+import tracemalloc
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from movilizaciones import counters
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+from movilizaciones.purge import eliminar_expediente, purgar_registros
+
+
+class Rollback(Exception):
+    pass
+
+
+def poblar(usuario, hashtags, n):
+    """Crea un expediente con n registros y dos hashtags por registro"""
+    expediente = Expedientes.objects.create(usuarios_id=usuario, asunto=f'bench_purge_{n}', fecha_evento=timezone.now())
+    for inicio in range(0, n, 5000):
+        registros = Registro.objects.bulk_create([
+            Registro(expedientes_id=expediente, creado_por=usuario, ubicacion=f'Ubicación {i}', descripcion=f'Registro {i}')
+            for i in range(inicio, min(inicio + 5000, n))
+        ])
+        HashTag_Registro.objects.bulk_create([
+            HashTag_Registro(id_registro=registro, id_catalogo_hashtag=hashtags[(i + k) % len(hashtags)])
+            for i, registro in enumerate(registros)
+            for k in range(2)
+        ])
+    return expediente
+
+
+def cascada(expediente_id, batch_size):
+    """ExpedientesViewSet.destroy sin ?purgar: una sola transacción"""
+    with transaction.atomic():
+        expediente = Expedientes.objects.get(pk=expediente_id)
+        counters.registros_eliminados(expediente.registros.all())
+        expediente.delete()
+
+
+def purga(expediente_id, batch_size):
+    """Tarea movilizaciones.purgar_expediente: un bloque por transacción"""
+    bloques = []
+    inicio = time.perf_counter()
+    for _ in purgar_registros(expediente_id, batch_size):
+        bloques.append(time.perf_counter() - inicio)
+        inicio = time.perf_counter()
+    eliminar_expediente(expediente_id)
+    return max(bloques, default=0)
+
+
+def medir(funcion, expediente_id, batch_size):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    bloque = funcion(expediente_id, batch_size)
+    duracion = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duracion, pico, bloque if bloque is not None else duracion
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, nargs='+', default=[10000, 50000])
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    try:
+        with transaction.atomic():
+            usuario = Usuarios.objects.create_superuser(
+                username='bench_purge', password='!', apellido_paterno='Bench', apellido_materno='Purge'
+            )
+            hashtags = [CatalogoHashTag.objects.create(descripcion=f'bench_purge_{i}') for i in range(5)]
+
+            print("=" * 78)
+            print(f"ELIMINACIÓN DE EXPEDIENTES: delete() en cascada contra purga por bloques - {connection.vendor}")
+            print("=" * 78)
+            print(f"  {'registros':>10} {'camino':>8} {'tiempo':>10} {'memoria pico':>14} {'transacción más larga':>22}")
+            for n in args.registros:
+                for nombre, funcion in (('cascada', cascada), ('purga', purga)):
+                    expediente = poblar(usuario, hashtags, n)
+                    duracion, pico, bloque = medir(funcion, expediente.pk, args.batch_size)
+                    print(f"  {n:>10} {nombre:>8} {duracion:>9.2f}s {pico / 1024 / 1024:>11.1f} MB {bloque:>21.3f}s")
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+"""
+Benchmark de respuestas sin paginar: memoria pico (tracemalloc) y tiempo de
+GET /expedientes/{id}/registros/ con ok_response (lista completa + un solo
+render) contra la respuesta en streaming (helpers.streaming). La respuesta se
+consume completa como lo haría el servidor; se verifica que ambas salidas sean
+idénticas. Los tiempos incluyen el costo de tracemalloc.
+
+Todo se ejecuta dentro de una transacción que se revierte al final.
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.streaming --registros 1000 10000 50000
+"""
+import os
+import time
+import argparse
+import tracemalloc
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+
+
+class Rollback(Exception):
+    pass
+
+
+def poblar(usuario, hashtags, n):
+    """Crea un expediente con n registros y un hashtag por registro"""
+    expediente = Expedientes.objects.create(usuarios_id=usuario, asunto=f'bench_streaming_{n}', fecha_evento=timezone.now())
+    for inicio in range(0, n, 5000):
+        registros = Registro.objects.bulk_create([
+            Registro(
+                expedientes_id=expediente,
+                creado_por=usuario,
+                ubicacion=f'Ubicación {i}',
+                descripcion=f'Registro de streaming {i}',
+            )
+            for i in range(inicio, min(inicio + 5000, n))
+        ])
+        HashTag_Registro.objects.bulk_create([
+            HashTag_Registro(id_registro=registro, id_catalogo_hashtag=hashtags[i % len(hashtags)])
+            for i, registro in enumerate(registros)
+        ])
+    return expediente
+
+
+def cuerpo(response):
+    if response.streaming:
+        return b''.join(response.streaming_content)
+    return response.content
+
+
+def medir(client, url, streaming):
+    with override_settings(API_STREAMING_RESPONSES=streaming):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        response = client.get(url)
+        # Como el servidor: cada bloque se escribe y se descarta
+        chunks = response.streaming_content if response.streaming else [response.content]
+        total_bytes = sum(len(chunk) for chunk in chunks)
+        duracion = time.perf_counter() - inicio
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return duracion, pico, total_bytes
+
+
+def identicas(client, url):
+    salidas = []
+    for streaming in (False, True):
+        with override_settings(API_STREAMING_RESPONSES=streaming):
+            salidas.append(cuerpo(client.get(url)))
+    return salidas[0] == salidas[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, nargs='+', default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    try:
+        with transaction.atomic():
+            usuario = Usuarios.objects.create_superuser(
+                username='bench_streaming', password='!', apellido_paterno='Bench', apellido_materno='Streaming'
+            )
+            hashtags = [CatalogoHashTag.objects.create(descripcion=f'bench_streaming_{i}') for i in range(5)]
+            client = APIClient(SERVER_NAME='localhost')
+            client.force_authenticate(usuario)
+
+            print("=" * 78)
+            print(f"RESPUESTAS SIN PAGINAR: ok_response contra streaming - {connection.vendor}")
+            print("=" * 78)
+            print(f"  {'registros':>10} {'respuesta':>10} {'tiempo':>10} {'reg/s':>12} {'memoria pico':>14} {'salida':>10}")
+            for n in args.registros:
+                expediente = poblar(usuario, hashtags, n)
+                url = f'/api/v1/expedientes/{expediente.pk}/registros/'
+                for nombre, streaming in (('completa', False), ('streaming', True)):
+                    duracion, pico, total_bytes = medir(client, url, streaming)
+                    print(
+                        f"  {n:>10} {nombre:>10} {duracion:>9.2f}s {n / duracion:>12.0f} "
+                        f"{pico / 1024 / 1024:>11.1f} MB {total_bytes / 1024 / 1024:>7.1f} MB"
+                    )
+                print(f"  {'':>10} salida idéntica: {'sí' if identicas(client, url) else 'NO'}")
+            raise Rollback()
+    except Rollback:
+        print("\n✓ Transacción revertida, la base de datos quedó sin cambios")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""
+Benchmark de lecturas concurrentes: peticiones por segundo y latencia de los
+GET de lectura (listados, detalle, /expedientes/{id}/registros/, /activos/,
+/usuarios/me/) servidos por gunicorn (WSGI, hilos) contra uvicorn (ASGI,
+acciones async de helpers.async_views) con el mismo número de procesos.
+La fila "asgi-sync" es uvicorn con API_ASYNC_READS=False (vistas síncronas).
+
+Los servidores se lanzan como subprocesos con la configuración de base de datos
+del entorno (DB_ENGINE, DB_NAME, DB_HOST...); la medición tiene sentido contra
+PostgreSQL. Como los servidores son otros procesos los datos no pueden vivir en
+una transacción: se crean al inicio y se eliminan al final.
+
+Requiere gunicorn y uvicorn (no forman parte de requirements.txt).
+
+Uso (desde el directorio simem/):
+    python -m benchmarks.wsgi_asgi --concurrencia 1 16 64 --peticiones 2000
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+import subprocess
+import http.client
+import statistics
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+django.setup()
+
+from django.db import connection
+from django.utils import timezone
+
+from usuarios.authentication import issue_access_token
+from usuarios.models import Usuarios
+from catalogos.models import CatalogoHashTag
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+
+HOST = '127.0.0.1'
+
+
+def poblar(expedientes, registros):
+    usuario = Usuarios.objects.create_superuser(
+        username='bench_wsgi_asgi', password='!', apellido_paterno='Bench', apellido_materno='ASGI'
+    )
+    hashtags = [CatalogoHashTag.objects.create(descripcion=f'bench_wsgi_asgi_{i}') for i in range(5)]
+    creados = Expedientes.objects.bulk_create([
+        Expedientes(usuarios_id=usuario, asunto=f'bench_wsgi_asgi_{i}', fecha_evento=timezone.now())
+        for i in range(expedientes)
+    ])
+    for expediente in creados:
+        nuevos = Registro.objects.bulk_create([
+            Registro(expedientes_id=expediente, creado_por=usuario, ubicacion=f'Ubicación {i}', descripcion=f'Registro {i}')
+            for i in range(registros)
+        ])
+        HashTag_Registro.objects.bulk_create([
+            HashTag_Registro(id_registro=registro, id_catalogo_hashtag=hashtags[i % len(hashtags)])
+            for i, registro in enumerate(nuevos)
+        ])
+    return usuario, hashtags, creados
+
+
+def limpiar(usuario, hashtags):
+    # Expedientes, registros y sus hashtags se eliminan en cascada
+    usuario.delete()
+    CatalogoHashTag.objects.filter(pk__in=[hashtag.pk for hashtag in hashtags]).delete()
+
+
+def rutas(expedientes):
+    ids = [expediente.pk for expediente in expedientes]
+    return [
+        '/api/v1/expedientes/',
+        f'/api/v1/expedientes/{ids[0]}/',
+        f'/api/v1/expedientes/{ids[-1]}/registros/',
+        '/api/v1/registros/',
+        '/api/v1/registros/?page=2',
+        '/api/v1/hashtag-registros/',
+        '/api/v1/catalogos/hashtags/activos/',
+        '/api/v1/usuarios/me/',
+    ]
+
+
+def esperar_puerto(puerto, proceso, limite=30):
+    inicio = time.monotonic()
+    while time.monotonic() - inicio < limite:
+        if proceso.poll() is not None:
+            raise RuntimeError(f'El servidor terminó con código {proceso.returncode}')
+        try:
+            with socket.create_connection((HOST, puerto), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'El servidor no abrió el puerto {puerto}')
+
+
+def lanzar(servidor, puerto, workers, threads):
+    env = dict(os.environ, PYTHONUNBUFFERED='1')
+    if servidor == 'wsgi':
+        comando = [
+            sys.executable, '-m', 'gunicorn', 'simem.wsgi:application', '--bind', f'{HOST}:{puerto}',
+            '--workers', str(workers), '--threads', str(threads), '--worker-class', 'gthread', '--log-level', 'warning',
+        ]
+    else:
+        # asgi.py activa API_ASYNC_READS salvo que el entorno lo defina
+        env['API_ASYNC_READS'] = 'True' if servidor == 'asgi' else 'False'
+        comando = [
+            sys.executable, '-m', 'uvicorn', 'simem.asgi:application', '--host', HOST, '--port', str(puerto),
+            '--workers', str(workers), '--log-level', 'warning', '--no-access-log',
+        ]
+    proceso = subprocess.Popen(comando, env=env, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    esperar_puerto(puerto, proceso)
+    return proceso
+
+
+def cargar(puerto, urls, token, concurrencia, peticiones):
+    """Reparte las peticiones entre `concurrencia` hilos con conexiones keep-alive"""
+    local = threading.local()
+    headers = {'Authorization': f'Bearer {token}', 'Accept': 'application/json'}
+
+    def una(i):
+        conexion = getattr(local, 'conexion', None)
+        if conexion is None:
+            conexion = local.conexion = http.client.HTTPConnection(HOST, puerto, timeout=60)
+        inicio = time.perf_counter()
+        conexion.request('GET', urls[i % len(urls)], headers=headers)
+        response = conexion.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f'{urls[i % len(urls)]} respondió {response.status}')
+        return time.perf_counter() - inicio
+
+    with ThreadPoolExecutor(max_workers=concurrencia) as executor:
+        # Calentamiento: una vuelta por ruta y conexión
+        list(executor.map(una, range(concurrencia * len(urls))))
+        inicio = time.perf_counter()
+        latencias = list(executor.map(una, range(peticiones)))
+        duracion = time.perf_counter() - inicio
+    return peticiones / duracion, latencias
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrencia', type=int, nargs='+', default=[1, 16, 64])
+    parser.add_argument('--peticiones', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=1, help='Procesos de cada servidor')
+    parser.add_argument('--threads', type=int, default=8, help='Hilos por proceso de gunicorn')
+    parser.add_argument('--expedientes', type=int, default=50)
+    parser.add_argument('--registros', type=int, default=40, help='Registros por expediente')
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--servidores', nargs='+', default=['wsgi', 'asgi-sync', 'asgi'], choices=['wsgi', 'asgi-sync', 'asgi'])
+    args = parser.parse_args()
+
+    usuario, hashtags, expedientes = poblar(args.expedientes, args.registros)
+    try:
+        urls = rutas(expedientes)
+        token = issue_access_token(usuario)
+        print("=" * 78)
+        print(f"LECTURAS CONCURRENTES: WSGI contra ASGI - {connection.vendor}, {args.workers} proceso(s)")
+        print("=" * 78)
+        print(f"  {'servidor':<10} {'concurrencia':>12} {'req/s':>10} {'p50':>10} {'p95':>10} {'p99':>10}")
+        for servidor in args.servidores:
+            proceso = lanzar(servidor, args.puerto, args.workers, args.threads)
+            try:
+                for concurrencia in args.concurrencia:
+                    throughput, latencias = cargar(args.puerto, urls, token, concurrencia, args.peticiones)
+                    cuantiles = statistics.quantiles(latencias, n=100)
+                    print(
+                        f"  {servidor:<10} {concurrencia:>12} {throughput:>10.1f} {cuantiles[49] * 1000:>8.1f}ms "
+                        f"{cuantiles[94] * 1000:>8.1f}ms {cuantiles[98] * 1000:>8.1f}ms"
+                    )
+            finally:
+                proceso.terminate()
+                proceso.wait(timeout=30)
+    finally:
+        limpiar(usuario, hashtags)
+        print("\n✓ Datos del benchmark eliminados")
+
+
+if __name__ == '__main__':
+    main()
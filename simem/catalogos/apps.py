@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CatalogosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'catalogos'
+
+    def ready(self):
+        from catalogos.cache import connect_signals
+        from catalogos.models import CatalogoHashTag
+
+        connect_signals(CatalogoHashTag)
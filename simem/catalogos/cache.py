@@ -0,0 +1,142 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+
+class HashTagCatalogSnapshot:
+    """
+    Copia en memoria del catálogo de hashtags, compartida por todo el proceso.
+    Cada escritura sobre CatalogoHashTag incrementa la versión y la siguiente
+    lectura recarga el catálogo con una sola consulta. Como la copia es por
+    proceso, además se recarga cuando supera HASHTAG_CATALOG_TTL segundos para
+    que los demás workers vean los cambios.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._by_id = {}
+        self._activos = []
+
+    @property
+    def ttl(self):
+        return getattr(settings, 'HASHTAG_CATALOG_TTL', 60)
+
+    def invalidate(self):
+        """Marca la copia actual como obsoleta"""
+        with self._lock:
+            self.version += 1
+
+    def _cached(self):
+        """(copia vigente, None) o (None, versión que se debe cargar)"""
+        with self._lock:
+            fresh = (
+                self._loaded_version == self.version
+                and time.monotonic() - self._loaded_at < self.ttl
+            )
+            if fresh:
+                self.hits += 1
+                return (self._by_id, self._activos), None
+            self.misses += 1
+            return None, self.version
+
+    def _store(self, version, hashtags):
+        by_id = {hashtag.pk: hashtag for hashtag in hashtags}
+        activos = [hashtag for hashtag in hashtags if hashtag.activo]
+
+        with self._lock:
+            # Si hubo una escritura mientras se cargaba, la copia se descarta en la siguiente lectura
+            self._by_id, self._activos = by_id, activos
+            self._loaded_version = version
+            self._loaded_at = time.monotonic()
+        return by_id, activos
+
+    def _snapshot(self):
+        snapshot, version = self._cached()
+        if snapshot is not None:
+            return snapshot
+        from catalogos.models import CatalogoHashTag
+        return self._store(version, list(CatalogoHashTag.all_with_inactive.order_by('descripcion')))
+
+    async def _asnapshot(self):
+        """_snapshot para las acciones de helpers.async_views (run_read)"""
+        snapshot, version = self._cached()
+        if snapshot is not None:
+            return snapshot
+        from catalogos.models import CatalogoHashTag
+        from helpers.async_views import aevaluate
+        return self._store(version, await aevaluate(CatalogoHashTag.all_with_inactive.order_by('descripcion')))
+
+    def get(self, hashtag_id):
+        """Retorna el hashtag (activo o no) o None si no está en la copia"""
+        by_id, _ = self._snapshot()
+        return by_id.get(hashtag_id)
+
+    def activos(self):
+        """Hashtags activos ordenados por descripción"""
+        _, activos = self._snapshot()
+        return activos
+
+    async def aactivos(self):
+        _, activos = await self._asnapshot()
+        return activos
+
+    def descripcion(self, hashtag_id):
+        hashtag = self.get(hashtag_id)
+        return hashtag.descripcion if hashtag else None
+
+    def missing_activos(self, hashtag_ids):
+        """
+        Retorna los ids que no corresponden a un hashtag activo.
+        Los ids que no están en la copia se verifican en la base de datos
+        (pueden haberse creado en otro proceso) y, si existen, se invalida la copia.
+        """
+        by_id, _ = self._snapshot()
+        unknown = [hashtag_id for hashtag_id in hashtag_ids if hashtag_id not in by_id]
+        missing = [
+            hashtag_id for hashtag_id in hashtag_ids
+            if hashtag_id in by_id and not by_id[hashtag_id].activo
+        ]
+        if unknown:
+            from catalogos.models import CatalogoHashTag
+            found = set(
+                CatalogoHashTag.objects.filter(pk__in=unknown).values_list('pk', flat=True)
+            )
+            if found:
+                self.invalidate()
+            missing.extend(hashtag_id for hashtag_id in unknown if hashtag_id not in found)
+        return sorted(missing)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'version': self.version,
+                'size': len(self._by_id),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / total, 4) if total else None,
+                'ttl': self.ttl,
+            }
+
+
+hashtag_catalog = HashTagCatalogSnapshot()
+
+
+def _invalidate(sender, **kwargs):
+    # Se invalida de inmediato (la misma petición ve el cambio) y de nuevo al
+    # confirmar, por si otro hilo recargó la copia antes del commit
+    hashtag_catalog.invalidate()
+    transaction.on_commit(hashtag_catalog.invalidate)
+
+
+def connect_signals(model):
+    post_save.connect(_invalidate, sender=model, dispatch_uid='hashtag_catalog_save')
+    post_delete.connect(_invalidate, sender=model, dispatch_uid='hashtag_catalog_delete')
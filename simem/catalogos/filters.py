@@ -5,7 +5,7 @@ from catalogos.models import CatalogoHashTag
 class CatalogoHashTagFilter(django_filters.FilterSet):
     """Filter para el modelo CatalogoHashTag"""
     id = django_filters.NumberFilter(field_name='id')
-    descripcion = django_filters.CharFilter(field_name='descripcion', lookup_expr='icontains')
+    descripcion = django_filters.CharFilter(field_name='descripcion', lookup_expr='trgm_icontains')
     activo = django_filters.BooleanFilter(field_name='activo')
     
     class Meta:
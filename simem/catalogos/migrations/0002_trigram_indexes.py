@@ -0,0 +1,14 @@
+from django.db import migrations
+
+from helpers.trigram import TrigramIndexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogos', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramIndexes('catalogo_hashtag', ['descripcion']),
+    ]
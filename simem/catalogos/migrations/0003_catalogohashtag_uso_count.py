@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogos', '0002_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalogohashtag',
+            name='uso_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
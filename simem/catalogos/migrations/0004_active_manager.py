@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:39
+
+import django.db.models.manager
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogos', '0003_catalogohashtag_uso_count'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='catalogohashtag',
+            options={'default_manager_name': 'all_with_inactive', 'verbose_name': 'Catálogo Hashtag', 'verbose_name_plural': 'Catálogos Hashtag'},
+        ),
+        migrations.AlterModelManagers(
+            name='catalogohashtag',
+            managers=[
+                ('all_with_inactive', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='catalogohashtag',
+            index=models.Index(condition=models.Q(('activo', True)), fields=['descripcion'], name='catalogo_hashtag_activo_idx'),
+        ),
+    ]
@@ -1,4 +1,10 @@
 from django.db import models
+from helpers.managers import ActiveManager
+
+
+# Columnas que solo cambian con UPDATE ... SET col = col + n (movilizaciones.counters);
+# un save() completo no debe reescribirlas con el valor (quizá viejo) de la instancia
+COUNTER_FIELDS = frozenset({'uso_count'})
 
 
 class CatalogoHashTag(models.Model):
@@ -6,13 +12,37 @@ class CatalogoHashTag(models.Model):
     id = models.AutoField(primary_key=True)
     descripcion = models.CharField(max_length=255)
     activo = models.BooleanField(default=True)
+    # Número de registros con este hashtag (movilizaciones.counters)
+    uso_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Solo activos; las inactivas con all_with_inactive (helpers.managers)
+    objects = ActiveManager()
+    all_with_inactive = models.Manager()
+
     class Meta:
         db_table = 'catalogo_hashtag'
         verbose_name = 'Catálogo Hashtag'
         verbose_name_plural = 'Catálogos Hashtag'
+        default_manager_name = 'all_with_inactive'
+        indexes = [
+            # Listado de hashtags activos (CatalogoHashTag.objects) ordenado por descripción
+            models.Index(
+                fields=['descripcion'],
+                name='catalogo_hashtag_activo_idx',
+                condition=models.Q(activo=True),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and not field.generated
+                and field.attname in self.__dict__ and field.attname not in COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.descripcion
@@ -1,15 +1,16 @@
 from rest_framework import serializers
 from catalogos.models import CatalogoHashTag
+from helpers.sparse import SparseFieldsetMixin
 
 
-class CatalogoHashTagSerializer(serializers.ModelSerializer):
+class CatalogoHashTagSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador completo para CatalogoHashTag"""
     class Meta:
         model = CatalogoHashTag
         fields = '__all__'
 
 
-class CatalogoHashTagListSerializer(serializers.ModelSerializer):
+class CatalogoHashTagListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador para listar hashtags"""
     created_at = serializers.DateTimeField(read_only=True)
 
@@ -19,12 +20,23 @@ class CatalogoHashTagListSerializer(serializers.ModelSerializer):
             'id',
             'descripcion',
             'activo',
+            'uso_count',
             'created_at',
             'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
 
 
+class CatalogoHashTagActivoSerializer(CatalogoHashTagListSerializer):
+    """
+    Hashtags de /activos/, servidos desde la copia en memoria del catálogo: sin
+    uso_count, que cambia con cada registro y no invalida la copia
+    """
+
+    class Meta(CatalogoHashTagListSerializer.Meta):
+        fields = [field for field in CatalogoHashTagListSerializer.Meta.fields if field != 'uso_count']
+
+
 class CatalogoHashTagCreateSerializer(serializers.ModelSerializer):
     """Serializador para crear hashtags"""
     class Meta:
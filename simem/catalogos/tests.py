@@ -0,0 +1,69 @@
+import json
+
+from django.core.cache import caches
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from catalogos.cache import hashtag_catalog
+from catalogos.models import CatalogoHashTag
+from movilizaciones import counters
+from usuarios.models import Usuarios
+
+
+class CatalogoHashTagTests(TestCase):
+    """Hashtags activos desde la copia en memoria, GET condicional y uso_count"""
+
+    def setUp(self):
+        caches['default'].clear()
+        hashtag_catalog.invalidate()
+        self.usuario = Usuarios.objects.create_user(
+            username='catalogo', password='clave', apellido_paterno='Pérez', apellido_materno='López'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.usuario)
+        self.hashtags = [CatalogoHashTag.objects.create(descripcion=f'tag{i}') for i in range(3)]
+
+    def activos(self, **headers):
+        return self.client.get('/api/v1/catalogos/hashtags/activos/', **headers)
+
+    def test_activos(self):
+        self.hashtags[2].activo = False
+        self.hashtags[2].save()
+        response = self.activos()
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(b''.join(response.streaming_content))['data']
+        self.assertEqual([item['descripcion'] for item in data], ['tag0', 'tag1'])
+        # uso_count no se sirve desde la copia en memoria
+        self.assertNotIn('uso_count', data[0])
+
+    def test_activos_304(self):
+        etag = self.activos()['ETag']
+        self.assertEqual(self.activos(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Los usos no cambian la respuesta de activos
+        counters.hashtags_enlazados([self.hashtags[0].pk])
+        self.assertEqual(self.activos(HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Un hashtag nuevo sí
+        CatalogoHashTag.objects.create(descripcion='tag3')
+        response = self.activos(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_actualizar_conserva_uso_count(self):
+        counters.hashtags_enlazados([self.hashtags[0].pk] * 3)
+        response = self.client.patch(
+            f'/api/v1/catalogos/hashtags/{self.hashtags[0].pk}/', {'descripcion': 'renombrado'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.client.delete(f'/api/v1/catalogos/hashtags/{self.hashtags[0].pk}/')
+        self.assertEqual(response.status_code, 200)
+        hashtag = CatalogoHashTag.all_with_inactive.get(pk=self.hashtags[0].pk)
+        self.assertEqual((hashtag.descripcion, hashtag.activo, hashtag.uso_count), ('renombrado', False, 3))
+
+    def test_listado_ordenado_por_uso(self):
+        counters.hashtags_enlazados([self.hashtags[1].pk] * 2 + [self.hashtags[2].pk])
+        response = self.client.get('/api/v1/catalogos/hashtags/?ordering=-uso_count&fields=descripcion,uso_count')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(item['descripcion'], item['uso_count']) for item in response.json()['data']['results']],
+            [('tag1', 2), ('tag2', 1), ('tag0', 0)],
+        )
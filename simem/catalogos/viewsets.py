@@ -1,8 +1,9 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
+from asgiref.sync import sync_to_async
 from django.db import transaction
 from django.core.exceptions import ObjectDoesNotExist
 
@@ -10,20 +11,34 @@ from catalogos.models import CatalogoHashTag
 from catalogos.serializers import (
     CatalogoHashTagSerializer,
     CatalogoHashTagListSerializer,
+    CatalogoHashTagActivoSerializer,
     CatalogoHashTagCreateSerializer,
     CatalogoHashTagUpdateSerializer,
 )
 from catalogos.filters import CatalogoHashTagFilter
-from helpers.exceptions import BadRequest, NotFound
+from catalogos.cache import hashtag_catalog
+from helpers.async_views import AsyncReadMixin
+from helpers.conditional import conditional_get, latest
+from helpers.exceptions import BadRequest, NotFound, PermissionDenied
+from helpers.managers import visible_manager
 from helpers.responses import (
     ok_response,
     created_response,
     no_content_response,
 )
 from helpers.errors import error
+from helpers.query_plans import QueryPlanMixin
+from helpers.streaming import iter_serialized, ok_streaming_response
+from helpers.trigram import TrigramSearchFilter
 
 
-class CatalogoHashTagViewSet(viewsets.ModelViewSet):
+def activos_validators(view, request):
+    """Validadores de activos calculados sobre la copia en memoria (sin consultas)"""
+    activos = hashtag_catalog.activos()
+    return latest(*(hashtag.updated_at for hashtag in activos)), len(activos)
+
+
+class CatalogoHashTagViewSet(AsyncReadMixin, QueryPlanMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar catálogos de hashtags.
     Permite CRUD completo sobre los hashtags disponibles.
@@ -31,11 +46,14 @@ class CatalogoHashTagViewSet(viewsets.ModelViewSet):
     queryset = CatalogoHashTag.objects.all()
     serializer_class = CatalogoHashTagSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter, OrderingFilter]
     filterset_class = CatalogoHashTagFilter
     search_fields = ['descripcion']
-    ordering_fields = ['descripcion', 'created_at']
+    ordering_fields = ['descripcion', 'created_at', 'uso_count']
     ordering = ['descripcion']
+    async_actions = ('list', 'retrieve', 'activos')
+    # Sin plan: QueryPlanMixin solo reduce las columnas con ?fields= / ?exclude=
+    query_plans = {}
 
     def get_serializer_class(self):
         """Retorna el serializador según la acción"""
@@ -50,11 +68,9 @@ class CatalogoHashTagViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Filtra hashtags según el estado activo"""
-        queryset = CatalogoHashTag.objects.all()
         # Si no es superuser, solo ve hashtags activos
-        if not self.request.user.is_superuser:
-            queryset = queryset.filter(activo=True)
-        return queryset
+        queryset = visible_manager(CatalogoHashTag, self.request.user).all()
+        return self.apply_query_plan(queryset)
 
     def get_object(self):
         """Obtiene un objeto con manejo de excepciones"""
@@ -67,17 +83,23 @@ class CatalogoHashTagViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         """Lista hashtags con paginación"""
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_list_queryset()
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return ok_response(data=self.get_paginated_response(serializer.data).data)
-        serializer = self.get_serializer(queryset, many=True)
-        return ok_response(data=serializer.data)
+            return self.list_response(page, paginated=True)
+        return self.list_response(queryset)
+
+    def list_response(self, objects, paginated=False):
+        data = self.get_serializer(objects, many=True).data
+        if paginated:
+            data = self.get_paginated_response(data).data
+        return ok_response(data=data)
 
     def retrieve(self, request, pk=None):
         """Obtiene un hashtag específico"""
-        instance = self.get_object()
+        return self.retrieve_response(self.get_object())
+
+    def retrieve_response(self, instance):
         if not instance:
             raise NotFound()
         serializer = self.get_serializer(instance)
@@ -119,12 +141,29 @@ class CatalogoHashTagViewSet(viewsets.ModelViewSet):
         if not instance:
             raise NotFound()
         instance.activo = False
-        instance.save()
+        instance.save(update_fields=['activo', 'updated_at'])
         return ok_response(data=None, message='Hashtag desactivado correctamente')
 
     @action(detail=False, methods=['get'])
+    @conditional_get(activos_validators)
     def activos(self, request):
-        """Obtiene solo hashtags activos"""
-        hashtags_activos = CatalogoHashTag.objects.filter(activo=True).order_by('descripcion')
-        serializer = CatalogoHashTagListSerializer(hashtags_activos, many=True)
-        return ok_response(data=serializer.data)
+        """Obtiene solo hashtags activos (desde la copia en memoria del catálogo)"""
+        return ok_streaming_response(request, self.activos_rows(hashtag_catalog.activos()))
+
+    @conditional_get(activos_validators)
+    async def aactivos(self, request):
+        rows = self.activos_rows(await hashtag_catalog.aactivos())
+        return await sync_to_async(ok_streaming_response)(request, rows, asynchronous=True)
+
+    def activos_rows(self, activos):
+        context = self.get_serializer_context()
+        return iter_serialized(
+            activos, lambda chunk: CatalogoHashTagActivoSerializer(chunk, many=True, context=context).data
+        )
+
+    @action(detail=False, methods=['get'])
+    def cache(self, request):
+        """Estadísticas de la copia en memoria del catálogo (solo superusuarios)"""
+        if not request.user.is_superuser:
+            raise PermissionDenied()
+        return ok_response(data=hashtag_catalog.stats())
@@ -0,0 +1,155 @@
+"""
+Acciones de lectura async para ASGI (API_ASYNC_READS, activado por simem/asgi.py).
+
+DRF solo despacha vistas síncronas, así que AsyncReadMixin.as_view entrega una
+vista async: las acciones de async_actions (GET/HEAD) se despachan con
+async_dispatch y buscan el método a<acción> (alist, aretrieve, aregistros...);
+el resto de las acciones corre igual que Django corre cualquier vista síncrona
+bajo ASGI (sync_to_async).
+
+En Django 5.2 el ORM async (acount(), aget(), async for) solo envuelve el ORM
+síncrono en sync_to_async(thread_sensitive=True): todas esas consultas corren en
+un único hilo compartido por proceso, una detrás de otra. Por eso las lecturas
+principales (COUNT(*), la página con sus prefetch_related, el objeto del detalle)
+pasan por run_read(), que usa thread_sensitive=False: cada lectura corre en un
+hilo del executor por defecto del event loop con su propia conexión, y varias
+peticiones pueden tener consultas en curso a la vez. Límites:
+- Las lecturas en paralelo están acotadas por los hilos del executor
+  (min(32, CPUs + 4)); cada hilo mantiene una conexión si CONN_MAX_AGE > 0,
+  con CONN_MAX_AGE = 0 se abre una conexión por lectura.
+- Autenticación y permisos (initial), los validadores de conditional_get y la
+  serialización (list_response / retrieve_response, compartidas con las
+  acciones síncronas) siguen en el hilo compartido (sync_to_async): con los
+  tokens firmados o en caché y la copia del catálogo casi no consultan.
+- El streaming sin paginar (helpers.streaming) itera un cursor del servidor que
+  debe quedarse en una conexión: sus bloques también van al hilo compartido.
+"""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import close_old_connections
+from django.utils.decorators import classonlymethod
+from django.views.decorators.csrf import csrf_exempt
+
+
+def _read(func, *args, **kwargs):
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # El hilo del executor no recibe request_finished: aplica CONN_MAX_AGE aquí
+        close_old_connections()
+
+
+async def run_read(func, *args, **kwargs):
+    """Ejecuta una lectura del ORM fuera del hilo compartido, con la conexión de su hilo"""
+    return await sync_to_async(_read, thread_sensitive=False)(func, *args, **kwargs)
+
+
+async def aevaluate(queryset):
+    """Lista de objetos del queryset (incluidos sus prefetch_related) con run_read"""
+    return await run_read(list, queryset)
+
+
+class ThreadedViewMixin:
+    """
+    Vistas completas fuera del hilo compartido bajo ASGI (API_ASYNC_READS): el login
+    verifica la contraseña con PBKDF2 (cientos de ms de CPU) y en el hilo compartido
+    detendría a todas las vistas síncronas del proceso. La vista corre con run_read
+    en un hilo del executor; sus escrituras (token, last_login) son sentencias
+    sueltas en autocommit y no necesitan el hilo compartido.
+    """
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        if not getattr(settings, 'API_ASYNC_READS', False):
+            return view
+
+        async def async_view(request, *args, **kwargs):
+            return await run_read(view, request, *args, **kwargs)
+
+        async_view.cls = cls
+        async_view.initkwargs = initkwargs
+        return csrf_exempt(async_view)
+
+
+class AsyncReadMixin:
+    """
+    ViewSets con variantes async de sus acciones de lectura.
+    Las acciones list y retrieve genéricas usan get_list_queryset, list_response
+    y retrieve_response, que el ViewSet comparte con sus acciones síncronas.
+    """
+    async_actions = ('list', 'retrieve')
+
+    @classonlymethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        if not getattr(settings, 'API_ASYNC_READS', False):
+            return view
+        if not any(action in cls.async_actions for action in actions.values()):
+            return view
+        if 'get' in actions and 'head' not in actions:
+            actions['head'] = actions['get']
+        sync_view = sync_to_async(view)
+
+        async def async_view(request, *args, **kwargs):
+            if actions.get(request.method.lower()) not in cls.async_actions:
+                return await sync_view(request, *args, **kwargs)
+            self = cls(**initkwargs)
+            self.action_map = actions
+            for method, action in actions.items():
+                setattr(self, method, getattr(self, action))
+            self.request = request
+            self.args = args
+            self.kwargs = kwargs
+            return await self.async_dispatch(request, *args, **kwargs)
+
+        async_view.cls = cls
+        async_view.initkwargs = initkwargs
+        async_view.actions = actions
+        return csrf_exempt(async_view)
+
+    async def async_dispatch(self, request, *args, **kwargs):
+        """APIView.dispatch para un handler async"""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            handler = getattr(self, f'a{self.action}')
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def apaginate_queryset(self, queryset):
+        """paginate_queryset con el ORM async"""
+        if self.paginator is None:
+            return None
+        return await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+
+    async def aget_object(self):
+        """get_object de los ViewSets del proyecto: None si no existe o no es visible"""
+        try:
+            obj = await run_read(self.get_queryset().get, pk=self.kwargs.get('pk'))
+        except ObjectDoesNotExist:
+            return None
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    def get_list_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    async def alist(self, request, *args, **kwargs):
+        queryset = self.get_list_queryset()
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return await sync_to_async(self.list_response)(page, paginated=True)
+        return await sync_to_async(self.list_response)(await aevaluate(queryset))
+
+    async def aretrieve(self, request, *args, **kwargs):
+        instance = await self.aget_object()
+        return await sync_to_async(self.retrieve_response)(instance)
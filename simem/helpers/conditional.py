@@ -0,0 +1,90 @@
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(request, parts):
+    """
+    ETag débil a partir de los validadores y de lo que cambia la representación
+    (ruta con parámetros y formato negociado).
+    """
+    key = '|'.join([
+        request.get_full_path(),
+        getattr(request, 'accepted_media_type', '') or '',
+        *(str(part) for part in parts),
+    ])
+    return f'W/"{hashlib.sha1(key.encode("utf-8")).hexdigest()}"'
+
+
+def _preconditions(request, result):
+    """Encabezados de los validadores y la respuesta 304/412, o None si hay que ejecutar la acción"""
+    last_modified, *parts = result
+    etag = make_etag(request, [last_modified, *parts])
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    headers = {'ETag': etag}
+    if timestamp is not None:
+        headers['Last-Modified'] = http_date(timestamp)
+
+    conditional = get_conditional_response(request._request, etag=etag, last_modified=timestamp)
+    if conditional is not None:
+        # 304 Not Modified (o 412 si falla If-Match / If-Unmodified-Since)
+        return headers, Response(status=conditional.status_code, headers=headers)
+    return headers, None
+
+
+def conditional_get(validators):
+    """
+    Decorador para acciones GET que responde 304 Not Modified sin serializar.
+    validators(view, request, *args, **kwargs) debe retornar (last_modified, *partes)
+    con consultas baratas (MAX(updated_at), COUNT(*), ...) o None si el objeto no
+    existe, en cuyo caso se ejecuta la acción normalmente.
+    También decora acciones async (helpers.async_views); los validadores se
+    ejecutan entonces con sync_to_async.
+    """
+    def decorator(method):
+        if iscoroutinefunction(method):
+            @wraps(method)
+            async def async_wrapper(view, request, *args, **kwargs):
+                result = await sync_to_async(validators)(view, request, *args, **kwargs)
+                if result is None:
+                    return await method(view, request, *args, **kwargs)
+                headers, response = _preconditions(request, result)
+                if response is None:
+                    response = await method(view, request, *args, **kwargs)
+                    if response.status_code != status.HTTP_200_OK:
+                        return response
+                    for header, value in headers.items():
+                        response[header] = value
+                # Los datos dependen del usuario: solo caché privada y siempre revalidar
+                patch_cache_control(response, private=True, no_cache=True)
+                return response
+            return async_wrapper
+
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            result = validators(view, request, *args, **kwargs)
+            if result is None:
+                return method(view, request, *args, **kwargs)
+            headers, response = _preconditions(request, result)
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                for header, value in headers.items():
+                    response[header] = value
+            # Los datos dependen del usuario: solo caché privada y siempre revalidar
+            patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
+
+
+def latest(*values):
+    """Mayor de varias fechas ignorando None"""
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
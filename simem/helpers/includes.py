@@ -0,0 +1,148 @@
+"""
+Recursos relacionados embebidos con ?include=registros,registros.hashtags,usuario.
+
+El árbol de includes se convierte en un número fijo de consultas: las relaciones
+a uno se resuelven con select_related en la consulta principal y cada relación a
+muchos con un solo Prefetch por nivel, sin importar cuántos padres haya.
+
+Cada ViewSet declara sus includes:
+
+    include_options = {
+        'usuario': {'select_related': 'usuarios_id', 'related': [...], 'serializer': ...},
+        'registros': {
+            'prefetch': 'registros',
+            'queryset': lambda request: visible_manager(Registro, request.user).order_by('-created_at', '-id'),
+            'serializer': ...,
+            'includes': {'hashtags': {...}},
+        },
+    }
+
+'related' son relaciones adicionales (bajo select_related) que lee el serializador.
+'queryset' puede ser una función del request, para los hijos que dependen del
+usuario (helpers.managers.visible_manager).
+Una relación a muchos embebe a lo sumo INCLUDE_MAX_CHILDREN hijos por padre
+(LIMIT por padre con ROW_NUMBER() en la misma consulta); si hay más, se agrega
+'<nombre>_truncado': true. ?fields= / ?exclude= solo aplican al recurso principal.
+"""
+from django.conf import settings
+from django.db.models import Prefetch
+
+from helpers.exceptions import BadRequest
+
+INCLUDE_PARAM = 'include'
+
+
+def _max_children():
+    return getattr(settings, 'INCLUDE_MAX_CHILDREN', 50)
+
+
+def _attr(name):
+    return f'_include_{name}'
+
+
+def parse_includes(request, options):
+    """Árbol {nombre: {hijo: {...}}} pedido en ?include="""
+    value = request.query_params.get(INCLUDE_PARAM) if request is not None else None
+    tree = {}
+    if not value:
+        return tree
+    unknown = []
+    for path in filter(None, (item.strip() for item in value.split(','))):
+        node, available = tree, options
+        for name in path.split('.'):
+            if name not in available:
+                unknown.append(path)
+                break
+            node = node.setdefault(name, {})
+            available = available[name].get('includes', {})
+    if unknown:
+        raise BadRequest({'include': f"Relaciones desconocidas: {', '.join(unknown)}"})
+    return tree
+
+
+def include_queryset(queryset, tree, options, request=None, prefix=''):
+    """Agrega al queryset los select_related y Prefetch del árbol de includes"""
+    for name, children in tree.items():
+        spec = options[name]
+        nested = spec.get('includes', {})
+        if 'select_related' in spec:
+            lookup = prefix + spec['select_related']
+            queryset = queryset.select_related(lookup, *(f'{lookup}__{related}' for related in spec.get('related', [])))
+            queryset = include_queryset(queryset, children, nested, request, lookup + '__')
+        else:
+            # Se pide un hijo de más para saber si la lista quedó truncada
+            children_queryset = spec['queryset'](request) if callable(spec['queryset']) else spec['queryset'].all()
+            children_queryset = include_queryset(children_queryset, children, nested, request)
+            queryset = queryset.prefetch_related(Prefetch(
+                prefix + spec['prefetch'],
+                queryset=children_queryset[:_max_children() + 1],
+                to_attr=_attr(name),
+            ))
+    return queryset
+
+
+def render_includes(instances, data, tree, options, context):
+    """Agrega a cada representación (data[i] de instances[i]) sus relaciones embebidas"""
+    if not tree:
+        return data
+    limit = _max_children()
+    for name, children in tree.items():
+        spec = options[name]
+        nested = spec.get('includes', {})
+        if 'select_related' in spec:
+            related = [getattr(instance, spec['select_related']) for instance in instances]
+            present = [obj for obj in related if obj is not None]
+            rendered = iter(_serialize(present, spec['serializer'], children, nested, context))
+            for item, obj in zip(data, related):
+                item[name] = next(rendered) if obj is not None else None
+        else:
+            groups = [getattr(instance, _attr(name)) for instance in instances]
+            flat = [obj for group in groups for obj in group[:limit]]
+            rendered = iter(_serialize(flat, spec['serializer'], children, nested, context))
+            for item, group in zip(data, groups):
+                item[name] = [next(rendered) for _ in group[:limit]]
+                item[f'{name}_truncado'] = len(group) > limit
+    return data
+
+
+def _serialize(objects, serializer_class, tree, options, context):
+    # Sin request en el contexto: ?fields= no aplica a los recursos embebidos
+    context = {key: value for key, value in context.items() if key != 'request'}
+    data = [dict(item) for item in serializer_class(objects, many=True, context=context).data]
+    return render_includes(objects, data, tree, options, context)
+
+
+class IncludeMixin:
+    """ViewSets con ?include= en las acciones de include_actions"""
+    include_options = {}
+    include_actions = ('list', 'retrieve')
+
+    def get_include_tree(self):
+        if self.action not in self.include_actions:
+            return {}
+        if not hasattr(self, '_include_tree'):
+            self._include_tree = parse_includes(self.request, self.include_options)
+        return self._include_tree
+
+    def apply_includes(self, queryset):
+        tree = self.get_include_tree()
+        if not tree:
+            return queryset
+        names, defer = queryset.query.deferred_loading
+        if names and not defer:
+            # Con .only() (?fields=) las FK de los includes deben cargarse para poder seguirlas
+            foreign_keys = [
+                self.include_options[name]['select_related'] for name in tree
+                if 'select_related' in self.include_options[name]
+            ]
+            queryset = queryset.only(*names, *foreign_keys)
+        return include_queryset(queryset, tree, self.include_options, self.request)
+
+    def include_data(self, instances, data):
+        """Embebe las relaciones pedidas en la representación de instances"""
+        if not self.get_include_tree():
+            return data
+        data = [dict(item) for item in data]
+        return render_includes(
+            list(instances), data, self.get_include_tree(), self.include_options, self.get_serializer_context()
+        )
@@ -0,0 +1,25 @@
+"""
+Managers de los modelos con borrado lógico (campo activo).
+
+- objects (ActiveManager): solo filas activas. Es lo que usan las lecturas de la
+  API y coincide con los índices parciales WHERE activo de cada modelo.
+- all_with_inactive: todas las filas. Es el manager por defecto de Django
+  (Meta.default_manager_name), así el admin, las relaciones inversas
+  (expediente.registros), los campos relacionados de los serializadores y
+  dumpdata siguen viendo las inactivas.
+
+Las vistas eligen con visible_manager(): los superusers ven también las inactivas.
+"""
+from django.db import models
+
+
+class ActiveManager(models.Manager):
+    """Manager que solo retorna filas con activo=True"""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(activo=True)
+
+
+def visible_manager(model, user):
+    """all_with_inactive para superusers, objects (solo activos) para los demás"""
+    return model.all_with_inactive if user.is_superuser else model.objects
@@ -0,0 +1,77 @@
+"""
+MessagePack (application/msgpack) para clientes móviles: mismo contenido que el
+JSON (envelopes de helpers.responses y errores de helpers.exceptions) en un
+formato binario más pequeño y más barato de decodificar.
+
+Dependencia opcional: sin el paquete msgpack los settings no registran estas
+clases (API_MSGPACK) y la API responde solo JSON.
+
+Fechas y horas: los serializadores ya entregan fecha, hora, created_at, ... como
+cadenas ISO 8601 (igual que en JSON), que se empaquetan sin pasar por Python.
+Los datetime con zona horaria que llegan sin serializar (respuestas armadas
+desde values()) se empaquetan como Timestamp (extensión -1 de MessagePack); date,
+time y los datetime sin zona como cadenas ISO. El parser convierte los Timestamp
+recibidos en datetime en UTC, que DateTimeField acepta directamente.
+"""
+import datetime
+import decimal
+import uuid
+
+from django.utils.functional import Promise
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+
+try:
+    import msgpack
+except ImportError:  # dependencia opcional
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+
+
+def _default(value):
+    """Tipos que msgpack no conoce; se llama solo para esos valores"""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            return msgpack.Timestamp.from_datetime(value)
+        return value.isoformat()
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID, Promise)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f'No se puede empaquetar {type(value).__name__} en MessagePack')
+
+
+def packb(data):
+    return msgpack.packb(data, default=_default, use_bin_type=True)
+
+
+def unpackb(content):
+    return msgpack.unpackb(content, raw=False, timestamp=3)
+
+
+class MessagePackRenderer(BaseRenderer):
+    media_type = MSGPACK_MEDIA_TYPE
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return packb(data)
+
+
+class MessagePackParser(BaseParser):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if stream is None:
+            return {}
+        try:
+            return unpackb(stream.read())
+        except (ValueError, TypeError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack inválido - {exc or type(exc).__name__}')
@@ -0,0 +1,174 @@
+import base64
+import binascii
+
+from django.core.paginator import InvalidPage
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from helpers.async_views import aevaluate, run_read
+from helpers.exceptions import BadRequest
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginación por cursor (keyset) ordenada por (-created_at, -id).
+
+    En lugar de OFFSET n + COUNT(*), cada página filtra a partir de la posición
+    (created_at, id) del último elemento entregado, por lo que su costo no
+    depende de qué tan profundo se haya desplazado el cliente.
+    Se activa con ?paginacion=cursor y continúa con el parámetro ?cursor=.
+    """
+    cursor_query_param = 'cursor'
+    mode_query_param = 'paginacion'
+    mode_value = 'cursor'
+    page_query_param = 'page'
+    ordering_field = 'created_at'
+    page_size = api_settings.PAGE_SIZE
+
+    @classmethod
+    def is_requested(cls, request):
+        """Indica si el cliente pidió la paginación por cursor"""
+        params = request.query_params
+        return cls.cursor_query_param in params or params.get(cls.mode_query_param) == cls.mode_value
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.page_queryset(queryset, request)
+        return self.set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self.page_queryset(queryset, request)
+        return self.set_page(await aevaluate(queryset))
+
+    def page_queryset(self, queryset, request):
+        """Queryset de la página pedida, con un elemento de más para saber si hay otra"""
+        self.request = request
+        self.base_url = remove_query_param(request.build_absolute_uri(), self.page_query_param)
+        position, reverse = self.decode_cursor(request)
+        self.position, self.reverse = position, reverse
+        field = self.ordering_field
+
+        if reverse:
+            queryset = queryset.order_by(field, 'pk')
+        else:
+            queryset = queryset.order_by(f'-{field}', '-pk')
+
+        if position is not None:
+            value, pk = position
+            # created_at <= v AND (created_at < v OR id < pk): la primera condición
+            # permite un rango sobre el índice (created_at, id)
+            if reverse:
+                queryset = queryset.filter(**{f'{field}__gte': value}).filter(
+                    Q(**{f'{field}__gt': value}) | Q(pk__gt=pk)
+                )
+            else:
+                queryset = queryset.filter(**{f'{field}__lte': value}).filter(
+                    Q(**{f'{field}__lt': value}) | Q(pk__lt=pk)
+                )
+
+        return queryset[:self.page_size + 1]
+
+    def set_page(self, rows):
+        position, reverse = self.position, self.reverse
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_previous = has_more
+            self.has_next = position is not None
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse):
+        """Codifica la posición (created_at, id) de un objeto en la URL"""
+        value = getattr(instance, self.ordering_field)
+        raw = f"{'r' if reverse else 'n'}|{value.isoformat()}|{instance.pk}"
+        cursor = base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request):
+        """Retorna ((created_at, id), reverse) o (None, False) para la primera página"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8')
+            direction, value, pk = raw.split('|')
+            value = parse_datetime(value)
+            pk = int(pk)
+        except (binascii.Error, UnicodeError, ValueError):
+            raise BadRequest({'cursor': 'Cursor inválido'})
+        if value is None or direction not in ('n', 'r'):
+            raise BadRequest({'cursor': 'Cursor inválido'})
+        return (value, pk), direction == 'r'
+
+
+class PageNumberPagination(pagination.PageNumberPagination):
+    """PageNumberPagination de DRF con una variante async (helpers.async_views.run_read)"""
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        paginator = self.django_paginator_class(queryset, page_size)
+        # Con el total asignado el Paginator ya no consulta
+        paginator.count = await run_read(queryset.count)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+        self.request = request
+        self.page.object_list = await aevaluate(self.page.object_list)
+        return list(self.page)
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin para ViewSets que ofrecen paginación por cursor como opción.
+    Las acciones listadas en keyset_actions usan KeysetPagination cuando
+    el cliente la solicita; el resto sigue con la paginación por defecto.
+    """
+    keyset_pagination_class = KeysetPagination
+    keyset_actions = ['list']
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.action in self.keyset_actions and self.keyset_pagination_class.is_requested(self.request):
+                self._paginator = self.keyset_pagination_class()
+            else:
+                return super().paginator
+        return self._paginator
@@ -0,0 +1,33 @@
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parser para JSON delimitado por saltos de línea (application/x-ndjson).
+    Retorna un generador que lee el cuerpo línea por línea, de modo que la
+    vista puede procesar cargas grandes sin tenerlas completas en memoria.
+    Las líneas con JSON inválido se entregan como instancias de ParseError
+    para que la vista pueda reportarlas por elemento.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if stream is None:
+            return iter(())
+        return self._rows(stream, encoding)
+
+    def _rows(self, stream, encoding):
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line.decode(encoding))
+            except (ValueError, UnicodeDecodeError) as exc:
+                yield ParseError(f'Línea {line_number}: JSON inválido - {exc}')
@@ -0,0 +1,143 @@
+"""
+Serialización de solo lectura a partir de .values_list(), sin instancias de
+modelo ni el recorrido campo por campo de DRF.
+
+La proyección se compila desde un ModelSerializer (con los campos que dejó
+?fields= / ?exclude=): cada campo simple se traduce a (clave, índice de columna,
+conversión). Los textos, enteros, booleanos y llaves foráneas se copian tal
+cual; fechas y horas usan el to_representation del propio campo, así la salida
+es idéntica a la del serializador (la zona horaria de los DateTimeField se
+resuelve una vez por página y no por valor). Los campos anidados o SerializerMethodField
+los resuelve la subclase con métodos get_<clave>(rows) que reciben la página
+completa (una consulta por página, no por fila).
+"""
+import copy
+
+from django.conf import settings
+from rest_framework import serializers
+
+# Conversiones que no cambian el valor que entrega la base de datos
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.RelatedField,
+)
+# Anotaciones que agrega helpers.search.SearchResultSerializerMixin
+SEARCH_ANNOTATIONS = ('search_rank', 'search_highlight')
+
+
+class ProjectionSerializer:
+    """
+    Subclases: serializer_class y computed_fields = {clave: [columnas que lee]}
+    con un método get_<clave>(rows) por cada una.
+    """
+    serializer_class = None
+    computed_fields = {}
+
+    def __init__(self, context=None):
+        serializer = self.serializer_class(context=context or {})
+        self.context = serializer.context
+        self.model = serializer.Meta.model
+        self.columns = ['pk']
+        self.plan = []
+        for key, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if key in self.computed_fields:
+                for column in self.computed_fields[key]:
+                    self.column_index(column)
+                self.plan.append((key, None, None, None))
+                continue
+            column, relation = self._column(field)
+            self.plan.append((
+                key,
+                self.column_index(column),
+                None if isinstance(field, IDENTITY_FIELDS) else field,
+                None if relation is None else self.column_index(relation),
+            ))
+
+    def column_index(self, column):
+        if column not in self.columns:
+            self.columns.append(column)
+        return self.columns.index(column)
+
+    def _column(self, field):
+        """Columna de values_list para un campo y, si pasa por una FK nula, la columna de esa FK"""
+        attrs = field.source_attrs
+        model_field = self.model._meta.get_field(attrs[0])
+        if len(attrs) == 1:
+            return model_field.attname, None
+        # DRF omite el campo cuando la relación es None (SkipField)
+        return '__'.join(attrs), model_field.attname if model_field.null else None
+
+    @staticmethod
+    def _converter(field):
+        if field is None:
+            return None
+        if isinstance(field, serializers.DateTimeField) and not hasattr(field, 'timezone'):
+            # enforce_timezone consulta la zona actual en cada valor; se fija para la página
+            field = copy.copy(field)
+            field.timezone = field.default_timezone()
+        return field.to_representation
+
+    def queryset(self, queryset):
+        """Queryset de tuplas con nombre (row.pk y las columnas de orden quedan disponibles)"""
+        self.annotations = [
+            (name, self.column_index(name)) for name in SEARCH_ANNOTATIONS if name in queryset.query.annotations
+        ]
+        for name in queryset.query.order_by:
+            if isinstance(name, str) and '__' not in name and name.lstrip('-') != 'pk':
+                self.column_index(name.lstrip('-'))
+        return queryset.prefetch_related(None).values_list(*self.columns, named=True)
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        computed = {
+            key: getattr(self, f'get_{key}')(rows) for key, index, _, _ in self.plan if index is None
+        }
+        plan = [(key, index, self._converter(field), relation) for key, index, field, relation in self.plan]
+        annotations = getattr(self, 'annotations', [])
+        data = []
+        for position, row in enumerate(rows):
+            item = {}
+            for key, index, convert, relation in plan:
+                if index is None:
+                    item[key] = computed[key][position]
+                    continue
+                if relation is not None and row[relation] is None:
+                    continue
+                value = row[index]
+                item[key] = value if convert is None or value is None else convert(value)
+            for name, index in annotations:
+                item[name] = row[index]
+            data.append(item)
+        return data
+
+
+class ProjectionMixin:
+    """
+    ViewSets que sirven la acción list con projection_class (API_LIST_PROJECTIONS).
+    Con ?include= se usa el serializador normal, que trabaja sobre instancias.
+    """
+    projection_class = None
+
+    def get_projection(self):
+        """Proyección de la petición (la misma para el queryset y la representación)"""
+        if not hasattr(self, '_projection'):
+            self._projection = self._build_projection()
+        return self._projection
+
+    def _build_projection(self):
+        if self.action != 'list' or self.projection_class is None:
+            return None
+        if not getattr(settings, 'API_LIST_PROJECTIONS', True):
+            return None
+        if hasattr(self, 'get_include_tree') and self.get_include_tree():
+            return None
+        return self.projection_class(self.get_serializer_context())
+
+    def serialize_list(self, objects, projection):
+        if projection is not None:
+            return projection.to_representation(objects)
+        return self.get_serializer(objects, many=True).data
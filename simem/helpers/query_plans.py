@@ -0,0 +1,78 @@
+from helpers.sparse import SparseFieldsetMixin, field_paths, is_requested
+
+
+def apply_query_plan(queryset, plan):
+    """Aplica un plan de consulta (select_related / prefetch_related / annotate) a un queryset"""
+    if not plan:
+        return queryset
+    if plan.get('select_related'):
+        queryset = queryset.select_related(*plan['select_related'])
+    if plan.get('prefetch_related'):
+        queryset = queryset.prefetch_related(*plan['prefetch_related'])
+    if plan.get('annotate'):
+        queryset = queryset.annotate(**plan['annotate'])
+    return queryset
+
+
+def _needed(lookup, relations):
+    """Indica si alguna relación usada por los campos pedidos pasa por lookup"""
+    lookup = getattr(lookup, 'prefetch_to', lookup)
+    return any(
+        lookup == relation or lookup.startswith(relation + '__') or relation.startswith(lookup + '__')
+        for relation in relations
+    )
+
+
+def sparse_query_plan(queryset, plan, serializer_class, request):
+    """
+    Aplica el plan reducido a los campos pedidos con ?fields= / ?exclude= y
+    carga solo sus columnas (más las del orden del queryset) con .only().
+    """
+    paths = field_paths(serializer_class, request)
+    if paths is None:
+        return apply_query_plan(queryset, plan)
+    only, relations = paths
+    plan = plan or {}
+    queryset = apply_query_plan(queryset, {
+        'select_related': [lookup for lookup in plan.get('select_related', []) if _needed(lookup, relations)],
+        'prefetch_related': [lookup for lookup in plan.get('prefetch_related', []) if _needed(lookup, relations)],
+        'annotate': {name: value for name, value in plan.get('annotate', {}).items() if name in relations},
+    })
+    model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+    ordering = {
+        name.lstrip('-') for name in queryset.query.order_by
+        if isinstance(name, str) and name.lstrip('-') in model_fields
+    }
+    return queryset.only(*only, *ordering)
+
+
+class QueryPlanMixin:
+    """
+    Mixin para ViewSets que declaran un plan de consulta por acción.
+
+    query_plans = {
+        'list': {
+            'select_related': [...],
+            'prefetch_related': [...],
+            'annotate': {...},
+        },
+    }
+
+    Con ?fields= / ?exclude= el plan se reduce a lo que usan los campos pedidos
+    del serializador (ver helpers.sparse).
+    """
+    query_plans = {}
+
+    def get_query_plan(self):
+        """Retorna el plan de la acción actual o None"""
+        return self.query_plans.get(self.action)
+
+    def apply_query_plan(self, queryset, plan=None, serializer_class=None):
+        """Aplica al queryset el plan de la acción actual (o el indicado)"""
+        if plan is None:
+            plan = self.get_query_plan()
+        if serializer_class is None:
+            serializer_class = self.get_serializer_class()
+        if is_requested(self.request) and issubclass(serializer_class, SparseFieldsetMixin):
+            return sparse_query_plan(queryset, plan, serializer_class, self.request)
+        return apply_query_plan(queryset, plan)
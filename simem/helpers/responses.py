@@ -51,4 +51,9 @@ def bad_request_response(
     data,
     error="petición mala",
     message="Ha ocurrido un error, valida los campos",
-): return Response({"error": error, "message": message, "data": data, "code": 400}, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+): return Response({"error": error, "message": message, "data": data, "code": 400}, status=status.HTTP_400_BAD_REQUEST)
+
+def accepted_response(
+    data,
+    message="Petición aceptada, se procesará en segundo plano",
+): return Response({"message": message, "data": data, "code": 202}, status.HTTP_202_ACCEPTED)
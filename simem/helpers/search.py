@@ -0,0 +1,222 @@
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import BooleanField, CharField, FloatField
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import import_string
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+
+# Documentos indexados por modelo: {modelo: {'fields': [(campo, peso)], 'highlight': campo}}
+SEARCH_DOCUMENTS = {}
+
+_backend = None
+
+
+def get_search_backend():
+    """
+    Retorna el backend de búsqueda configurado en settings.SEARCH_BACKEND
+    o el que corresponde al motor de base de datos.
+    """
+    global _backend
+    if _backend is None:
+        path = getattr(settings, 'SEARCH_BACKEND', None)
+        if path:
+            _backend = import_string(path)()
+        elif connection.vendor == 'postgresql':
+            _backend = PostgresSearchBackend()
+        else:
+            _backend = SQLiteSearchBackend()
+    return _backend
+
+
+def register(model, fields, highlight=None):
+    """
+    Registra un modelo para búsqueda de texto completo y mantiene su índice
+    actualizado de forma incremental al guardar y eliminar.
+    fields: lista de (campo, peso) con peso 'A'..'D'.
+    """
+    SEARCH_DOCUMENTS[model] = {
+        'fields': list(fields),
+        'highlight': highlight or fields[0][0],
+    }
+    post_save.connect(_update_on_save, sender=model, dispatch_uid=f'search_save_{model._meta.label}')
+    if get_search_backend().tracks_deletes:
+        post_delete.connect(_remove_on_delete, sender=model, dispatch_uid=f'search_delete_{model._meta.label}')
+
+
+def _update_on_save(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None:
+        document_fields = {name for name, _ in SEARCH_DOCUMENTS[sender]['fields']}
+        if not document_fields.intersection(update_fields):
+            return
+    get_search_backend().update_index(sender, [instance.pk])
+
+
+def _remove_on_delete(sender, instance, **kwargs):
+    get_search_backend().remove_from_index(sender, [instance.pk])
+
+
+class BaseSearchBackend:
+    """Interfaz de los backends de búsqueda de texto completo"""
+    # Indica si el índice vive fuera de la tabla y hay que limpiarlo al eliminar
+    tracks_deletes = False
+
+    def search(self, queryset, terms):
+        """Filtra el queryset y lo anota con search_rank y search_highlight"""
+        raise NotImplementedError
+
+    def update_index(self, model, ids):
+        """Recalcula el índice de los objetos indicados"""
+        raise NotImplementedError
+
+    def remove_from_index(self, model, ids):
+        """Elimina los objetos indicados del índice"""
+        pass
+
+    def _names(self, model):
+        quote = connection.ops.quote_name
+        return quote(model._meta.db_table), quote(model._meta.pk.column)
+
+    def _column(self, model, field_name):
+        return connection.ops.quote_name(model._meta.get_field(field_name).column)
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Búsqueda con tsvector en la columna search_vector de cada tabla, con índice GIN.
+    La configuración simem_es aplica unaccent + stemming en español.
+    """
+    config = 'simem_es'
+    vector_column = 'search_vector'
+    headline_options = 'StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=8'
+
+    def _document_sql(self, model):
+        parts = []
+        params = []
+        for field_name, weight in SEARCH_DOCUMENTS[model]['fields']:
+            parts.append(f"setweight(to_tsvector(%s::regconfig, coalesce({self._column(model, field_name)}, '')), %s)")
+            params.extend([self.config, weight])
+        return ' || '.join(parts), params
+
+    def search(self, queryset, terms):
+        model = queryset.model
+        table, _ = self._names(model)
+        vector = f'{table}.{connection.ops.quote_name(self.vector_column)}'
+        tsquery = 'websearch_to_tsquery(%s::regconfig, %s)'
+        highlight = self._column(model, SEARCH_DOCUMENTS[model]['highlight'])
+        return queryset.filter(
+            RawSQL(f'{vector} @@ {tsquery}', [self.config, terms], output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(f'ts_rank_cd({vector}, {tsquery})', [self.config, terms], output_field=FloatField()),
+            search_highlight=RawSQL(
+                f"ts_headline(%s::regconfig, coalesce({table}.{highlight}, ''), {tsquery}, %s)",
+                [self.config, self.config, terms, self.headline_options],
+                output_field=CharField(),
+            ),
+        )
+
+    def update_index(self, model, ids):
+        if not ids:
+            return
+        table, pk = self._names(model)
+        document, params = self._document_sql(model)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'UPDATE {table} SET {connection.ops.quote_name(self.vector_column)} = {document} '
+                f'WHERE {pk} = ANY(%s)',
+                params + [list(ids)],
+            )
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    Sustituto local de PostgreSQL: tabla virtual FTS5 <tabla>_fts por modelo,
+    con unicode61 remove_diacritics para ignorar acentos y búsqueda por prefijo.
+    """
+    tracks_deletes = True
+    snippet_tokens = 12
+
+    def _fts_table(self, model):
+        return connection.ops.quote_name(f'{model._meta.db_table}_fts')
+
+    def _match_query(self, terms):
+        tokens = re.findall(r'\w+', terms)
+        return ' '.join(f'"{token}"*' for token in tokens)
+
+    def search(self, queryset, terms):
+        model = queryset.model
+        match = self._match_query(terms)
+        if not match:
+            return queryset.none()
+        table, pk = self._names(model)
+        fts = self._fts_table(model)
+        fields = [name for name, _ in SEARCH_DOCUMENTS[model]['fields']]
+        highlight = fields.index(SEARCH_DOCUMENTS[model]['highlight'])
+        correlated = f'FROM {fts} WHERE {fts} MATCH %s AND {fts}.rowid = {table}.{pk}'
+        return queryset.filter(
+            pk__in=RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [match])
+        ).annotate(
+            search_rank=RawSQL(f'SELECT -bm25({fts}) {correlated}', [match], output_field=FloatField()),
+            search_highlight=RawSQL(
+                f"SELECT snippet({fts}, {highlight}, '<mark>', '</mark>', '…', {self.snippet_tokens}) {correlated}",
+                [match],
+                output_field=CharField(),
+            ),
+        )
+
+    def update_index(self, model, ids):
+        if not ids:
+            return
+        fields = [name for name, _ in SEARCH_DOCUMENTS[model]['fields']]
+        rows = model._base_manager.filter(pk__in=ids).values_list('pk', *fields)
+        fts = self._fts_table(model)
+        columns = ', '.join(connection.ops.quote_name(name) for name in fields)
+        placeholders = ', '.join(['%s'] * (len(fields) + 1))
+        self.remove_from_index(model, ids)
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {fts} (rowid, {columns}) VALUES ({placeholders})',
+                [tuple(value if value is not None else '' for value in row) for row in rows],
+            )
+
+    def remove_from_index(self, model, ids):
+        if not ids:
+            return
+        fts = self._fts_table(model)
+        placeholders = ', '.join(['%s'] * len(ids))
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {fts} WHERE rowid IN ({placeholders})', list(ids))
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Filtro de búsqueda de texto completo (?search=) con ranking.
+    Debe ir después de OrderingFilter: sin ?ordering= explícito los resultados
+    se ordenan por relevancia.
+    """
+    search_param = api_settings.SEARCH_PARAM
+    ordering_param = api_settings.ORDERING_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, '').strip()
+        if not terms:
+            return queryset
+        queryset = get_search_backend().search(queryset, terms)
+        if not request.query_params.get(self.ordering_param):
+            queryset = queryset.order_by('-search_rank', '-pk')
+        return queryset
+
+
+class SearchResultSerializerMixin:
+    """Agrega search_rank y search_highlight a la representación cuando hay búsqueda"""
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if hasattr(instance, 'search_rank'):
+            data['search_rank'] = instance.search_rank
+            data['search_highlight'] = instance.search_highlight
+        return data
@@ -0,0 +1,113 @@
+"""
+Representaciones parciales (sparse fieldsets) con ?fields=a,b y ?exclude=c.
+
+Solo se aplican en GET/HEAD y en el serializador de nivel superior (los anidados
+conservan todos sus campos). QueryPlanMixin usa los campos que quedan para
+reducir el plan de consulta (select_related / prefetch_related / annotate) y
+cargar solo las columnas necesarias con .only().
+
+Los SerializerMethodField (source='*') declaran lo que leen en
+Meta.field_dependencies = {'campo': ['ruta__en__el__modelo', ...]}. Si un campo
+no tiene dependencias conocidas, el plan se aplica completo y sin .only().
+
+Meta.optional_fields son campos que no forman parte de la representación por
+defecto: solo se incluyen cuando se nombran en ?fields=.
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+from helpers.exceptions import BadRequest
+
+FIELDS_PARAM = 'fields'
+EXCLUDE_PARAM = 'exclude'
+
+
+def _parse(params, name):
+    value = params.get(name)
+    if value is None:
+        return None
+    return {item.strip() for item in value.split(',') if item.strip()}
+
+
+def requested_fields(request):
+    """Retorna (fields, exclude) pedidos, o (None, None) si no aplica"""
+    if request is None or request.method not in ('GET', 'HEAD'):
+        return None, None
+    params = getattr(request, 'query_params', request.GET)
+    return _parse(params, FIELDS_PARAM), _parse(params, EXCLUDE_PARAM)
+
+
+def is_requested(request):
+    return requested_fields(request) != (None, None)
+
+
+def select_fields(available, request, optional=()):
+    """Nombres de campos que se conservan, en el orden del serializador"""
+    fields, exclude = requested_fields(request)
+    if fields is None and exclude is None:
+        return [name for name in available if name not in optional]
+    unknown = ((fields or set()) | (exclude or set())) - set(available)
+    if unknown:
+        raise BadRequest({'fields': f"Campos desconocidos: {', '.join(sorted(unknown))}"})
+    return [
+        name for name in available
+        if (name in fields if fields is not None else name not in optional) and name not in (exclude or set())
+    ]
+
+
+class SparseFieldsetMixin:
+    """Quita de la representación los campos no pedidos en ?fields= / ?exclude="""
+
+    def is_top_level(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        optional = getattr(self.Meta, 'optional_fields', ())
+        if not self.is_top_level():
+            return {name: field for name, field in fields.items() if name not in optional}
+        keep = select_fields(fields.keys(), self.context.get('request'), optional)
+        return {name: fields[name] for name in keep}
+
+
+def field_paths(serializer_class, request):
+    """
+    Rutas del modelo que leen los campos pedidos: (only, relaciones), o None si
+    algún campo no declara sus dependencias.
+    """
+    serializer = serializer_class(context={'request': request})
+    model = serializer.Meta.model
+    dependencies = getattr(serializer.Meta, 'field_dependencies', {})
+    only, relations = set(), set()
+
+    def add(path, nested=False):
+        name = path.split('__')[0]
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Anotación del plan
+            relations.add(path)
+            return
+        if field.concrete:
+            only.add(name if nested else path)
+            if field.is_relation and (nested or '__' in path):
+                relations.add(path if nested else name)
+        else:
+            # Relación inversa o muchos a muchos: se resuelve con prefetch
+            relations.add(path)
+
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if name in dependencies:
+            for path in dependencies[name]:
+                add(path)
+        elif field.source == '*':
+            return None
+        else:
+            nested = isinstance(field, (serializers.BaseSerializer, serializers.ManyRelatedField))
+            add('__'.join(field.source_attrs), nested=nested)
+    return only, relations
@@ -0,0 +1,127 @@
+"""
+Respuestas JSON en streaming con el mismo envelope {"message", "data", "code"}.
+
+El envelope se escribe por partes: primero las claves anteriores a "data", luego
+las filas en bloques de STREAM_CHUNK_SIZE a medida que el iterador las entrega y
+al final el resto de las claves. La lista completa nunca se arma en memoria ni
+se renderiza a un solo byte string.
+
+Solo se transmite en streaming cuando el formato negociado es StreamingJSONRenderer
+(JSON); con la API navegable u otros formatos se usa ok_response normal. Un
+error a mitad del recorrido ya no puede cambiar el status (los encabezados se
+enviaron), por eso las validaciones y el 404 van antes de crear la respuesta.
+"""
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from helpers.responses import ok_response
+
+
+def _chunk_size():
+    return getattr(settings, 'STREAM_CHUNK_SIZE', 500)
+
+
+def iter_serialized(objects, serialize, chunk_size=None):
+    """
+    Recorre objects por bloques y entrega cada representación.
+    serialize(lista) retorna la lista de representaciones del bloque (un
+    serializador many=True o una proyección). Un queryset se recorre con
+    iterator(chunk_size), que también aplica sus prefetch_related por bloque.
+    """
+    chunk_size = chunk_size or _chunk_size()
+    if hasattr(objects, 'iterator'):
+        objects = objects.iterator(chunk_size=chunk_size)
+    iterator = iter(objects)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield from serialize(chunk)
+
+
+class StreamingJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer que además sabe escribir un envelope por partes
+    (StreamingEnvelopeResponse). Las respuestas normales no cambian.
+    """
+
+    def dumps(self, value):
+        """Mismo JSON que render() en su forma compacta"""
+        ret = json.dumps(
+            value,
+            cls=self.encoder_class,
+            ensure_ascii=self.ensure_ascii,
+            allow_nan=not self.strict,
+            separators=(',', ':') if self.compact else (', ', ': '),
+        )
+        return ret.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029').encode()
+
+    def render_stream(self, envelope, rows, key='data', chunk_size=None):
+        """Genera los bytes del envelope con rows como lista en envelope[key]"""
+        chunk_size = chunk_size or _chunk_size()
+        separator = b',' if self.compact else b', '
+        colon = b':' if self.compact else b': '
+        first_key = True
+        for name, value in envelope.items():
+            yield (b'{' if first_key else separator) + self.dumps(name) + colon
+            first_key = False
+            if name != key:
+                yield self.dumps(value)
+                continue
+            yield b'['
+            rows = iter(rows)
+            first_row = True
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                encoded = separator.join(self.dumps(row) for row in chunk)
+                yield encoded if first_row else separator + encoded
+                first_row = False
+            yield b']'
+        yield b'}'
+
+
+async def _async_chunks(chunks):
+    """
+    Recorre un generador síncrono (que puede consultar la base) bloque por bloque
+    con sync_to_async; bajo ASGI Django convertiría un iterador síncrono en una
+    lista completa antes de enviarlo. Usa el hilo compartido (thread_sensitive)
+    y no run_read: el cursor del generador debe quedarse en una conexión.
+    """
+    chunks = iter(chunks)
+    done = object()
+    while (chunk := await sync_to_async(next)(chunks, done)) is not done:
+        yield chunk
+
+
+class StreamingEnvelopeResponse(StreamingHttpResponse):
+    """StreamingHttpResponse con el envelope de helpers.responses"""
+
+    def __init__(self, rows, message, code=status.HTTP_200_OK, renderer=None, asynchronous=False):
+        renderer = renderer or StreamingJSONRenderer()
+        envelope = {'message': message, 'data': None, 'code': code}
+        chunks = renderer.render_stream(envelope, rows)
+        super().__init__(
+            _async_chunks(chunks) if asynchronous else chunks,
+            status=code,
+            content_type=renderer.media_type,
+        )
+
+
+def ok_streaming_response(request, rows, message="Acción realizada correctamente", asynchronous=False):
+    """
+    ok_response con rows (un iterador de representaciones) escrito en streaming.
+    Si el formato negociado no es JSON se arma la lista y se usa ok_response.
+    asynchronous: la respuesta la envía una acción async (helpers.async_views).
+    """
+    renderer = getattr(request, 'accepted_renderer', None)
+    if not isinstance(renderer, StreamingJSONRenderer) or not getattr(settings, 'API_STREAMING_RESPONSES', True):
+        return ok_response(data=list(rows), message=message)
+    return StreamingEnvelopeResponse(rows, message, renderer=renderer, asynchronous=asynchronous)
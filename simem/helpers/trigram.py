@@ -0,0 +1,61 @@
+from django.db import migrations
+from django.db.models import CharField, TextField
+from django.db.models.lookups import IContains
+from rest_framework.filters import SearchFilter
+
+
+@CharField.register_lookup
+@TextField.register_lookup
+class TrigramIContains(IContains):
+    """
+    Misma semántica de subcadena que icontains, pero en PostgreSQL se traduce a
+    columna ILIKE '%valor%' (sin UPPER(...)) para poder usar un índice GIN
+    gin_trgm_ops sobre la columna. En otros motores se comporta como icontains.
+    """
+    lookup_name = 'trgm_icontains'
+
+    def as_sql(self, compiler, connection):
+        return IContains(self.lhs, self.rhs).as_sql(compiler, connection)
+
+    def as_postgresql(self, compiler, connection):
+        if not self.rhs_is_direct_value():
+            return self.as_sql(compiler, connection)
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs_sql} ILIKE {rhs_sql}', (*lhs_params, *rhs_params)
+
+
+class TrigramSearchFilter(SearchFilter):
+    """SearchFilter que usa trgm_icontains en lugar de icontains"""
+
+    def construct_search(self, field_name, *args, **kwargs):
+        lookup = super().construct_search(field_name, *args, **kwargs)
+        if lookup.endswith('__icontains'):
+            return lookup[:-len('icontains')] + TrigramIContains.lookup_name
+        return lookup
+
+
+def TrigramIndexes(table, columns):
+    """
+    Operación de migración que crea índices GIN gin_trgm_ops (solo PostgreSQL).
+    En otros motores no hace nada; trgm_icontains sigue funcionando sin índice.
+    """
+    def index_name(column):
+        return f'{table}_{column}_trgm'[:63]
+
+    def create(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in columns:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {index_name(column)} ON {table} USING gin ({column} gin_trgm_ops)'
+            )
+
+    def drop(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for column in columns:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {index_name(column)}')
+
+    return migrations.RunPython(create, drop)
@@ -5,9 +5,9 @@ from movilizaciones.models import Expedientes, Registro, HashTag_Registro
 @admin.register(Expedientes)
 class ExpedientesAdmin(admin.ModelAdmin):
     """Admin para el modelo Expedientes"""
-    list_display = ['id', 'asunto', 'usuarios_id', 'fecha_evento', 'created_at']
+    list_display = ['id', 'asunto', 'usuarios_id', 'fecha_evento', 'registros_count', 'registros_activos_count', 'created_at']
     list_filter = ['fecha_evento', 'created_at']
-    search_fields = ['asunto', 'descripcion', 'usuarios_id__username']
+    search_fields = ['asunto', 'usuarios_id__username']
     readonly_fields = ['created_at', 'updated_at']
     date_hierarchy = 'fecha_evento'
     
@@ -15,9 +15,6 @@ class ExpedientesAdmin(admin.ModelAdmin):
         ('Información General', {
             'fields': ('usuarios_id', 'asunto', 'fecha_evento')
         }),
-        ('Detalles', {
-            'fields': ('descripcion',)
-        }),
         ('Auditoría', {
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class MovilizacionesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'movilizaciones'
+
+    def ready(self):
+        from helpers import search
+        from movilizaciones import counters
+        from movilizaciones import jobs  # noqa: F401 (registra los tipos de tarea)
+        from movilizaciones.models import Expedientes, Registro
+
+        counters.connect_signals()
+
+        search.register(Registro, [('ubicacion', 'A'), ('descripcion', 'B')], highlight='descripcion')
+        search.register(Expedientes, [('asunto', 'A')])
@@ -0,0 +1,179 @@
+from itertools import islice
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+
+from catalogos.cache import hashtag_catalog
+from helpers.errors import error
+from helpers.search import get_search_backend
+from movilizaciones import counters
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+from movilizaciones.serializers import RegistroBulkItemSerializer
+
+
+BULK_CHUNK_SIZE = 500
+
+
+def chunked(iterable, size):
+    """Divide un iterable (posiblemente un generador) en listas de tamaño size"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _failed(index, errors):
+    return {'index': index, 'status': 400, 'errors': errors}
+
+
+def bulk_create_registros(items, user, chunk_size=BULK_CHUNK_SIZE):
+    """
+    Crea registros por bloques con bulk_create y retorna un resultado por elemento.
+    Cada bloque valida expedientes y hashtags con una consulta IN y se guarda en
+    su propia transacción.
+    """
+    results = []
+    for chunk in chunked(enumerate(items), chunk_size):
+        results.extend(_create_chunk(chunk, user))
+    return results
+
+
+def _create_chunk(chunk, user):
+    results = {}
+    valid = []
+    for index, item in chunk:
+        if isinstance(item, ParseError):
+            results[index] = _failed(index, {'detail': str(item.detail)})
+            continue
+        if not isinstance(item, dict):
+            results[index] = _failed(index, {'detail': 'Se esperaba un objeto JSON'})
+            continue
+        serializer = RegistroBulkItemSerializer(data=item)
+        if not serializer.is_valid():
+            results[index] = _failed(index, error(default_errors=serializer.errors))
+            continue
+        valid.append((index, dict(serializer.validated_data)))
+
+    expediente_ids = {data['expedientes_id'] for _, data in valid}
+    hashtag_ids = {hashtag_id for _, data in valid for hashtag_id in data['hashtags']}
+    existing_expedientes = set(
+        Expedientes.objects.filter(pk__in=expediente_ids).values_list('pk', flat=True)
+    ) if expediente_ids else set()
+    missing_hashtags = set(hashtag_catalog.missing_activos(hashtag_ids)) if hashtag_ids else set()
+
+    pending = []
+    for index, data in valid:
+        if data['expedientes_id'] not in existing_expedientes:
+            results[index] = _failed(index, {'expedientes_id': 'Expediente no encontrado'})
+            continue
+        missing = sorted(set(data['hashtags']) & missing_hashtags)
+        if missing:
+            results[index] = _failed(index, {'hashtags': f'Hashtags no encontrados o inactivos: {missing}'})
+            continue
+        pending.append((index, data))
+
+    if pending:
+        with transaction.atomic():
+            registros = Registro.objects.bulk_create([
+                Registro(
+                    expedientes_id_id=data['expedientes_id'],
+                    creado_por=user,
+                    ubicacion=data['ubicacion'],
+                    descripcion=data.get('descripcion'),
+                    url_foto=data.get('url_foto'),
+                    activo=data['activo'],
+                )
+                for _, data in pending
+            ])
+            links = HashTag_Registro.objects.bulk_create([
+                HashTag_Registro(id_registro_id=registro.pk, id_catalogo_hashtag_id=hashtag_id)
+                for registro, (_, data) in zip(registros, pending)
+                for hashtag_id in dict.fromkeys(data['hashtags'])
+            ])
+            # bulk_create no envía post_save: los contadores se actualizan por bloque
+            counters.registros_creados(registros)
+            counters.hashtags_enlazados([link.id_catalogo_hashtag_id for link in links])
+            # bulk_create no envía post_save: se actualiza el índice de búsqueda aquí
+            get_search_backend().update_index(Registro, [registro.pk for registro in registros])
+
+        for registro, (index, _) in zip(registros, pending):
+            results[index] = {'index': index, 'status': 201, 'id': registro.pk}
+
+    return [results[index] for index, _ in chunk]
+
+
+HASHTAG_OPERACIONES = ('agregar', 'remover', 'reemplazar')
+
+
+def bulk_set_hashtags(registro_ids, hashtag_ids, operacion):
+    """
+    Aplica N hashtags a M registros en una sola transacción.
+    - agregar: inserta los enlaces faltantes (ON CONFLICT DO NOTHING RETURNING)
+    - remover: un solo DELETE ... IN sobre los pares indicados
+    - reemplazar: elimina los hashtags que no están en hashtag_ids y agrega los faltantes
+    Retorna un diccionario con los enlaces creados y eliminados.
+    """
+    created = 0
+    removed = 0
+    with transaction.atomic():
+        links = HashTag_Registro.objects.filter(id_registro_id__in=registro_ids)
+
+        if operacion == 'remover':
+            removed = _delete_links(links.filter(id_catalogo_hashtag_id__in=hashtag_ids))
+            return {'created': created, 'removed': removed}
+
+        if operacion == 'reemplazar':
+            removed = _delete_links(links.exclude(id_catalogo_hashtag_id__in=hashtag_ids))
+
+        existing = set(
+            links.filter(id_catalogo_hashtag_id__in=hashtag_ids).values_list('id_registro_id', 'id_catalogo_hashtag_id')
+        )
+        missing = [
+            (registro_id, hashtag_id)
+            for registro_id in registro_ids
+            for hashtag_id in hashtag_ids
+            if (registro_id, hashtag_id) not in existing
+        ]
+        inserted = _insert_links(missing)
+        counters.hashtags_enlazados(inserted)
+        created = len(inserted)
+    return {'created': created, 'removed': removed}
+
+
+def _insert_links(pairs):
+    """
+    Inserta los pares (registro, hashtag) con ON CONFLICT DO NOTHING RETURNING y
+    retorna el hashtag de cada enlace realmente insertado: los que otra petición
+    haya creado en paralelo no se cuentan (bulk_create con ignore_conflicts no
+    dice cuáles se omitieron).
+    """
+    if not pairs:
+        return []
+    quote = connection.ops.quote_name
+    fields = [HashTag_Registro._meta.get_field(name) for name in ('id_registro', 'id_catalogo_hashtag', 'created_at', 'updated_at')]
+    columns = ', '.join(quote(field.column) for field in fields)
+    now = fields[2].get_db_prep_save(timezone.now(), connection)
+    batch_size = min(BULK_CHUNK_SIZE, connection.ops.bulk_batch_size(fields, pairs))
+    inserted = []
+    with connection.cursor() as cursor:
+        for chunk in chunked(pairs, batch_size):
+            cursor.execute(
+                f'INSERT INTO {quote(HashTag_Registro._meta.db_table)} ({columns}) '
+                f"VALUES {', '.join(['(%s, %s, %s, %s)'] * len(chunk))} "
+                f'ON CONFLICT DO NOTHING RETURNING {quote(fields[1].column)}',
+                [value for registro_id, hashtag_id in chunk for value in (registro_id, hashtag_id, now, now)],
+            )
+            inserted.extend(row[0] for row in cursor.fetchall())
+    return inserted
+
+
+def _delete_links(links):
+    """Elimina los enlaces con un solo DELETE y descuenta el uso de cada hashtag"""
+    usos = dict(links.order_by().values('id_catalogo_hashtag').annotate(n=Count('pk')).values_list('id_catalogo_hashtag', 'n'))
+    removed, _ = links.delete()
+    counters.hashtags_desenlazados(usos)
+    return removed
@@ -0,0 +1,215 @@
+"""
+Contadores desnormalizados:
+- Expedientes.registros_count / registros_activos_count
+- CatalogoHashTag.uso_count (enlaces HashTag_Registro)
+- Usuarios.registros_count (registros creados por el usuario)
+
+Se actualizan con UPDATE ... SET col = col + n. Los guardados individuales se
+cubren con señales post_save; bulk_create y los DELETE por queryset no envían
+señales, así que esos caminos llaman a estas funciones directamente. Cualquier
+desviación se corrige con `python manage.py reconcile_counters`.
+"""
+from collections import Counter, defaultdict
+
+from django.apps import apps as django_apps
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_init, post_save
+
+
+def increment(model, deltas_by_pk):
+    """
+    Aplica {pk: {campo: delta}} con una consulta UPDATE por combinación distinta
+    de deltas. Los decrementos no bajan de 0.
+    """
+    groups = defaultdict(list)
+    for pk, deltas in deltas_by_pk.items():
+        key = tuple(sorted((field, delta) for field, delta in deltas.items() if delta))
+        if pk is not None and key:
+            groups[key].append(pk)
+    for key, pks in groups.items():
+        model._base_manager.filter(pk__in=pks).update(**{
+            field: F(field) + delta if delta > 0 else Greatest(F(field) + delta, Value(0))
+            for field, delta in key
+        })
+
+
+def registros_creados(registros):
+    """Suma registros nuevos a su expediente y a su creador"""
+    from movilizaciones.models import Expedientes
+    from usuarios.models import Usuarios
+
+    expedientes = defaultdict(Counter)
+    creadores = Counter()
+    for registro in registros:
+        expedientes[registro.expedientes_id_id]['registros_count'] += 1
+        expedientes[registro.expedientes_id_id]['registros_activos_count'] += int(bool(registro.activo))
+        creadores[registro.creado_por_id] += 1
+    increment(Expedientes, expedientes)
+    increment(Usuarios, {pk: {'registros_count': n} for pk, n in creadores.items()})
+
+
+def registros_eliminados(registros_queryset):
+    """
+    Descuenta de creadores y hashtags los registros que se van a eliminar.
+    Debe llamarse antes del DELETE (el expediente se descuenta aparte o se elimina).
+    """
+    from catalogos.models import CatalogoHashTag
+    from movilizaciones.models import HashTag_Registro
+    from usuarios.models import Usuarios
+
+    creadores = registros_queryset.order_by().values('creado_por').annotate(n=Count('pk'))
+    increment(Usuarios, {row['creado_por']: {'registros_count': -row['n']} for row in creadores})
+    usos = HashTag_Registro.objects.filter(id_registro__in=registros_queryset.values('pk')).order_by().values(
+        'id_catalogo_hashtag'
+    ).annotate(n=Count('pk'))
+    increment(CatalogoHashTag, {row['id_catalogo_hashtag']: {'uso_count': -row['n']} for row in usos})
+
+
+def registros_borrados(creadores, usos):
+    """
+    Descuenta registros y enlaces ya eliminados (DELETE ... RETURNING):
+    creadores {id_usuario: registros}, usos {id_hashtag: enlaces}
+    """
+    from usuarios.models import Usuarios
+
+    increment(Usuarios, {pk: {'registros_count': -n} for pk, n in creadores.items()})
+    hashtags_desenlazados(usos)
+
+
+def hashtags_enlazados(hashtag_ids):
+    """Suma usos por cada id de hashtag recibido (se admiten repetidos)"""
+    from catalogos.models import CatalogoHashTag
+    increment(CatalogoHashTag, {pk: {'uso_count': n} for pk, n in Counter(hashtag_ids).items()})
+
+
+def hashtags_desenlazados(usos_por_hashtag):
+    """Resta usos: {id_hashtag: enlaces eliminados}"""
+    from catalogos.models import CatalogoHashTag
+    increment(CatalogoHashTag, {pk: {'uso_count': -n} for pk, n in usos_por_hashtag.items()})
+
+
+# --- Señales para guardados individuales -------------------------------------
+
+def _remember_registro(sender, instance, **kwargs):
+    # Solo lee atributos ya cargados para no provocar consultas en campos diferidos
+    instance._counters_original = {
+        field: instance.__dict__[field]
+        for field in ('expedientes_id_id', 'creado_por_id', 'activo')
+        if field in instance.__dict__
+    }
+
+
+def _registro_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    from movilizaciones.models import Expedientes
+    from usuarios.models import Usuarios
+
+    original = getattr(instance, '_counters_original', {})
+    _remember_registro(sender, instance)
+    if created:
+        registros_creados([instance])
+        return
+    if not {'expedientes_id_id', 'activo'} <= original.keys():
+        return
+
+    expedientes = defaultdict(Counter)
+    expedientes[original['expedientes_id_id']]['registros_count'] -= 1
+    expedientes[original['expedientes_id_id']]['registros_activos_count'] -= int(bool(original['activo']))
+    expedientes[instance.expedientes_id_id]['registros_count'] += 1
+    expedientes[instance.expedientes_id_id]['registros_activos_count'] += int(bool(instance.activo))
+    increment(Expedientes, expedientes)
+
+    if 'creado_por_id' in original and original['creado_por_id'] != instance.creado_por_id:
+        increment(Usuarios, {
+            original['creado_por_id']: {'registros_count': -1},
+            instance.creado_por_id: {'registros_count': 1},
+        })
+
+
+def _remember_link(sender, instance, **kwargs):
+    instance._counters_hashtag = instance.__dict__.get('id_catalogo_hashtag_id')
+
+
+def _link_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    original = getattr(instance, '_counters_hashtag', None)
+    _remember_link(sender, instance)
+    if created:
+        hashtags_enlazados([instance.id_catalogo_hashtag_id])
+    elif original is not None and original != instance.id_catalogo_hashtag_id:
+        hashtags_desenlazados({original: 1})
+        hashtags_enlazados([instance.id_catalogo_hashtag_id])
+
+
+def connect_signals():
+    from movilizaciones.models import Registro, HashTag_Registro
+
+    post_init.connect(_remember_registro, sender=Registro, dispatch_uid='counters_registro_init')
+    post_save.connect(_registro_saved, sender=Registro, dispatch_uid='counters_registro_save')
+    post_init.connect(_remember_link, sender=HashTag_Registro, dispatch_uid='counters_link_init')
+    post_save.connect(_link_saved, sender=HashTag_Registro, dispatch_uid='counters_link_save')
+
+
+# --- Reconciliación ------------------------------------------------------------
+
+def _count(model, fk, **filters):
+    return Coalesce(
+        Subquery(
+            model._base_manager.filter(**{fk: OuterRef('pk')}, **filters)
+            .order_by().values(fk).annotate(n=Count('pk')).values('n')
+        ),
+        Value(0),
+    )
+
+
+def counter_definitions(apps=django_apps):
+    """
+    {etiqueta: (modelo, {campo: expresión con el valor real})}.
+    Acepta el registro de apps de una migración.
+    """
+    Expedientes = apps.get_model('movilizaciones', 'Expedientes')
+    Registro = apps.get_model('movilizaciones', 'Registro')
+    HashTag_Registro = apps.get_model('movilizaciones', 'HashTag_Registro')
+    CatalogoHashTag = apps.get_model('catalogos', 'CatalogoHashTag')
+    Usuarios = apps.get_model('usuarios', 'Usuarios')
+    return {
+        'expedientes': (Expedientes, {
+            'registros_count': _count(Registro, 'expedientes_id'),
+            'registros_activos_count': _count(Registro, 'expedientes_id', activo=True),
+        }),
+        'catalogohashtag': (CatalogoHashTag, {
+            'uso_count': _count(HashTag_Registro, 'id_catalogo_hashtag'),
+        }),
+        'usuarios': (Usuarios, {
+            'registros_count': _count(Registro, 'creado_por'),
+        }),
+    }
+
+
+def reconcile(model, expressions, batch_size=5000, start_id=0):
+    """
+    Recorre el modelo por bloques de pk y recalcula solo las filas desviadas.
+    Genera (último id del bloque, filas revisadas, filas corregidas) por bloque.
+    """
+    real = {f'real_{field}': expression for field, expression in expressions.items()}
+    drifted = Q()
+    for field in expressions:
+        drifted |= ~Q(**{field: F(f'real_{field}')})
+
+    last_id = start_id
+    while True:
+        ids = list(
+            model._base_manager.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size]
+        )
+        if not ids:
+            return
+        batch = model._base_manager.filter(pk__gte=ids[0], pk__lte=ids[-1])
+        drift_ids = list(batch.annotate(**real).filter(drifted).values_list('pk', flat=True))
+        if drift_ids:
+            # El valor se recalcula dentro del propio UPDATE para no pisar incrementos concurrentes
+            model._base_manager.filter(pk__in=drift_ids).update(**expressions)
+        last_id = ids[-1]
+        yield last_id, len(ids), len(drift_ids)
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+from collections import defaultdict
+from datetime import date, time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+from helpers.managers import visible_manager
+from helpers.search import get_search_backend
+from movilizaciones.bulk import chunked
+from movilizaciones.filters import RegistroFilter
+from movilizaciones.models import HashTag_Registro, Registro
+
+
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+# (columna, campo en values_list)
+EXPORT_COLUMNS = [
+    ('id', 'id'),
+    ('expedientes_id', 'expedientes_id_id'),
+    ('ubicacion', 'ubicacion'),
+    ('descripcion', 'descripcion'),
+    ('url_foto', 'url_foto'),
+    ('fecha', 'fecha'),
+    ('hora', 'hora'),
+    ('activo', 'activo'),
+    ('creado_por', 'creado_por_id'),
+    ('usuario_nombre', 'creado_por__nombre_completo'),
+    ('created_at', 'created_at'),
+    ('updated_at', 'updated_at'),
+]
+HEADER = [column for column, _ in EXPORT_COLUMNS] + ['hashtags']
+
+
+def iter_registro_chunks(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Recorre el queryset con iterator(chunk_size) y genera listas de diccionarios.
+    Los hashtags de cada bloque se cargan con una sola consulta IN, así la memoria
+    depende del tamaño del bloque y no del total de registros.
+    """
+    rows = queryset.values_list(*(field for _, field in EXPORT_COLUMNS)).iterator(chunk_size=chunk_size)
+    columns = [column for column, _ in EXPORT_COLUMNS]
+    for chunk in chunked(rows, chunk_size):
+        registros = [dict(zip(columns, row)) for row in chunk]
+        hashtags = defaultdict(list)
+        links = HashTag_Registro.objects.filter(
+            id_registro_id__in=[registro['id'] for registro in registros]
+        ).order_by('id').values_list('id_registro_id', 'id_catalogo_hashtag__descripcion')
+        for registro_id, descripcion in links:
+            hashtags[registro_id].append(descripcion)
+        for registro in registros:
+            registro['hashtags'] = hashtags[registro['id']]
+        yield registros
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Genera el CSV por bloques; los hashtags se separan con |"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADER)
+    for registros in iter_registro_chunks(queryset, chunk_size):
+        for registro in registros:
+            writer.writerow([
+                *(_csv_value(registro[column]) for column, _ in EXPORT_COLUMNS),
+                '|'.join(registro['hashtags']),
+            ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def stream_ndjson(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Genera un objeto JSON por línea, por bloques"""
+    for registros in iter_registro_chunks(queryset, chunk_size):
+        yield ''.join(
+            json.dumps(registro, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+            for registro in registros
+        )
+
+
+def stream_export(queryset, formato, chunk_size=EXPORT_CHUNK_SIZE):
+    if formato == 'ndjson':
+        return stream_ndjson(queryset, chunk_size)
+    return stream_csv(queryset, chunk_size)
+
+
+def export_queryset(user, filtros):
+    """
+    Registros visibles para user que cumplen los filtros de /registros/
+    (RegistroFilter y ?search=), ordenados por id. Lo usan las exportaciones en
+    segundo plano, que no tienen la petición original.
+    """
+    queryset = visible_manager(Registro, user).all()
+    if not user.is_superuser:
+        queryset = queryset.filter(Q(creado_por=user) | Q(expedientes_id__usuarios_id=user))
+    queryset = RegistroFilter(data=filtros, queryset=queryset).qs
+    terms = filtros.get('search', '').strip()
+    if terms:
+        queryset = get_search_backend().search(queryset, terms)
+    return queryset.order_by('id')
@@ -5,20 +5,19 @@ from movilizaciones.models import Expedientes, Registro, HashTag_Registro
 class ExpedientesFilter(django_filters.FilterSet):
     """Filter para el modelo Expedientes"""
     id = django_filters.NumberFilter(field_name='id')
-    asunto = django_filters.CharFilter(field_name='asunto', lookup_expr='icontains')
-    descripcion = django_filters.CharFilter(field_name='descripcion', lookup_expr='icontains')
+    asunto = django_filters.CharFilter(field_name='asunto', lookup_expr='trgm_icontains')
     usuarios_id = django_filters.NumberFilter(field_name='usuarios_id')
     fecha_evento = django_filters.DateFromToRangeFilter(field_name='fecha_evento')
     
     class Meta:
         model = Expedientes
-        fields = ['asunto', 'descripcion', 'usuarios_id', 'fecha_evento']
+        fields = ['asunto', 'usuarios_id', 'fecha_evento']
 
 
 class RegistroFilter(django_filters.FilterSet):
     """Filter para el modelo Registro"""
     id = django_filters.NumberFilter(field_name='id')
-    ubicacion = django_filters.CharFilter(field_name='ubicacion', lookup_expr='icontains')
+    ubicacion = django_filters.CharFilter(field_name='ubicacion', lookup_expr='trgm_icontains')
     descripcion = django_filters.CharFilter(field_name='descripcion', lookup_expr='icontains')
     expedientes_id = django_filters.NumberFilter(field_name='expedientes_id')
     creado_por = django_filters.NumberFilter(field_name='creado_por')
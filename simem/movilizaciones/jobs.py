@@ -0,0 +1,88 @@
+"""
+Tareas en segundo plano de movilizaciones (tareas.queue), registradas en
+MovilizacionesConfig.ready.
+"""
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+
+from movilizaciones.counters import counter_definitions, reconcile
+from movilizaciones.export import EXPORT_FORMATS, export_queryset, stream_export
+from movilizaciones.models import Expedientes
+from movilizaciones.purge import eliminar_expediente, purgar_registros
+from tareas.queue import TareaInvalida, progreso, tarea
+
+
+@tarea('movilizaciones.exportar_registros')
+def exportar_registros(tarea, formato='csv', filtros=None):
+    """
+    Exporta los registros visibles para quien creó la tarea a un archivo en
+    default_storage (exportaciones/), descargable en /tareas/{id}/descargar/.
+    """
+    if formato not in EXPORT_FORMATS:
+        raise TareaInvalida(f'Formato desconocido: {formato}')
+    if tarea.creado_por is None:
+        raise TareaInvalida('El usuario que solicitó la exportación ya no existe')
+    queryset = export_queryset(tarea.creado_por, filtros or {})
+
+    total = 0
+    with tempfile.TemporaryFile() as output:
+        for chunk in stream_export(queryset, formato):
+            total += output.write(chunk.encode('utf-8'))
+            progreso(tarea, bytes=total)
+        output.seek(0)
+        # Un reintento reemplaza el archivo del intento anterior
+        nombre = f'exportaciones/registros_{tarea.pk}.{formato}'
+        if default_storage.exists(nombre):
+            default_storage.delete(nombre)
+        nombre = default_storage.save(nombre, File(output))
+    return {'archivo': nombre, 'formato': formato, 'bytes': total}
+
+
+@tarea('movilizaciones.reconciliar_contadores')
+def reconciliar_contadores(tarea, modelos=None, batch_size=5000):
+    """reconcile_counters como tarea; un reintento continúa desde el último bloque revisado"""
+    definitions = counter_definitions()
+    names = [name.lower() for name in modelos] if modelos else list(definitions)
+    unknown = [name for name in names if name not in definitions]
+    if unknown:
+        raise TareaInvalida(f"Contadores desconocidos: {', '.join(unknown)}")
+
+    resultado = {}
+    for name in names:
+        model, expressions = definitions[name]
+        avance = (tarea.progreso or {}).get(name, {'revisados': 0, 'corregidos': 0, 'ultimo_id': 0})
+        for last_id, checked, fixed in reconcile(model, expressions, batch_size, avance['ultimo_id']):
+            avance = {
+                'revisados': avance['revisados'] + checked,
+                'corregidos': avance['corregidos'] + fixed,
+                'ultimo_id': last_id,
+            }
+            progreso(tarea, **{name: avance})
+        resultado[name] = {'revisados': avance['revisados'], 'corregidos': avance['corregidos']}
+    return resultado
+
+
+@tarea('movilizaciones.purgar_expediente')
+def purgar_expediente(tarea, expediente_id, total=None, batch_size=None):
+    """
+    Elimina por bloques los registros de un expediente desactivado y al final el
+    expediente (movilizaciones.purge). El avance acumula los bloques de intentos previos.
+    """
+    if Expedientes.objects.filter(pk=expediente_id).exists():
+        raise TareaInvalida('El expediente se reactivó; la purga se canceló')
+    avance = tarea.progreso or {'registros_eliminados': 0, 'enlaces_eliminados': 0, 'total': total}
+    for registros, enlaces in purgar_registros(expediente_id, batch_size):
+        avance = {
+            **avance,
+            'registros_eliminados': avance['registros_eliminados'] + registros,
+            'enlaces_eliminados': avance['enlaces_eliminados'] + enlaces,
+        }
+        progreso(tarea, **avance)
+    eliminar_expediente(expediente_id)
+    return {
+        'expediente_id': expediente_id,
+        'registros_eliminados': avance['registros_eliminados'],
+        'enlaces_eliminados': avance['enlaces_eliminados'],
+    }
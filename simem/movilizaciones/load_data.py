@@ -0,0 +1,269 @@
+"""
+Generador de datos sintéticos a gran escala para benchmarks
+(python manage.py generate_load_data).
+
+Los usuarios y hashtags se crean con bulk_create en el proceso principal. Los
+expedientes se reparten en bloques de ids consecutivos y cada bloque se genera
+e inserta en un proceso worker (COPY en PostgreSQL, INSERT por lotes en los
+demás motores) junto con sus registros y enlaces:
+
+- Dueños de expedientes, creadores de registros y hashtags siguen una
+  distribución Zipf: pocos usuarios y hashtags concentran la mayoría de filas.
+- Los registros por expediente siguen una distribución de Pareto.
+- Cada bloque usa su propio random.Random(f'{seed}:{bloque}'): con la misma
+  semilla el resultado no depende del número de procesos.
+
+Los ids de expedientes y registros se reservan a partir del máximo actual, así
+que la carga debe hacerse sobre una base de datos sin escrituras concurrentes.
+Los contadores de los expedientes se escriben con las filas; los de usuarios y
+hashtags los suma el proceso principal al terminar cada bloque.
+"""
+import io
+import random
+from collections import Counter
+from datetime import timedelta
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from catalogos.models import CatalogoHashTag
+from helpers.search import get_search_backend
+from movilizaciones import counters
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+from usuarios.models import Usuarios
+
+
+# Filas por INSERT ... VALUES (executemany) y ids por llamada a update_index
+INSERT_BATCH_SIZE = 5000
+
+NOMBRES = [
+    'Juan', 'María', 'Carlos', 'Ana', 'Roberto', 'Laura', 'José', 'Patricia', 'Luis', 'Carmen',
+    'Miguel', 'Sofía', 'Jorge', 'Elena', 'Fernando', 'Lucía', 'Ricardo', 'Isabel', 'Andrés', 'Gabriela',
+]
+APELLIDOS = [
+    'Pérez', 'López', 'García', 'Martínez', 'Rodríguez', 'Sánchez', 'González', 'Hernández', 'Ramírez', 'Torres',
+    'Flores', 'Rivera', 'Gómez', 'Díaz', 'Cruz', 'Morales', 'Reyes', 'Ortiz', 'Castillo', 'Vargas',
+]
+LUGARES = [
+    'Calle Principal', 'Avenida Central', 'Plaza Mayor', 'Boulevard Norte', 'Calle Reforma', 'Avenida Juárez',
+    'Carretera Federal', 'Parque Industrial', 'Colonia Centro', 'Puerto Marítimo', 'Aduana Sur', 'Almacén General',
+]
+ASUNTOS = [
+    'Traslado de mercancía', 'Inspección de carga', 'Revisión documental', 'Movilización de equipo',
+    'Auditoría de inventario', 'Entrega programada', 'Reporte de incidencia', 'Seguimiento de envío',
+]
+PALABRAS = [
+    'revisión', 'carga', 'contenedor', 'documento', 'inspección', 'entrega', 'vehículo', 'equipo', 'almacén',
+    'inventario', 'daño', 'retraso', 'urgente', 'pendiente', 'completado', 'evidencia', 'fotografía', 'sello',
+    'factura', 'guía', 'traslado', 'ruta', 'responsable', 'incidencia', 'seguimiento', 'validación', 'aduana',
+    'muestra', 'lote', 'embarque', 'custodia', 'observación', 'registro', 'firma', 'bitácora', 'acta',
+]
+
+
+def zipf_cum_weights(n, s):
+    """Pesos acumulados de una distribución Zipf de exponente s sobre n elementos"""
+    return list(accumulate(1 / rank ** s for rank in range(1, n + 1)))
+
+
+def _descripcion(rng):
+    return ' '.join(rng.choices(PALABRAS, k=rng.randint(5, 20))).capitalize()
+
+
+# --- Inserción ----------------------------------------------------------------
+
+def _copy_value(value):
+    """Valor en el formato de texto de COPY"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def insertar(model, field_names, rows):
+    """
+    Inserta filas (tuplas en el orden de field_names) sin pasar por el ORM:
+    COPY en PostgreSQL, INSERT por lotes en los demás motores.
+    """
+    if not rows:
+        return
+    quote = connection.ops.quote_name
+    fields = [model._meta.get_field(name) for name in field_names]
+    table = quote(model._meta.db_table)
+    columns = ', '.join(quote(field.column) for field in fields)
+    prepared = (
+        [field.get_db_prep_save(value, connection) for field, value in zip(fields, row)]
+        for row in rows
+    )
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            sql = f'COPY {table} ({columns}) FROM STDIN'
+            if hasattr(cursor.cursor, 'copy_expert'):
+                # psycopg2
+                buffer = io.StringIO()
+                for row in prepared:
+                    buffer.write('\t'.join(_copy_value(value) for value in row))
+                    buffer.write('\n')
+                buffer.seek(0)
+                cursor.cursor.copy_expert(sql, buffer)
+            else:
+                # psycopg 3
+                with cursor.cursor.copy(sql) as copy:
+                    for row in prepared:
+                        copy.write_row(row)
+        else:
+            placeholders = ', '.join(['%s'] * len(fields))
+            sql = f'INSERT INTO {table} ({columns}) VALUES ({placeholders})'
+            batch = []
+            for row in prepared:
+                batch.append(row)
+                if len(batch) == INSERT_BATCH_SIZE:
+                    cursor.executemany(sql, batch)
+                    batch = []
+            if batch:
+                cursor.executemany(sql, batch)
+
+
+# --- Plan de la carga ---------------------------------------------------------
+
+def crear_catalogos(opciones):
+    """
+    Crea los usuarios y hashtags de la carga y reserva los rangos de ids de
+    expedientes y registros. Retorna el plan que reciben los workers.
+    """
+    rng = random.Random(f"{opciones['seed']}:catalogos")
+    prefijo = opciones['prefijo']
+    password = make_password('password123')
+    usuarios = Usuarios.objects.bulk_create([
+        Usuarios(
+            username=f'{prefijo}_{i:07d}',
+            email=f'{prefijo}_{i:07d}@simem.com',
+            password=password,
+            first_name=rng.choice(NOMBRES),
+            apellido_paterno=rng.choice(APELLIDOS),
+            apellido_materno=rng.choice(APELLIDOS),
+        )
+        for i in range(opciones['usuarios'])
+    ], batch_size=INSERT_BATCH_SIZE)
+    hashtags = CatalogoHashTag.all_with_inactive.bulk_create([
+        CatalogoHashTag(descripcion=f'{prefijo}_{rng.choice(PALABRAS)}_{i}')
+        for i in range(opciones['hashtags'])
+    ], batch_size=INSERT_BATCH_SIZE)
+
+    # El rango de Zipf no sigue el orden de los ids
+    usuario_ids = [usuario.pk for usuario in usuarios]
+    hashtag_ids = [hashtag.pk for hashtag in hashtags]
+    rng.shuffle(usuario_ids)
+    rng.shuffle(hashtag_ids)
+
+    return {
+        **opciones,
+        'usuario_ids': usuario_ids,
+        'hashtag_ids': hashtag_ids,
+        'expediente_base': Expedientes.all_with_inactive.aggregate(n=Max('pk'))['n'] or 0,
+        'registro_base': Registro.all_with_inactive.aggregate(n=Max('pk'))['n'] or 0,
+    }
+
+
+def bloques(plan):
+    """Índices de bloque de la carga"""
+    return range(-(-plan['expedientes'] // plan['bloque']))
+
+
+# --- Generación por bloque ----------------------------------------------------
+
+def generar_bloque(plan, bloque):
+    """
+    Genera e inserta en una transacción los expedientes del bloque con sus
+    registros y enlaces. Retorna (expedientes, registros, enlaces, registros por
+    creador, usos por hashtag) para los contadores que no viven en el bloque.
+    """
+    rng = random.Random(f"{plan['seed']}:{bloque}")
+    total_expedientes, total_registros = plan['expedientes'], plan['registros']
+    inicio = bloque * plan['bloque']
+    fin = min(inicio + plan['bloque'], total_expedientes)
+    n = fin - inicio
+    # Reparto fijo de registros por bloque: el rango de ids no depende de los demás
+    registro_id = plan['registro_base'] + total_registros * inicio // total_expedientes
+    n_registros = total_registros * fin // total_expedientes - total_registros * inicio // total_expedientes
+
+    usuario_ids, hashtag_ids = plan['usuario_ids'], plan['hashtag_ids']
+    usuarios_cum = zipf_cum_weights(len(usuario_ids), plan['zipf'])
+    hashtags_cum = zipf_cum_weights(len(hashtag_ids), plan['zipf']) if hashtag_ids else None
+    hasta, segundos = plan['hasta'], plan['dias'] * 86400
+    inactivos = plan['inactivos']
+
+    pesos = [rng.paretovariate(1.2) for _ in range(n)]
+    por_expediente = Counter(rng.choices(range(n), weights=pesos, k=n_registros))
+    duenos = rng.choices(usuario_ids, cum_weights=usuarios_cum, k=n)
+
+    expedientes, registros, enlaces = [], [], []
+    creadores, usos = Counter(), Counter()
+    for i in range(n):
+        expediente_id = plan['expediente_base'] + inicio + i + 1
+        created_at = hasta - timedelta(seconds=rng.uniform(0, segundos))
+        activos = 0
+        for _ in range(por_expediente[i]):
+            registro_id += 1
+            creado_por = duenos[i] if rng.random() < 0.8 else rng.choices(usuario_ids, cum_weights=usuarios_cum)[0]
+            registro_created = created_at + timedelta(seconds=rng.uniform(0, (hasta - created_at).total_seconds()))
+            local = timezone.localtime(registro_created)
+            activo = rng.random() >= inactivos
+            activos += activo
+            creadores[creado_por] += 1
+            registros.append((
+                registro_id, expediente_id, creado_por,
+                f'{rng.choice(LUGARES)} {rng.randint(1, 9999)}', _descripcion(rng),
+                f'https://fotos.simem.com/{registro_id}.jpg' if rng.random() < 0.3 else None,
+                local.date(), local.time(), activo, registro_created, registro_created,
+            ))
+            if hashtags_cum:
+                k = rng.randint(0, plan['max_hashtags'])
+                for hashtag_id in set(rng.choices(hashtag_ids, cum_weights=hashtags_cum, k=k)):
+                    usos[hashtag_id] += 1
+                    enlaces.append((hashtag_id, registro_id, registro_created, registro_created))
+        expedientes.append((
+            expediente_id, duenos[i], f'{rng.choice(ASUNTOS)} {expediente_id}',
+            created_at - timedelta(seconds=rng.uniform(0, 72 * 3600)),
+            rng.random() >= inactivos, por_expediente[i], activos, created_at, created_at,
+        ))
+
+    with transaction.atomic():
+        insertar(Expedientes, [
+            'id', 'usuarios_id', 'asunto', 'fecha_evento', 'activo',
+            'registros_count', 'registros_activos_count', 'created_at', 'updated_at',
+        ], expedientes)
+        insertar(Registro, [
+            'id', 'expedientes_id', 'creado_por', 'ubicacion', 'descripcion', 'url_foto',
+            'fecha', 'hora', 'activo', 'created_at', 'updated_at',
+        ], registros)
+        insertar(HashTag_Registro, ['id_catalogo_hashtag', 'id_registro', 'created_at', 'updated_at'], enlaces)
+        if plan['indexar']:
+            search = get_search_backend()
+            for model, rows in ((Expedientes, expedientes), (Registro, registros)):
+                ids = [row[0] for row in rows]
+                for i in range(0, len(ids), INSERT_BATCH_SIZE):
+                    search.update_index(model, ids[i:i + INSERT_BATCH_SIZE])
+    return len(expedientes), len(registros), len(enlaces), creadores, usos
+
+
+def sumar_contadores(creadores, usos):
+    """Suma a usuarios y hashtags los registros y enlaces de un bloque"""
+    with transaction.atomic():
+        counters.increment(Usuarios, {pk: {'registros_count': n} for pk, n in creadores.items()})
+        counters.increment(CatalogoHashTag, {pk: {'uso_count': n} for pk, n in usos.items()})
+
+
+def finalizar():
+    """Ajusta las secuencias a los ids insertados y actualiza las estadísticas"""
+    models = [Expedientes, Registro, HashTag_Registro, Usuarios, CatalogoHashTag]
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(sql)
+        if connection.vendor == 'postgresql':
+            for model in models:
+                cursor.execute(f'ANALYZE {connection.ops.quote_name(model._meta.db_table)}')
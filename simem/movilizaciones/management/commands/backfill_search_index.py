@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from helpers.search import SEARCH_DOCUMENTS, get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de búsqueda de texto completo por bloques de ids'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help='Modelo a indexar (por ejemplo registro, expedientes). Por defecto todos.',
+        )
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--start-id', type=int, default=0, help='Reanuda a partir de este id')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        if chunk_size < 1:
+            raise CommandError('--chunk-size debe ser mayor a 0')
+
+        models = list(SEARCH_DOCUMENTS)
+        if options['models']:
+            names = {name.lower() for name in options['models']}
+            models = [model for model in models if model._meta.model_name in names]
+            if not models:
+                raise CommandError(f"Modelos no registrados para búsqueda: {', '.join(sorted(names))}")
+
+        backend = get_search_backend()
+        for model in models:
+            queryset = model._base_manager.order_by('pk')
+            total = queryset.filter(pk__gt=options['start_id']).count()
+            done = 0
+            last_id = options['start_id']
+            self.stdout.write(f'Indexando {model._meta.verbose_name_plural} ({total})...')
+            while True:
+                ids = list(queryset.filter(pk__gt=last_id).values_list('pk', flat=True)[:chunk_size])
+                if not ids:
+                    break
+                with transaction.atomic():
+                    backend.update_index(model, ids)
+                done += len(ids)
+                last_id = ids[-1]
+                self.stdout.write(f'  {done}/{total} (último id {last_id})')
+            self.stdout.write(self.style.SUCCESS(f'✓ {model._meta.verbose_name_plural} indexados: {done}'))
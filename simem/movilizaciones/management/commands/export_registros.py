@@ -0,0 +1,38 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from movilizaciones.export import EXPORT_CHUNK_SIZE, EXPORT_FORMATS, stream_export
+from movilizaciones.models import Registro
+
+
+class Command(BaseCommand):
+    help = 'Exporta registros (con creador y hashtags) en CSV o NDJSON sin cargarlos completos en memoria'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--expediente', type=int, help='Exporta solo los registros de este expediente')
+        parser.add_argument('--formato', choices=list(EXPORT_FORMATS), default='csv')
+        parser.add_argument('--output', '-o', help='Archivo de salida. Por defecto la salida estándar.')
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE)
+        parser.add_argument('--solo-activos', action='store_true', help='Excluye los registros inactivos')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size debe ser mayor a 0')
+
+        queryset = Registro.all_with_inactive.order_by('id')
+        if options['expediente'] is not None:
+            queryset = queryset.filter(expedientes_id=options['expediente'])
+        if options['solo_activos']:
+            queryset = queryset.filter(activo=True)
+
+        chunks = stream_export(queryset, options['formato'], options['chunk_size'])
+        if not options['output']:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+            return
+
+        with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+            for chunk in chunks:
+                output.write(chunk)
+        self.stderr.write(self.style.SUCCESS(f"✓ Registros exportados en {options['output']}"))
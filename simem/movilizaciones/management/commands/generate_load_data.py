@@ -0,0 +1,134 @@
+import multiprocessing
+import time
+from datetime import datetime, time as dtime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.utils import timezone
+
+
+_plan = None
+
+
+def _iniciar_worker(plan):
+    # Con spawn/forkserver el proceso hijo arranca sin Django configurado
+    import django
+    django.setup()
+    global _plan
+    _plan = plan
+
+
+def _generar(bloque):
+    from movilizaciones.load_data import generar_bloque
+    return generar_bloque(_plan, bloque)
+
+
+class Command(BaseCommand):
+    help = 'Genera datos sintéticos a gran escala (usuarios, hashtags, expedientes, registros) para benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--usuarios', type=int, default=1000)
+        parser.add_argument('--hashtags', type=int, default=500)
+        parser.add_argument('--expedientes', type=int, default=10000)
+        parser.add_argument('--registros', type=int, default=200000)
+        parser.add_argument('--max-hashtags', type=int, default=3, help='Máximo de hashtags por registro')
+        parser.add_argument('--zipf', type=float, default=1.1, help='Exponente Zipf de usuarios y hashtags')
+        parser.add_argument('--inactivos', type=float, default=0.05, help='Fracción de expedientes y registros inactivos')
+        parser.add_argument('--dias', type=int, default=365, help='Días hacia atrás de las fechas de creación')
+        parser.add_argument('--hasta', help='Fecha final de las fechas de creación (YYYY-MM-DD). Por defecto hoy')
+        parser.add_argument('--seed', type=int, default=42, help='Semilla: misma semilla, mismos datos')
+        parser.add_argument('--procesos', type=int, default=multiprocessing.cpu_count(), help='Procesos worker')
+        parser.add_argument('--bloque', type=int, default=2000, help='Expedientes por bloque (y por transacción)')
+        parser.add_argument('--prefijo', default='carga', help='Prefijo de los usuarios y hashtags generados')
+        parser.add_argument(
+            '--sin-indice-busqueda',
+            action='store_true',
+            help='No actualiza el índice de búsqueda (ejecutar después backfill_search_index)',
+        )
+
+    def handle(self, *args, **options):
+        from movilizaciones.load_data import bloques, crear_catalogos, finalizar, sumar_contadores
+        from usuarios.models import Usuarios
+
+        for name in ('usuarios', 'expedientes', 'procesos', 'bloque', 'dias'):
+            if options[name] < 1:
+                raise CommandError(f"--{name} debe ser mayor a 0")
+        for name in ('hashtags', 'registros', 'max_hashtags'):
+            if options[name] < 0:
+                raise CommandError(f"--{name.replace('_', '-')} no puede ser negativo")
+        if not 0 <= options['inactivos'] <= 1:
+            raise CommandError('--inactivos debe estar entre 0 y 1')
+        if Usuarios.objects.filter(username__startswith=f"{options['prefijo']}_").exists():
+            raise CommandError(f"Ya existen usuarios con el prefijo {options['prefijo']}_; use otro --prefijo")
+
+        if options['hasta']:
+            try:
+                hasta = datetime.strptime(options['hasta'], '%Y-%m-%d')
+            except ValueError:
+                raise CommandError('--hasta debe tener el formato YYYY-MM-DD')
+        else:
+            hasta = datetime.combine(timezone.localdate(), dtime.min)
+        # Inicio del día siguiente: la misma fecha da las mismas marcas de tiempo
+        hasta = timezone.make_aware(hasta + timedelta(days=1))
+
+        procesos = options['procesos']
+        if connection.vendor == 'sqlite' and procesos > 1:
+            self.stdout.write('SQLite admite un solo escritor: se usa un proceso')
+            procesos = 1
+
+        inicio = time.monotonic()
+        self.stdout.write(f"Creando {options['usuarios']} usuarios y {options['hashtags']} hashtags...")
+        plan = crear_catalogos({
+            'seed': options['seed'],
+            'prefijo': options['prefijo'],
+            'usuarios': options['usuarios'],
+            'hashtags': options['hashtags'],
+            'expedientes': options['expedientes'],
+            'registros': options['registros'],
+            'max_hashtags': options['max_hashtags'],
+            'zipf': options['zipf'],
+            'inactivos': options['inactivos'],
+            'dias': options['dias'],
+            'hasta': hasta,
+            'bloque': options['bloque'],
+            'indexar': not options['sin_indice_busqueda'],
+        })
+
+        total_bloques = len(bloques(plan))
+        self.stdout.write(
+            f"Generando {options['expedientes']} expedientes y {options['registros']} registros "
+            f"en {total_bloques} bloques con {procesos} procesos..."
+        )
+        totales = [0, 0, 0]
+
+        def sumar(resultado):
+            expedientes, registros, enlaces, creadores, usos = resultado
+            sumar_contadores(creadores, usos)
+            for i, n in enumerate((expedientes, registros, enlaces)):
+                totales[i] += n
+            self.stdout.write(f'  {totales[0]} expedientes, {totales[1]} registros, {totales[2]} enlaces')
+
+        try:
+            if procesos == 1:
+                _iniciar_worker(plan)
+                for bloque in bloques(plan):
+                    sumar(_generar(bloque))
+            else:
+                # Los hijos no deben heredar las conexiones abiertas del padre
+                connections.close_all()
+                with multiprocessing.Pool(procesos, initializer=_iniciar_worker, initargs=(plan,)) as pool:
+                    for resultado in pool.imap_unordered(_generar, bloques(plan)):
+                        sumar(resultado)
+        except Exception:
+            self.stderr.write(
+                'La carga se interrumpió: los bloques completados quedan en la base de datos. '
+                'Ejecute reconcile_counters si los contadores quedaron desviados.'
+            )
+            raise
+        finally:
+            finalizar()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✓ {totales[0]} expedientes, {totales[1]} registros y {totales[2]} enlaces '
+            f'generados en {time.monotonic() - inicio:.1f}s (seed {options["seed"]})'
+        ))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from movilizaciones.models import Expedientes
+from movilizaciones.purge import eliminar_expediente, purgar_registros
+
+
+class Command(BaseCommand):
+    help = 'Elimina expedientes con sus registros por bloques (sin cargar la cascada completa en memoria)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('expedientes', type=int, nargs='+', help='Ids de los expedientes a eliminar')
+        parser.add_argument('--batch-size', type=int, default=None, help='Registros por transacción (PURGE_BATCH_SIZE)')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] is not None and options['batch_size'] < 1:
+            raise CommandError('--batch-size debe ser mayor a 0')
+
+        for expediente_id in options['expedientes']:
+            expediente = Expedientes.all_with_inactive.filter(pk=expediente_id).first()
+            if expediente is None:
+                self.stderr.write(f'Expediente {expediente_id} no existe')
+                continue
+            if expediente.activo:
+                expediente.activo = False
+                expediente.save(update_fields=['activo', 'updated_at'])
+            self.stdout.write(f'Purgando expediente {expediente_id} ({expediente.registros_count} registros)...')
+            registros = enlaces = 0
+            for batch_registros, batch_enlaces in purgar_registros(expediente_id, options['batch_size']):
+                registros += batch_registros
+                enlaces += batch_enlaces
+                self.stdout.write(f'  {registros} registros y {enlaces} enlaces eliminados')
+            eliminar_expediente(expediente_id)
+            self.stdout.write(self.style.SUCCESS(f'✓ Expediente {expediente_id} eliminado ({registros} registros)'))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from movilizaciones.counters import counter_definitions, reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recalcula por bloques los contadores desnormalizados que se hayan desviado'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help='Contadores a revisar (expedientes, catalogohashtag, usuarios). Por defecto todos.',
+        )
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--start-id', type=int, default=0, help='Reanuda a partir de este id')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError('--batch-size debe ser mayor a 0')
+
+        definitions = counter_definitions()
+        names = list(definitions)
+        if options['models']:
+            names = [name.lower() for name in options['models']]
+            unknown = [name for name in names if name not in definitions]
+            if unknown:
+                raise CommandError(f"Contadores desconocidos: {', '.join(unknown)}")
+
+        for name in names:
+            model, expressions = definitions[name]
+            self.stdout.write(f"Revisando {model._meta.verbose_name_plural} ({', '.join(expressions)})...")
+            checked = fixed = 0
+            for last_id, batch_checked, batch_fixed in reconcile(model, expressions, batch_size, options['start_id']):
+                checked += batch_checked
+                fixed += batch_fixed
+                self.stdout.write(f'  {checked} revisados, {fixed} corregidos (último id {last_id})')
+            self.stdout.write(self.style.SUCCESS(f'✓ {model._meta.verbose_name_plural}: {fixed} de {checked} corregidos'))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-18 00:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movilizaciones', '0003_remove_expedientes_descripcion'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expedientes',
+            index=models.Index(fields=['-created_at', '-id'], name='expedientes_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registro',
+            index=models.Index(fields=['-created_at', '-id'], name='registro_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registro',
+            index=models.Index(fields=['expedientes_id', '-created_at', '-id'], name='registro_exp_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.8 on 2026-10-18 00:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogos', '0001_initial'),
+        ('movilizaciones', '0004_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expedientes',
+            index=models.Index(fields=['usuarios_id', '-created_at'], name='expedientes_usr_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expedientes',
+            index=models.Index(condition=models.Q(('activo', True)), fields=['usuarios_id', '-created_at'], name='expedientes_activo_usr_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='hashtag_registro',
+            index=models.Index(fields=['id_registro', 'id_catalogo_hashtag'], name='hashtag_reg_registro_cat_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registro',
+            index=models.Index(fields=['creado_por', '-created_at'], name='registro_creador_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registro',
+            index=models.Index(condition=models.Q(('activo', True)), fields=['-created_at', '-id'], name='registro_activo_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registro',
+            index=models.Index(condition=models.Q(('activo', True)), fields=['fecha'], name='registro_activo_fecha_idx'),
+        ),
+        migrations.AlterField(
+            model_name='expedientes',
+            name='usuarios_id',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='expedientes', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='hashtag_registro',
+            name='id_registro',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='hashtag_registros', to='movilizaciones.registro'),
+        ),
+        migrations.AlterField(
+            model_name='registro',
+            name='creado_por',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='registros_creados', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+
+SEARCH_TABLES = {
+    # tabla: columnas indexadas
+    'registro': ['ubicacion', 'descripcion'],
+    'expedientes': ['asunto'],
+}
+
+
+def create_search_structures(apps, schema_editor):
+    """Crea la estructura de búsqueda de texto completo según el motor de base de datos"""
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+        schema_editor.execute("""
+            DO $$
+            BEGIN
+                CREATE TEXT SEARCH CONFIGURATION simem_es (COPY = spanish);
+                ALTER TEXT SEARCH CONFIGURATION simem_es
+                    ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+            EXCEPTION WHEN duplicate_object THEN
+                NULL;
+            END $$
+        """)
+        for table in SEARCH_TABLES:
+            schema_editor.execute(f'ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector')
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_search_gin ON {table} USING gin (search_vector)'
+            )
+    elif vendor == 'sqlite':
+        for table, columns in SEARCH_TABLES.items():
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5("
+                f"{', '.join(columns)}, tokenize='unicode61 remove_diacritics 2')"
+            )
+
+
+def drop_search_structures(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        for table in SEARCH_TABLES:
+            schema_editor.execute(f'DROP INDEX IF EXISTS {table}_search_gin')
+            schema_editor.execute(f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector')
+        schema_editor.execute('DROP TEXT SEARCH CONFIGURATION IF EXISTS simem_es')
+    elif vendor == 'sqlite':
+        for table in SEARCH_TABLES:
+            schema_editor.execute(f'DROP TABLE IF EXISTS {table}_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movilizaciones', '0005_access_pattern_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_structures, drop_search_structures),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+from helpers.trigram import TrigramIndexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movilizaciones', '0006_full_text_search'),
+    ]
+
+    operations = [
+        TrigramIndexes('registro', ['ubicacion']),
+        TrigramIndexes('expedientes', ['asunto']),
+    ]
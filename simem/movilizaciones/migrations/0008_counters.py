@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:02
+
+from django.db import migrations, models
+
+from movilizaciones.counters import counter_definitions, reconcile
+
+
+def populate_counters(apps, schema_editor):
+    """Calcula los contadores desnormalizados de los datos existentes"""
+    for model, expressions in counter_definitions(apps).values():
+        for _ in reconcile(model, expressions):
+            pass
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movilizaciones', '0007_trigram_indexes'),
+        ('catalogos', '0003_catalogohashtag_uso_count'),
+        ('usuarios', '0003_usuarios_registros_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expedientes',
+            name='registros_activos_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='expedientes',
+            name='registros_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
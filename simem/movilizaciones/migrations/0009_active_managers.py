@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:39
+
+import django.db.models.manager
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movilizaciones', '0008_counters'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='expedientes',
+            options={'default_manager_name': 'all_with_inactive', 'verbose_name': 'Expediente', 'verbose_name_plural': 'Expedientes'},
+        ),
+        migrations.AlterModelOptions(
+            name='registro',
+            options={'default_manager_name': 'all_with_inactive', 'verbose_name': 'Registro', 'verbose_name_plural': 'Registros'},
+        ),
+        migrations.AlterModelManagers(
+            name='expedientes',
+            managers=[
+                ('all_with_inactive', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='registro',
+            managers=[
+                ('all_with_inactive', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='registro',
+            index=models.Index(condition=models.Q(('activo', True)), fields=['expedientes_id', '-created_at', '-id'], name='registro_activo_exp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='registro',
+            index=models.Index(condition=models.Q(('activo', True)), fields=['creado_por', '-created_at'], name='registro_activo_creador_idx'),
+        ),
+    ]
@@ -1,24 +1,57 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from catalogos.models import CatalogoHashTag
+from helpers.managers import ActiveManager
 
 User = get_user_model()
 
+# Columnas que solo cambian con UPDATE ... SET col = col + n (movilizaciones.counters);
+# un save() completo no debe reescribirlas con el valor (quizá viejo) de la instancia
+COUNTER_FIELDS = frozenset({'registros_count', 'registros_activos_count'})
+
 
 class Expedientes(models.Model):
     """Modelo para gestionar expedientes"""
     id = models.AutoField(primary_key=True)
-    usuarios_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name='expedientes')
+    usuarios_id = models.ForeignKey(User, on_delete=models.CASCADE, related_name='expedientes', db_index=False)
     asunto = models.CharField(max_length=255)
     fecha_evento = models.DateTimeField()
     activo = models.BooleanField(default=True)
+    # Contadores desnormalizados (movilizaciones.counters)
+    registros_count = models.PositiveIntegerField(default=0, editable=False)
+    registros_activos_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Solo activos; las inactivas con all_with_inactive (helpers.managers)
+    objects = ActiveManager()
+    all_with_inactive = models.Manager()
+
     class Meta:
         db_table = 'expedientes'
         verbose_name = 'Expediente'
         verbose_name_plural = 'Expedientes'
+        default_manager_name = 'all_with_inactive'
+        indexes = [
+            # Orden de la paginación por cursor (-created_at, -id)
+            models.Index(fields=['-created_at', '-id'], name='expedientes_created_id_idx'),
+            # Listado por dueño; también cubre las búsquedas por la FK usuarios_id
+            models.Index(fields=['usuarios_id', '-created_at'], name='expedientes_usr_created_idx'),
+            models.Index(
+                fields=['usuarios_id', '-created_at'],
+                name='expedientes_activo_usr_idx',
+                condition=models.Q(activo=True),
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and not field.generated
+                and field.attname in self.__dict__ and field.attname not in COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.asunto} - {self.fecha_evento}"
@@ -28,7 +61,7 @@ class Registro(models.Model):
     """Modelo para registros con relación a expedientes y hashtags"""
     id = models.AutoField(primary_key=True)
     expedientes_id = models.ForeignKey(Expedientes, on_delete=models.CASCADE, related_name='registros')
-    creado_por = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='registros_creados')
+    creado_por = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='registros_creados', db_index=False)
     ubicacion = models.CharField(max_length=255)
     descripcion = models.TextField(null=True, blank=True)
     url_foto = models.URLField(null=True, blank=True)
@@ -38,10 +71,43 @@ class Registro(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Solo activos; las inactivas con all_with_inactive (helpers.managers)
+    objects = ActiveManager()
+    all_with_inactive = models.Manager()
+
     class Meta:
         db_table = 'registro'
         verbose_name = 'Registro'
         verbose_name_plural = 'Registros'
+        default_manager_name = 'all_with_inactive'
+        indexes = [
+            # Orden de la paginación por cursor (-created_at, -id)
+            models.Index(fields=['-created_at', '-id'], name='registro_created_id_idx'),
+            models.Index(fields=['expedientes_id', '-created_at', '-id'], name='registro_exp_created_id_idx'),
+            # Listado por creador; también cubre las búsquedas por la FK creado_por
+            models.Index(fields=['creado_por', '-created_at'], name='registro_creador_created_idx'),
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='registro_activo_created_idx',
+                condition=models.Q(activo=True),
+            ),
+            models.Index(
+                fields=['fecha'],
+                name='registro_activo_fecha_idx',
+                condition=models.Q(activo=True),
+            ),
+            # Lecturas de Registro.objects: registros de un expediente y listado por creador
+            models.Index(
+                fields=['expedientes_id', '-created_at', '-id'],
+                name='registro_activo_exp_idx',
+                condition=models.Q(activo=True),
+            ),
+            models.Index(
+                fields=['creado_por', '-created_at'],
+                name='registro_activo_creador_idx',
+                condition=models.Q(activo=True),
+            ),
+        ]
 
     def __str__(self):
         return f"Registro {self.id} - {self.ubicacion}"
@@ -51,7 +117,7 @@ class HashTag_Registro(models.Model):
     """Modelo de relación muchos a muchos entre Hashtags y Registros"""
     id = models.AutoField(primary_key=True)
     id_catalogo_hashtag = models.ForeignKey(CatalogoHashTag, on_delete=models.CASCADE, related_name='hashtag_registros')
-    id_registro = models.ForeignKey(Registro, on_delete=models.CASCADE, related_name='hashtag_registros')
+    id_registro = models.ForeignKey(Registro, on_delete=models.CASCADE, related_name='hashtag_registros', db_index=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -60,6 +126,10 @@ class HashTag_Registro(models.Model):
         verbose_name = 'Hashtag Registro'
         verbose_name_plural = 'Hashtag Registros'
         unique_together = ('id_catalogo_hashtag', 'id_registro')
+        indexes = [
+            # Cubre el prefetch de hashtags por registro (id_registro IN (...))
+            models.Index(fields=['id_registro', 'id_catalogo_hashtag'], name='hashtag_reg_registro_cat_idx'),
+        ]
 
     def __str__(self):
         return f"{self.id_catalogo_hashtag} - {self.id_registro}"
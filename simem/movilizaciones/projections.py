@@ -0,0 +1,60 @@
+from collections import defaultdict
+
+from catalogos.cache import hashtag_catalog
+from catalogos.models import CatalogoHashTag
+from helpers.projection import ProjectionSerializer
+from movilizaciones.models import HashTag_Registro
+from movilizaciones.serializers import HashTagRegistroSerializer, RegistroSerializer
+
+
+def hashtag_descripciones(hashtag_ids):
+    """{id: descripcion} desde la copia del catálogo; los ids que falten, con una consulta"""
+    descripciones = {pk: hashtag_catalog.descripcion(pk) for pk in set(hashtag_ids)}
+    missing = [pk for pk, descripcion in descripciones.items() if descripcion is None]
+    if missing:
+        descripciones.update(CatalogoHashTag.all_with_inactive.filter(pk__in=missing).values_list('id', 'descripcion'))
+    return descripciones
+
+
+class HashTagRegistroProjection(ProjectionSerializer):
+    """Salida idéntica a HashTagRegistroSerializer"""
+    serializer_class = HashTagRegistroSerializer
+    computed_fields = {'hashtag_descripcion': ['id_catalogo_hashtag_id']}
+
+    def get_hashtag_descripcion(self, rows):
+        index = self.columns.index('id_catalogo_hashtag_id')
+        descripciones = hashtag_descripciones(row[index] for row in rows)
+        return [descripciones[row[index]] for row in rows]
+
+
+class RegistroProjection(ProjectionSerializer):
+    """
+    Salida idéntica a RegistroSerializer. Los hashtags de la página se cargan con
+    una sola consulta IN, en el mismo orden que REGISTRO_LIST_PLAN (por id).
+    """
+    serializer_class = RegistroSerializer
+    computed_fields = {'hashtags': [], 'hashtag_nombres': []}
+
+    def _hashtags(self, rows):
+        # Una consulta por página (o por bloque, en streaming)
+        if getattr(self, '_hashtags_rows', None) is not rows:
+            # Sin request: ?fields= solo aplica a los registros
+            projection = HashTagRegistroProjection(
+                {key: value for key, value in self.context.items() if key != 'request'}
+            )
+            links = projection.queryset(
+                HashTag_Registro.objects.filter(id_registro_id__in=[row.pk for row in rows]).order_by('id')
+            )
+            by_registro = defaultdict(list)
+            for item in projection.to_representation(links):
+                by_registro[item['id_registro']].append(item)
+            self._hashtags_rows, self._hashtags_page = rows, by_registro
+        return self._hashtags_page
+
+    def get_hashtags(self, rows):
+        by_registro = self._hashtags(rows)
+        return [by_registro.get(row.pk, []) for row in rows]
+
+    def get_hashtag_nombres(self, rows):
+        by_registro = self._hashtags(rows)
+        return [[link['hashtag_descripcion'] for link in by_registro.get(row.pk, [])] for row in rows]
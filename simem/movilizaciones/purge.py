@@ -0,0 +1,94 @@
+"""
+Purga de expedientes por bloques.
+
+instance.delete() carga en memoria todos los registros y enlaces del expediente
+(el collector de Django) y mantiene los bloqueos durante toda la cascada. La
+purga (DELETE /expedientes/{id}/?purgar=true) solo marca el expediente inactivo
+y encola la tarea movilizaciones.purgar_expediente, que elimina los hijos en
+bloques de PURGE_BATCH_SIZE registros, cada uno en su propia transacción:
+
+    DELETE FROM hashtag_registro WHERE id_registro_id IN (...)
+    DELETE FROM registro WHERE id IN (...)
+
+Cada bloque bloquea sus registros (SELECT ... FOR UPDATE SKIP LOCKED) y los
+contadores de creadores y hashtags se descuentan con lo que devuelven los
+DELETE ... RETURNING, en la misma transacción: si dos tareas purgan el mismo
+expediente (una recuperada por TAREAS_TIMEOUT que seguía corriendo) cada fila se
+descuenta una sola vez, y un reintento continúa con los registros que quedan.
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from helpers.search import get_search_backend
+from movilizaciones import counters
+from movilizaciones.models import Expedientes, Registro, HashTag_Registro
+
+
+def _batch_size():
+    return getattr(settings, 'PURGE_BATCH_SIZE', 1000)
+
+
+def _delete_in(model, column, ids, returning):
+    """
+    DELETE ... WHERE column IN (ids) RETURNING returning, sin pasar por el
+    collector ni las señales. Retorna el valor de returning de cada fila eliminada.
+    """
+    quote = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {quote(model._meta.db_table)} WHERE {quote(column)} IN ({placeholders}) '
+            f'RETURNING {quote(model._meta.get_field(returning).column)}',
+            ids,
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _purgar_bloque(expediente_id, batch_size):
+    """
+    Elimina un bloque de registros del expediente con sus enlaces; debe llamarse
+    dentro de una transacción. Retorna (registros, enlaces) eliminados, o None si
+    no quedan registros sin bloquear.
+    """
+    ids = list(
+        Registro.all_with_inactive.select_for_update(skip_locked=True).filter(expedientes_id=expediente_id)
+        .order_by('pk').values_list('pk', flat=True)[:batch_size]
+    )
+    if not ids:
+        return None
+    link_column = HashTag_Registro._meta.get_field('id_registro').column
+    hashtags = _delete_in(HashTag_Registro, link_column, ids, 'id_catalogo_hashtag')
+    search = get_search_backend()
+    if search.tracks_deletes:
+        search.remove_from_index(Registro, ids)
+    creadores = _delete_in(Registro, Registro._meta.pk.column, ids, 'creado_por')
+    # Solo se descuentan las filas que este DELETE eliminó
+    counters.registros_borrados(Counter(creadores), Counter(hashtags))
+    return len(creadores), len(hashtags)
+
+
+def purgar_registros(expediente_id, batch_size=None):
+    """
+    Elimina por bloques los registros del expediente y sus enlaces con hashtags.
+    Genera (registros eliminados, enlaces eliminados) por bloque.
+    """
+    batch_size = batch_size or _batch_size()
+    while True:
+        with transaction.atomic():
+            eliminados = _purgar_bloque(expediente_id, batch_size)
+        if eliminados is None:
+            return
+        yield eliminados
+
+
+def eliminar_expediente(expediente_id):
+    """Elimina el expediente ya sin registros (la cascada no tiene filas que cargar)"""
+    with transaction.atomic():
+        if not Expedientes.all_with_inactive.select_for_update().filter(pk=expediente_id).exists():
+            return
+        # Registros que se hayan creado mientras corría la purga
+        while _purgar_bloque(expediente_id, _batch_size()) is not None:
+            pass
+        Expedientes.all_with_inactive.filter(pk=expediente_id).delete()
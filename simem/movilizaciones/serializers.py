@@ -1,19 +1,21 @@
 from rest_framework import serializers
 from movilizaciones.models import Expedientes, Registro, HashTag_Registro
 from catalogos.models import CatalogoHashTag
+from catalogos.cache import hashtag_catalog
+from helpers.search import SearchResultSerializerMixin
+from helpers.sparse import SparseFieldsetMixin
 
 
-class ExpedientesSerializer(serializers.ModelSerializer):
+class ExpedientesSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador completo para Expedientes"""
     class Meta:
         model = Expedientes
         fields = '__all__'
 
 
-class ExpedientesListSerializer(serializers.ModelSerializer):
+class ExpedientesListSerializer(SparseFieldsetMixin, SearchResultSerializerMixin, serializers.ModelSerializer):
     """Serializador para listar expedientes"""
     usuario_nombre = serializers.CharField(source='usuarios_id.nombre_completo', read_only=True)
-    registros_count = serializers.SerializerMethodField()
     created_at = serializers.DateTimeField(read_only=True)
 
     class Meta:
@@ -24,21 +26,17 @@ class ExpedientesListSerializer(serializers.ModelSerializer):
             'usuario_nombre',
             'asunto',
             'fecha_evento',
-            'descripcion',
             'created_at',
             'updated_at',
-            'registros_count'
+            'registros_count',
+            'registros_activos_count'
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_registros_count(self, obj):
-        return obj.registros.count()
 
-
-class ExpedientesDetailSerializer(serializers.ModelSerializer):
+class ExpedientesDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador detallado para expedientes"""
     usuario_nombre = serializers.CharField(source='usuarios_id.nombre_completo', read_only=True)
-    registros_count = serializers.SerializerMethodField()
     created_at = serializers.DateTimeField(read_only=True)
 
     class Meta:
@@ -49,16 +47,13 @@ class ExpedientesDetailSerializer(serializers.ModelSerializer):
             'usuario_nombre',
             'asunto',
             'fecha_evento',
-            'descripcion',
             'registros_count',
+            'registros_activos_count',
             'created_at',
             'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
 
-    def get_registros_count(self, obj):
-        return obj.registros.count()
-
 
 class ExpedientesCreateSerializer(serializers.ModelSerializer):
     """Serializador para crear expedientes"""
@@ -66,8 +61,7 @@ class ExpedientesCreateSerializer(serializers.ModelSerializer):
         model = Expedientes
         fields = [
             'asunto',
-            'fecha_evento',
-            'descripcion'
+            'fecha_evento'
         ]
 
     def create(self, validated_data):
@@ -75,9 +69,9 @@ class ExpedientesCreateSerializer(serializers.ModelSerializer):
         return expediente
 
 
-class HashTagRegistroSerializer(serializers.ModelSerializer):
+class HashTagRegistroSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador para la relación HashTag_Registro"""
-    hashtag_descripcion = serializers.CharField(source='id_catalogo_hashtag.descripcion', read_only=True)
+    hashtag_descripcion = serializers.SerializerMethodField()
 
     class Meta:
         model = HashTag_Registro
@@ -90,12 +84,22 @@ class HashTagRegistroSerializer(serializers.ModelSerializer):
             'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
+        field_dependencies = {'hashtag_descripcion': ['id_catalogo_hashtag']}
+
+    def get_hashtag_descripcion(self, obj):
+        descripcion = hashtag_catalog.descripcion(obj.id_catalogo_hashtag_id)
+        if descripcion is None:
+            # Hashtag creado en otro proceso y aún no presente en la copia
+            return obj.id_catalogo_hashtag.descripcion
+        return descripcion
 
 
-class RegistroSerializer(serializers.ModelSerializer):
+class RegistroSerializer(SparseFieldsetMixin, SearchResultSerializerMixin, serializers.ModelSerializer):
     """Serializador para listar registros"""
     usuario_nombre = serializers.CharField(source='creado_por.nombre_completo', read_only=True)
     hashtags = HashTagRegistroSerializer(source='hashtag_registros', many=True, read_only=True)
+    # Forma compacta de hashtags para listados (?fields=id,ubicacion,fecha,hashtag_nombres)
+    hashtag_nombres = serializers.SerializerMethodField()
     created_at = serializers.DateTimeField(read_only=True)
 
     class Meta:
@@ -112,13 +116,35 @@ class RegistroSerializer(serializers.ModelSerializer):
             'hora',
             'activo',
             'hashtags',
+            'hashtag_nombres',
             'created_at',
             'updated_at'
         ]
         read_only_fields = ['fecha', 'hora', 'created_at', 'updated_at']
+        # Solo con ?fields=...,hashtag_nombres (helpers.sparse)
+        optional_fields = ['hashtag_nombres']
+        field_dependencies = {'hashtag_nombres': ['hashtag_registros']}
 
+    def get_hashtag_nombres(self, obj):
+        # Enlaces precargados por REGISTRO_LIST_PLAN; descripciones de la copia del catálogo
+        nombres = []
+        for enlace in obj.hashtag_registros.all():
+            descripcion = hashtag_catalog.descripcion(enlace.id_catalogo_hashtag_id)
+            nombres.append(descripcion if descripcion is not None else enlace.id_catalogo_hashtag.descripcion)
+        return nombres
 
-class RegistroDetailSerializer(serializers.ModelSerializer):
+
+class RegistroIncludeSerializer(RegistroSerializer):
+    """Registro embebido con ?include=registros; los hashtags se embeben con registros.hashtags"""
+
+    class Meta(RegistroSerializer.Meta):
+        fields = [
+            field for field in RegistroSerializer.Meta.fields
+            if field not in ('hashtags', 'hashtag_nombres')
+        ]
+
+
+class RegistroDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador detallado para registros"""
     usuario_nombre = serializers.CharField(source='creado_por.nombre_completo', read_only=True)
     expediente = ExpedientesListSerializer(source='expedientes_id', read_only=True)
@@ -159,6 +185,8 @@ class RegistroCreateSerializer(serializers.ModelSerializer):
         ]
         extra_kwargs = {
             'activo': {'default': True},
+            # Igual que la carga masiva: no se agregan registros a expedientes inactivos
+            'expedientes_id': {'queryset': Expedientes.objects.all()},
         }
 
     def create(self, validated_data):
@@ -176,3 +204,27 @@ class RegistroUpdateSerializer(serializers.ModelSerializer):
             'url_foto',
             'activo'
         ]
+
+
+class RegistroBulkItemSerializer(serializers.ModelSerializer):
+    """
+    Serializador para validar cada elemento de la carga masiva de registros.
+    expedientes_id y hashtags se reciben como ids y se verifican por bloque
+    con una sola consulta IN, en lugar de una consulta por elemento.
+    """
+    expedientes_id = serializers.IntegerField(min_value=1)
+    hashtags = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False, default=list)
+
+    class Meta:
+        model = Registro
+        fields = [
+            'expedientes_id',
+            'ubicacion',
+            'descripcion',
+            'url_foto',
+            'activo',
+            'hashtags'
+        ]
+        extra_kwargs = {
+            'activo': {'default': True},
+        }
@@ -1,3 +1,236 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import caches
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from catalogos.cache import hashtag_catalog
+from catalogos.models import CatalogoHashTag
+from movilizaciones.counters import counter_definitions, reconcile
+from movilizaciones.models import Expedientes, HashTag_Registro, Registro
+from tareas.models import Tarea
+from tareas.queue import ejecutar, tomar
+from usuarios.models import Usuarios
+
+
+class MovilizacionesTestCase(TestCase):
+    """Usuario autenticado, un expediente y tres hashtags"""
+
+    def setUp(self):
+        caches['default'].clear()
+        hashtag_catalog.invalidate()
+        self.usuario = Usuarios.objects.create_user(
+            username='capturista', password='clave', apellido_paterno='Pérez', apellido_materno='López'
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.usuario)
+        self.expediente = Expedientes.objects.create(
+            usuarios_id=self.usuario, asunto='Marcha', fecha_evento=timezone.now()
+        )
+        self.hashtags = [CatalogoHashTag.objects.create(descripcion=f'tag{i}') for i in range(3)]
+
+    def crear_registro(self, expediente=None, hashtags=(), **kwargs):
+        registro = Registro.objects.create(
+            expedientes_id=expediente or self.expediente, creado_por=self.usuario, ubicacion='Centro', **kwargs
+        )
+        for hashtag in hashtags:
+            HashTag_Registro.objects.create(id_registro=registro, id_catalogo_hashtag=hashtag)
+        return registro
+
+    def assertContadores(self, registros, activos, usos, creados=None):
+        self.expediente.refresh_from_db()
+        self.usuario.refresh_from_db()
+        self.assertEqual(self.expediente.registros_count, registros)
+        self.assertEqual(self.expediente.registros_activos_count, activos)
+        self.assertEqual(self.usuario.registros_count, registros if creados is None else creados)
+        self.assertEqual(
+            [hashtag.uso_count for hashtag in CatalogoHashTag.all_with_inactive.order_by('pk')], usos
+        )
+        # Los contadores coinciden con lo que recalcula reconcile_counters
+        for name, (model, expressions) in counter_definitions().items():
+            fixed = sum(batch_fixed for _, _, batch_fixed in reconcile(model, expressions))
+            self.assertEqual(fixed, 0, name)
+
+
+class CountersTests(MovilizacionesTestCase):
+    """Contadores desnormalizados (movilizaciones.counters) y su sincronización con señales"""
+
+    def test_guardados_individuales(self):
+        registro = self.crear_registro(hashtags=self.hashtags[:2])
+        self.assertContadores(1, 1, [1, 1, 0])
+
+        registro.activo = False
+        registro.save()
+        self.assertContadores(1, 0, [1, 1, 0])
+
+        otro = Expedientes.objects.create(usuarios_id=self.usuario, asunto='Mitin', fecha_evento=timezone.now())
+        registro.expedientes_id = otro
+        registro.save()
+        otro.refresh_from_db()
+        self.assertEqual((otro.registros_count, otro.registros_activos_count), (1, 0))
+        self.assertContadores(0, 0, [1, 1, 0], creados=1)
+
+    def test_save_no_reescribe_contadores(self):
+        self.crear_registro(hashtags=self.hashtags[:1])
+        expediente = Expedientes.objects.get(pk=self.expediente.pk)
+        hashtag = CatalogoHashTag.objects.get(pk=self.hashtags[0].pk)
+        self.crear_registro(hashtags=self.hashtags[:1])
+        # Instancias con contadores viejos
+        expediente.asunto = 'Marcha actualizada'
+        expediente.save()
+        hashtag.descripcion = 'tag0 actualizado'
+        hashtag.save()
+        self.assertContadores(2, 2, [2, 0, 0])
+
+    def test_reconcile_counters(self):
+        self.crear_registro(hashtags=self.hashtags[:2])
+        self.crear_registro(hashtags=self.hashtags[1:])
+        Expedientes.all_with_inactive.update(registros_count=7, registros_activos_count=0)
+        CatalogoHashTag.all_with_inactive.update(uso_count=0)
+        Usuarios.objects.update(registros_count=99)
+
+        out = StringIO()
+        call_command('reconcile_counters', '--batch-size', '2', stdout=out)
+        self.assertIn('Expedientes: 1 de 1 corregidos', out.getvalue())
+        self.assertContadores(2, 2, [1, 2, 1])
+
+
+class BulkTests(MovilizacionesTestCase):
+    """Creación masiva de registros y bulk_hashtags"""
+
+    def bulk_hashtags(self, operacion, registros, hashtags):
+        response = self.client.post(
+            '/api/v1/registros/bulk_hashtags/',
+            {'operacion': operacion, 'registros': registros, 'hashtags': hashtags},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def test_bulk_cuenta_registros_y_hashtags(self):
+        items = [
+            {'expedientes_id': self.expediente.pk, 'ubicacion': 'Centro', 'hashtags': [self.hashtags[0].pk]},
+            {'expedientes_id': self.expediente.pk, 'ubicacion': 'Norte', 'activo': False,
+             'hashtags': [self.hashtags[0].pk, self.hashtags[1].pk]},
+            {'expedientes_id': 999999, 'ubicacion': 'Sur'},
+        ]
+        response = self.client.post('/api/v1/registros/bulk/', items, format='json')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual((data['created'], data['failed']), (2, 1))
+        self.assertContadores(2, 1, [2, 1, 0])
+
+    def test_agregar_solo_cuenta_enlaces_insertados(self):
+        registros = [self.crear_registro(hashtags=self.hashtags[:1]).pk for _ in range(2)]
+        data = self.bulk_hashtags('agregar', registros, [self.hashtags[0].pk, self.hashtags[1].pk])
+        # tag0 ya estaba enlazado: solo se insertan y cuentan los enlaces de tag1
+        self.assertEqual(data, {'created': 2, 'removed': 0})
+        self.assertContadores(2, 2, [2, 2, 0])
+        data = self.bulk_hashtags('agregar', registros, [self.hashtags[1].pk])
+        self.assertEqual(data, {'created': 0, 'removed': 0})
+        self.assertContadores(2, 2, [2, 2, 0])
+
+    def test_reemplazar_y_remover(self):
+        registros = [self.crear_registro(hashtags=self.hashtags[:2]).pk for _ in range(2)]
+        data = self.bulk_hashtags('reemplazar', registros, [self.hashtags[1].pk, self.hashtags[2].pk])
+        self.assertEqual(data, {'created': 2, 'removed': 2})
+        self.assertContadores(2, 2, [0, 2, 2])
+        data = self.bulk_hashtags('remover', registros[:1], [self.hashtags[2].pk])
+        self.assertEqual(data, {'created': 0, 'removed': 1})
+        self.assertContadores(2, 2, [0, 2, 1])
+        data = self.bulk_hashtags('reemplazar', registros, [])
+        self.assertEqual(data, {'created': 0, 'removed': 3})
+        self.assertContadores(2, 2, [0, 0, 0])
+
+
+class EliminacionTests(MovilizacionesTestCase):
+    """Contadores tras el borrado lógico y la purga de expedientes"""
+
+    def test_borrado_logico_de_registro(self):
+        registro = self.crear_registro(hashtags=self.hashtags[:1])
+        self.crear_registro()
+        response = self.client.delete(f'/api/v1/registros/{registro.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertContadores(2, 1, [1, 0, 0])
+
+    def test_eliminar_expediente(self):
+        for _ in range(2):
+            self.crear_registro(hashtags=self.hashtags[:2])
+        response = self.client.delete(f'/api/v1/expedientes/{self.expediente.pk}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Expedientes.all_with_inactive.filter(pk=self.expediente.pk).exists())
+        self.usuario.refresh_from_db()
+        self.assertEqual(self.usuario.registros_count, 0)
+        self.assertEqual([hashtag.uso_count for hashtag in CatalogoHashTag.objects.order_by('pk')], [0, 0, 0])
+
+    def test_purga(self):
+        for _ in range(3):
+            self.crear_registro(hashtags=self.hashtags[:2])
+        url = f'/api/v1/expedientes/{self.expediente.pk}/?purgar=true'
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, 202)
+        # Una segunda petición devuelve la misma tarea en lugar de encolar otra
+        # (el expediente ya está inactivo: solo un superuser lo ve)
+        self.usuario.is_superuser = True
+        self.usuario.save()
+        self.assertEqual(self.client.delete(url)['Location'], response['Location'])
+        self.assertEqual(Tarea.objects.count(), 1)
+
+        with self.settings(PURGE_BATCH_SIZE=2):
+            self.assertTrue(ejecutar(tomar('worker-1')))
+        tarea = Tarea.objects.get()
+        self.assertEqual(tarea.resultado['registros_eliminados'], 3)
+        self.assertEqual(tarea.resultado['enlaces_eliminados'], 6)
+        self.assertFalse(Expedientes.all_with_inactive.filter(pk=self.expediente.pk).exists())
+        self.usuario.refresh_from_db()
+        self.assertEqual(self.usuario.registros_count, 0)
+        self.assertEqual([hashtag.uso_count for hashtag in CatalogoHashTag.objects.order_by('pk')], [0, 0, 0])
+
+
+class LecturasTests(MovilizacionesTestCase):
+    """Paginación por cursor y GET condicional"""
+
+    def test_paginacion_por_cursor(self):
+        inicio = timezone.now() - timedelta(days=1)
+        for posicion in range(25):
+            registro = self.crear_registro()
+            # Registros en pares con el mismo created_at: el desempate es por id
+            Registro.all_with_inactive.filter(pk=registro.pk).update(created_at=inicio + timedelta(minutes=posicion // 2))
+        esperados = list(Registro.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+
+        vistos = []
+        paginas = 0
+        url = '/api/v1/registros/?paginacion=cursor'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()['data']
+            vistos.extend(item['id'] for item in data['results'])
+            url = data['next']
+            paginas += 1
+        self.assertEqual(vistos, esperados)
+        self.assertEqual(paginas, 2)
+
+        # previous regresa a la primera página
+        response = self.client.get(data['previous'])
+        self.assertEqual([item['id'] for item in response.json()['data']['results']], esperados[:20])
+
+    def test_cursor_invalido(self):
+        response = self.client.get('/api/v1/registros/?cursor=no-es-un-cursor')
+        self.assertEqual(response.status_code, 400)
 
-# Create your tests here.
+    def test_get_condicional(self):
+        self.crear_registro()
+        url = f'/api/v1/expedientes/{self.expediente.pk}/'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Un registro nuevo cambia los contadores y con ellos el ETag
+        self.crear_registro()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
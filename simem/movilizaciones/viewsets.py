@@ -1,10 +1,14 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.parsers import JSONParser
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.db import transaction
-from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.db.models import Q, Count, Max, Prefetch, Subquery
 from django.core.exceptions import ObjectDoesNotExist
 
 from movilizaciones.models import Expedientes, Registro, HashTag_Registro
@@ -14,12 +18,14 @@ from movilizaciones.serializers import (
     ExpedientesDetailSerializer,
     ExpedientesCreateSerializer,
     RegistroSerializer,
+    RegistroIncludeSerializer,
     RegistroDetailSerializer,
     RegistroCreateSerializer,
     RegistroUpdateSerializer,
     HashTagRegistroSerializer
 )
 from movilizaciones.filters import ExpedientesFilter, RegistroFilter, HashTagRegistroFilter
+from helpers.async_views import AsyncReadMixin, run_read
 from helpers.exceptions import BadRequest, NotFound
 from helpers.responses import (
     ok_response,
@@ -27,9 +33,100 @@ from helpers.responses import (
     no_content_response,
 )
 from helpers.errors import error
-
-
-class ExpedientesViewSet(viewsets.ModelViewSet):
+from helpers.query_plans import QueryPlanMixin
+from helpers.pagination import KeysetPagination, KeysetPaginationMixin
+from helpers.search import FullTextSearchFilter
+from helpers.parsers import NDJSONParser
+from movilizaciones import counters
+from movilizaciones.bulk import bulk_create_registros, bulk_set_hashtags, HASHTAG_OPERACIONES
+from movilizaciones.export import stream_export, EXPORT_FORMATS
+from catalogos.cache import hashtag_catalog
+from catalogos.models import CatalogoHashTag
+from helpers.conditional import conditional_get, latest
+from helpers.includes import IncludeMixin
+from helpers.managers import visible_manager
+from helpers.projection import ProjectionMixin
+from helpers.streaming import iter_serialized, ok_streaming_response
+from movilizaciones.projections import HashTagRegistroProjection, RegistroProjection
+from usuarios.serializers import UsuariosRetrieveSerializer
+from tareas.models import Tarea
+from tareas.queue import encolar
+from tareas.viewsets import tarea_aceptada
+
+
+# Plan de consulta para serializar registros con RegistroSerializer.
+# hashtag_descripcion se resuelve con la copia en memoria del catálogo (catalogos.cache);
+# los hashtags van por id, igual que en RegistroProjection
+REGISTRO_LIST_PLAN = {
+    'select_related': ['creado_por'],
+    'prefetch_related': [Prefetch('hashtag_registros', queryset=HashTag_Registro.objects.order_by('id'))],
+}
+
+# ?include= (helpers.includes): una consulta por relación a muchos, JOIN para las relaciones a uno
+USUARIO_INCLUDE = {'serializer': UsuariosRetrieveSerializer}
+
+EXPEDIENTE_INCLUDES = {
+    'usuario': {**USUARIO_INCLUDE, 'select_related': 'usuarios_id'},
+    'registros': {
+        'prefetch': 'registros',
+        # Los superusers también embeben los registros inactivos, como en /expedientes/{id}/registros/
+        'queryset': lambda request: (
+            visible_manager(Registro, request.user).select_related('creado_por').order_by('-created_at', '-id')
+        ),
+        'serializer': RegistroIncludeSerializer,
+        'includes': {
+            'hashtags': {
+                'prefetch': 'hashtag_registros',
+                'queryset': HashTag_Registro.objects.order_by('id'),
+                'serializer': HashTagRegistroSerializer,
+            },
+        },
+    },
+}
+
+REGISTRO_INCLUDES = {
+    'usuario': {**USUARIO_INCLUDE, 'select_related': 'creado_por'},
+    'expediente': {
+        'select_related': 'expedientes_id',
+        'related': ['usuarios_id'],
+        'serializer': ExpedientesListSerializer,
+    },
+}
+
+
+def expediente_validators(view, request, pk=None):
+    """Validadores del detalle: updated_at del expediente y sus contadores"""
+    if view.get_include_tree():
+        # Con ?include= la respuesta depende de registros y usuario: sin 304
+        return None
+    row = view.get_visible_queryset().filter(pk=pk).values_list(
+        'updated_at', 'registros_count', 'registros_activos_count'
+    ).first()
+    if row is None:
+        return None
+    return row
+
+
+def expediente_registros_validators(view, request, pk=None):
+    """
+    Validadores de /expedientes/{id}/registros/ en una sola consulta: MAX(updated_at)
+    y conteo de registros y de sus hashtags, más la última modificación del catálogo
+    (hashtag_descripcion forma parte de la respuesta).
+    """
+    row = view.get_visible_queryset().filter(pk=pk).values('pk').annotate(
+        registros_updated=Max('registros__updated_at'),
+        registros_total=Count('registros', distinct=True),
+        hashtags_updated=Max('registros__hashtag_registros__updated_at'),
+        hashtags_total=Count('registros__hashtag_registros'),
+        catalogo_updated=Subquery(CatalogoHashTag.all_with_inactive.order_by('-updated_at').values('updated_at')[:1]),
+    ).order_by('pk').first()
+    if row is None:
+        return None
+    last_modified = latest(row['registros_updated'], row['hashtags_updated'], row['catalogo_updated'])
+    return last_modified, row['registros_total'], row['hashtags_total']
+
+
+class ExpedientesViewSet(AsyncReadMixin, IncludeMixin, KeysetPaginationMixin, QueryPlanMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar expedientes.
     Permite CRUD completo sobre expedientes del sistema.
@@ -37,11 +134,18 @@ class ExpedientesViewSet(viewsets.ModelViewSet):
     queryset = Expedientes.objects.all()
     serializer_class = ExpedientesSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    # La búsqueda (?search=) usa el documento registrado en MovilizacionesConfig.ready
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_class = ExpedientesFilter
-    search_fields = ['asunto', 'descripcion']
-    ordering_fields = ['fecha_evento', 'created_at']
+    ordering_fields = ['fecha_evento', 'created_at', 'registros_count']
     ordering = ['-created_at']
+    keyset_actions = ['list', 'registros']
+    async_actions = ('list', 'retrieve', 'registros')
+    query_plans = {
+        'list': {'select_related': ['usuarios_id']},
+        'retrieve': {'select_related': ['usuarios_id']},
+    }
+    include_options = EXPEDIENTE_INCLUDES
 
     def get_serializer_class(self):
         """Retorna el serializador según la acción"""
@@ -52,11 +156,15 @@ class ExpedientesViewSet(viewsets.ModelViewSet):
         }
         return serializers_map.get(self.action, self.serializer_class)
 
+    def get_visible_queryset(self):
+        """Expedientes que puede ver el usuario, sin plan de consulta (los inactivos solo superusers)"""
+        if self.request.user.is_superuser:
+            return Expedientes.all_with_inactive.all()
+        return Expedientes.objects.filter(usuarios_id=self.request.user)
+
     def get_queryset(self):
         """Filtra expedientes según permisos"""
-        if self.request.user.is_superuser:
-            return Expedientes.objects.all().order_by('-created_at')
-        return Expedientes.objects.filter(usuarios_id=self.request.user).order_by('-created_at')
+        return self.apply_includes(self.apply_query_plan(self.get_visible_queryset().order_by('-created_at')))
 
     def get_object(self):
         """Obtiene un objeto con manejo de excepciones"""
@@ -69,21 +177,33 @@ class ExpedientesViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         """Lista expedientes con paginación"""
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_list_queryset()
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return ok_response(data=self.get_paginated_response(serializer.data).data)
-        serializer = self.get_serializer(queryset, many=True)
-        return ok_response(data=serializer.data)
+            return self.list_response(page, paginated=True)
+        return self.list_response(queryset)
 
+    def list_response(self, objects, paginated=False):
+        serializer = self.get_serializer(objects, many=True)
+        data = self.include_data(objects, serializer.data)
+        if paginated:
+            data = self.get_paginated_response(data).data
+        return ok_response(data=data)
+
+    @conditional_get(expediente_validators)
     def retrieve(self, request, pk=None):
         """Obtiene un expediente específico"""
-        instance = self.get_object()
+        return self.retrieve_response(self.get_object())
+
+    @conditional_get(expediente_validators)
+    async def aretrieve(self, request, pk=None):
+        return await super().aretrieve(request, pk=pk)
+
+    def retrieve_response(self, instance):
         if not instance:
             raise NotFound()
         serializer = self.get_serializer(instance)
-        return ok_response(data=serializer.data)
+        return ok_response(data=self.include_data([instance], [serializer.data])[0])
 
     @transaction.atomic
     def create(self, request, *args, **kwargs):
@@ -116,25 +236,86 @@ class ExpedientesViewSet(viewsets.ModelViewSet):
 
     @transaction.atomic
     def destroy(self, request, *args, **kwargs):
-        """Eliminar expediente"""
+        """
+        Eliminar expediente.
+        Con ?purgar=true se desactiva de inmediato y sus registros se eliminan por
+        bloques en segundo plano (movilizaciones.purge); responde 202 con la tarea.
+        """
         instance = self.get_object()
         if not instance:
             raise NotFound()
+        if request.query_params.get('purgar') == 'true':
+            # El bloqueo serializa peticiones simultáneas: una sola tarea por expediente
+            Expedientes.all_with_inactive.select_for_update().filter(pk=instance.pk).exists()
+            tarea = Tarea.objects.filter(
+                tipo='movilizaciones.purgar_expediente',
+                estado__in=[Tarea.PENDIENTE, Tarea.EN_PROCESO],
+                parametros__expediente_id=instance.pk,
+            ).order_by('pk').first()
+            if tarea:
+                return tarea_aceptada(request, tarea, message='La purga del expediente ya está en curso')
+            instance.activo = False
+            instance.save(update_fields=['activo', 'updated_at'])
+            tarea = encolar(
+                'movilizaciones.purgar_expediente',
+                {'expediente_id': instance.pk, 'total': instance.registros_count},
+                usuario=request.user,
+            )
+            return tarea_aceptada(request, tarea, message='Expediente desactivado, sus registros se eliminan en segundo plano')
+        # El DELETE en cascada no envía señales: se descuentan creadores y hashtags antes
+        counters.registros_eliminados(instance.registros.all())
         instance.delete()
         return ok_response(data=None, message='Expediente eliminado correctamente')
 
     @action(detail=True, methods=['get'])
+    @conditional_get(expediente_registros_validators)
     def registros(self, request, pk=None):
         """Obtiene todos los registros asociados a un expediente"""
-        expediente = self.get_object()
+        # ?fields= / ?exclude= se refieren a los registros, no al expediente
+        expediente = self.get_visible_queryset().filter(pk=pk).first()
         if not expediente:
             raise NotFound()
-        registros = expediente.registros.all().order_by('-created_at')
-        serializer = RegistroSerializer(registros, many=True)
-        return ok_response(data=serializer.data)
+        registros = self.registros_queryset(expediente)
+        if KeysetPagination.is_requested(request):
+            return self.registros_page_response(self.paginate_queryset(registros))
+        return ok_streaming_response(request, self.registros_rows(registros))
+
+    @conditional_get(expediente_registros_validators)
+    async def aregistros(self, request, pk=None):
+        expediente = await run_read(self.get_visible_queryset().filter(pk=pk).first)
+        if not expediente:
+            raise NotFound()
+        registros = self.registros_queryset(expediente)
+        if KeysetPagination.is_requested(request):
+            page = await self.apaginate_queryset(registros)
+            return await sync_to_async(self.registros_page_response)(page)
+        return await sync_to_async(ok_streaming_response)(request, self.registros_rows(registros), asynchronous=True)
+
+    def registros_queryset(self, expediente):
+        # El manager en lugar de expediente.registros: el related manager
+        # lee la FK de cada fila, que con ?fields= puede quedar diferida
+        return self.apply_query_plan(
+            visible_manager(Registro, self.request.user).filter(expedientes_id=expediente).order_by('-created_at'),
+            plan=REGISTRO_LIST_PLAN,
+            serializer_class=RegistroSerializer,
+        )
+
+    def registros_page_response(self, page):
+        serializer = RegistroSerializer(page, many=True, context=self.get_serializer_context())
+        return ok_response(data=self.get_paginated_response(serializer.data).data)
+
+    def registros_rows(self, registros):
+        """Registros sin paginar, por bloques para la respuesta en streaming (helpers.streaming)"""
+        context = self.get_serializer_context()
+        if getattr(settings, 'API_LIST_PROJECTIONS', True):
+            projection = RegistroProjection(context)
+            return iter_serialized(projection.queryset(registros), projection.to_representation)
+        return iter_serialized(
+            registros, lambda chunk: RegistroSerializer(chunk, many=True, context=context).data
+        )
 
 
-class RegistroViewSet(viewsets.ModelViewSet):
+class RegistroViewSet(AsyncReadMixin, ProjectionMixin, IncludeMixin, KeysetPaginationMixin, QueryPlanMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar registros de movilizaciones.
     Permite CRUD completo sobre registros del sistema.
@@ -142,11 +323,21 @@ class RegistroViewSet(viewsets.ModelViewSet):
     queryset = Registro.objects.all()
     serializer_class = RegistroSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    # La búsqueda (?search=) usa el documento registrado en MovilizacionesConfig.ready
+    filter_backends = [DjangoFilterBackend, OrderingFilter, FullTextSearchFilter]
     filterset_class = RegistroFilter
-    search_fields = ['ubicacion', 'descripcion']
     ordering_fields = ['fecha', 'hora', 'created_at']
     ordering = ['-created_at']
+    query_plans = {
+        'list': REGISTRO_LIST_PLAN,
+        'retrieve': {
+            'select_related': ['creado_por', 'expedientes_id__usuarios_id'],
+            'prefetch_related': REGISTRO_LIST_PLAN['prefetch_related'],
+        },
+    }
+    include_options = REGISTRO_INCLUDES
+    # list se arma desde values_list() (helpers.projection)
+    projection_class = RegistroProjection
 
     def get_serializer_class(self):
         """Retorna el serializador según la acción"""
@@ -160,12 +351,14 @@ class RegistroViewSet(viewsets.ModelViewSet):
         return serializers_map.get(self.action, self.serializer_class)
 
     def get_queryset(self):
-        """Filtra registros según permisos"""
+        """Filtra registros según permisos (los inactivos solo superusers)"""
         if self.request.user.is_superuser:
-            return Registro.objects.all().order_by('-created_at')
-        return Registro.objects.filter(
-            Q(creado_por=self.request.user) | Q(expedientes_id__usuarios_id=self.request.user)
-        ).order_by('-created_at')
+            queryset = Registro.all_with_inactive.all().order_by('-created_at')
+        else:
+            queryset = Registro.objects.filter(
+                Q(creado_por=self.request.user) | Q(expedientes_id__usuarios_id=self.request.user)
+            ).order_by('-created_at')
+        return self.apply_includes(self.apply_query_plan(queryset))
 
     def get_object(self):
         """Obtiene un objeto con manejo de excepciones"""
@@ -176,23 +369,36 @@ class RegistroViewSet(viewsets.ModelViewSet):
         except ObjectDoesNotExist:
             return None
 
+    def get_list_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        projection = self.get_projection()
+        if projection is not None:
+            queryset = projection.queryset(queryset)
+        return queryset
+
     def list(self, request, *args, **kwargs):
         """Lista registros con paginación"""
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_list_queryset()
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return ok_response(data=self.get_paginated_response(serializer.data).data)
-        serializer = self.get_serializer(queryset, many=True)
-        return ok_response(data=serializer.data)
+            return self.list_response(page, paginated=True)
+        return self.list_response(queryset)
+
+    def list_response(self, objects, paginated=False):
+        data = self.include_data(objects, self.serialize_list(objects, self.get_projection()))
+        if paginated:
+            data = self.get_paginated_response(data).data
+        return ok_response(data=data)
 
     def retrieve(self, request, pk=None):
         """Obtiene un registro específico"""
-        instance = self.get_object()
+        return self.retrieve_response(self.get_object())
+
+    def retrieve_response(self, instance):
         if not instance:
             raise NotFound()
         serializer = self.get_serializer(instance)
-        return ok_response(data=serializer.data)
+        return ok_response(data=self.include_data([instance], [serializer.data])[0])
 
     @transaction.atomic
     def create(self, request, *args, **kwargs):
@@ -233,6 +439,81 @@ class RegistroViewSet(viewsets.ModelViewSet):
         instance.save()
         return ok_response(data=None, message='Registro desactivado correctamente')
 
+    @action(detail=False, methods=['post'], parser_classes=[JSONParser, NDJSONParser])
+    def bulk(self, request):
+        """Crear registros de forma masiva (arreglo JSON o NDJSON)"""
+        items = request.data
+        if isinstance(items, (dict, str)):
+            raise BadRequest({'error': 'Se esperaba un arreglo de registros'})
+        results = bulk_create_registros(items, request.user)
+        created = sum(1 for result in results if result['status'] == 201)
+        data = {
+            'created': created,
+            'failed': len(results) - created,
+            'results': results,
+        }
+        return ok_response(data=data, message=f'{created} de {len(results)} registros guardados')
+
+    @action(detail=False, methods=['get', 'post'])
+    def exportar(self, request):
+        """
+        Exporta en streaming (?formato=csv|ndjson) los registros visibles que
+        cumplen los filtros, por ejemplo ?expedientes_id=1.
+        Con POST (mismos parámetros) la exportación se encola y responde 202 con
+        la tarea; el archivo se descarga en /tareas/{id}/descargar/.
+        """
+        formato = request.query_params.get('formato', 'csv')
+        if formato not in EXPORT_FORMATS:
+            raise BadRequest({'formato': f"Debe ser uno de: {', '.join(EXPORT_FORMATS)}"})
+        # También valida los filtros (400) antes de encolar
+        queryset = self.filter_queryset(self.get_queryset()).order_by('id')
+        if request.method == 'POST':
+            filtros = {key: value for key, value in request.query_params.dict().items() if key != 'formato'}
+            tarea = encolar(
+                'movilizaciones.exportar_registros',
+                {'formato': formato, 'filtros': filtros},
+                usuario=request.user,
+            )
+            return tarea_aceptada(request, tarea, message='Exportación en proceso')
+
+        response = StreamingHttpResponse(stream_export(queryset, formato), content_type=EXPORT_FORMATS[formato])
+        response['Content-Disposition'] = f'attachment; filename="registros.{formato}"'
+        return response
+
+    @action(detail=False, methods=['post'])
+    def bulk_hashtags(self, request):
+        """Agregar, remover o reemplazar N hashtags en M registros"""
+        if not isinstance(request.data, dict):
+            raise BadRequest({'error': 'Se esperaba un objeto JSON'})
+        operacion = request.data.get('operacion', 'agregar')
+        registro_ids = request.data.get('registros')
+        hashtag_ids = request.data.get('hashtags')
+
+        if operacion not in HASHTAG_OPERACIONES:
+            raise BadRequest({'operacion': f"Debe ser una de: {', '.join(HASHTAG_OPERACIONES)}"})
+        if not isinstance(registro_ids, list) or not registro_ids:
+            raise BadRequest({'registros': 'Se requiere una lista de ids de registros'})
+        if not isinstance(hashtag_ids, list) or (not hashtag_ids and operacion != 'reemplazar'):
+            raise BadRequest({'hashtags': 'Se requiere una lista de ids de hashtags'})
+        try:
+            registro_ids = list(dict.fromkeys(int(registro_id) for registro_id in registro_ids))
+            hashtag_ids = list(dict.fromkeys(int(hashtag_id) for hashtag_id in hashtag_ids))
+        except (TypeError, ValueError):
+            raise BadRequest({'error': 'Los ids deben ser números enteros'})
+
+        visibles = set(self.get_queryset().filter(pk__in=registro_ids).values_list('pk', flat=True))
+        no_encontrados = [registro_id for registro_id in registro_ids if registro_id not in visibles]
+        if no_encontrados:
+            raise BadRequest({'registros': f'Registros no encontrados: {no_encontrados}'})
+
+        if operacion != 'remover' and hashtag_ids:
+            faltantes = hashtag_catalog.missing_activos(hashtag_ids)
+            if faltantes:
+                raise BadRequest({'hashtags': f'Hashtags no encontrados o inactivos: {faltantes}'})
+
+        data = bulk_set_hashtags(registro_ids, hashtag_ids, operacion)
+        return ok_response(data=data, message='Hashtags actualizados correctamente')
+
     @action(detail=True, methods=['post'])
     def agregar_hashtag(self, request, pk=None):
         """Agregar un hashtag a un registro"""
@@ -244,6 +525,12 @@ class RegistroViewSet(viewsets.ModelViewSet):
 
         if not hashtag_id:
             raise BadRequest({'error': 'id_catalogo_hashtag es requerido'})
+        try:
+            hashtag_id = int(hashtag_id)
+        except (TypeError, ValueError):
+            raise BadRequest({'id_catalogo_hashtag': 'Debe ser un número entero'})
+        if hashtag_catalog.missing_activos([hashtag_id]):
+            raise BadRequest({'id_catalogo_hashtag': 'Hashtag no encontrado o inactivo'})
 
         try:
             hashtag_registro, created = HashTag_Registro.objects.get_or_create(
@@ -273,13 +560,14 @@ class RegistroViewSet(viewsets.ModelViewSet):
                 id_registro=registro
             ).delete()
             if deleted_count > 0:
+                counters.hashtags_desenlazados({int(hashtag_id): deleted_count})
                 return ok_response(data=None, message='Hashtag removido correctamente')
             raise NotFound()
         except Exception as e:
             raise BadRequest({'error': str(e)})
 
 
-class HashTagRegistroViewSet(viewsets.ModelViewSet):
+class HashTagRegistroViewSet(AsyncReadMixin, ProjectionMixin, QueryPlanMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar la relación entre hashtags y registros.
     """
@@ -289,6 +577,14 @@ class HashTagRegistroViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_class = HashTagRegistroFilter
     ordering = ['-created_at']
+    # hashtag_descripcion sale de la copia en memoria del catálogo; no se necesita el JOIN
+    query_plans = {}
+    # list se arma desde values_list() (helpers.projection)
+    projection_class = HashTagRegistroProjection
+
+    def get_queryset(self):
+        """Retorna las relaciones con el plan de consulta de la acción"""
+        return self.apply_query_plan(HashTag_Registro.objects.all().order_by('-created_at'))
 
     def get_object(self):
         """Obtiene un objeto con manejo de excepciones"""
@@ -299,19 +595,32 @@ class HashTagRegistroViewSet(viewsets.ModelViewSet):
         except ObjectDoesNotExist:
             return None
 
+    def get_list_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        projection = self.get_projection()
+        if projection is not None:
+            queryset = projection.queryset(queryset)
+        return queryset
+
     def list(self, request, *args, **kwargs):
         """Lista relaciones hashtag-registro"""
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_list_queryset()
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+            return self.list_response(page, paginated=True)
+        return self.list_response(queryset)
+
+    def list_response(self, objects, paginated=False):
+        data = self.serialize_list(objects, self.get_projection())
+        if paginated:
+            return self.get_paginated_response(data)
+        return Response(data)
 
     def retrieve(self, request, pk=None):
         """Obtiene una relación específica"""
-        instance = self.get_object()
+        return self.retrieve_response(self.get_object())
+
+    def retrieve_response(self, instance):
         if not instance:
             return Response(
                 {'error': 'Relación no encontrada'},
@@ -342,6 +651,7 @@ class HashTagRegistroViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         instance.delete()
+        counters.hashtags_desenlazados({instance.id_catalogo_hashtag_id: 1})
         return Response(
             {'mensaje': 'Relación eliminada correctamente'},
             status=status.HTTP_204_NO_CONTENT
@@ -18,9 +18,9 @@ def clear_database():
     """Limpiar datos previos (excepto admin)"""
     print("Limpiando datos previos...")
     HashTag_Registro.objects.all().delete()
-    Registro.objects.all().delete()
-    Expedientes.objects.all().delete()
-    CatalogoHashTag.objects.all().delete()
+    Registro.all_with_inactive.all().delete()
+    Expedientes.all_with_inactive.all().delete()
+    CatalogoHashTag.all_with_inactive.all().delete()
     Usuarios.objects.filter(username__startswith='usuario').delete()
     print("✓ Base de datos limpia")
 
@@ -167,9 +167,9 @@ def main():
         print("=" * 50)
         print(f"\nResumen:")
         print(f"  • Usuarios: {Usuarios.objects.filter(is_superuser=False).count()}")
-        print(f"  • Hashtags: {CatalogoHashTag.objects.count()}")
-        print(f"  • Expedientes: {Expedientes.objects.count()}")
-        print(f"  • Registros: {Registro.objects.count()}")
+        print(f"  • Hashtags: {CatalogoHashTag.all_with_inactive.count()}")
+        print(f"  • Expedientes: {Expedientes.all_with_inactive.count()}")
+        print(f"  • Registros: {Registro.all_with_inactive.count()}")
         print(f"  • Relaciones Hashtag-Registro: {HashTag_Registro.objects.count()}")
         
     except Exception as e:
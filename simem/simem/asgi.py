@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'simem.settings')
+# Bajo ASGI las lecturas usan las acciones async (helpers.async_views)
+os.environ.setdefault('API_ASYNC_READS', 'True')
 
 application = get_asgi_application()
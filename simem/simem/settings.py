@@ -11,6 +11,7 @@ For the full list of settings and their values, see
 """
 
 import os
+import importlib.util
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -51,6 +52,7 @@ INSTALLED_APPS = [
     'usuarios',
     'catalogos',
     'movilizaciones',
+    'tareas',
 ]
 
 MIDDLEWARE = [
@@ -135,6 +137,9 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Archivos generados por las tareas en segundo plano (exportaciones)
+MEDIA_ROOT = os.getenv('MEDIA_ROOT', str(BASE_DIR / 'media'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -144,11 +149,25 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'usuarios.Usuarios'
 
 # Django REST Framework Configuration
+# Orden de autenticación de la API (API_AUTHENTICATION_ORDER=signed,token,session).
+# Con los tokens primero, las peticiones con cabecera Authorization no leen la sesión
+API_AUTHENTICATION_CLASSES = {
+    'signed': 'usuarios.authentication.SignedTokenAuthentication',
+    'token': 'usuarios.authentication.CachedTokenAuthentication',
+    'session': 'rest_framework.authentication.SessionAuthentication',
+}
+API_AUTHENTICATION_ORDER = os.getenv('API_AUTHENTICATION_ORDER', 'signed,token,session').split(',')
+
+# MessagePack (application/msgpack) para clientes móviles; requiere el paquete msgpack
+API_MSGPACK = os.getenv('API_MSGPACK', 'True') == 'True' and importlib.util.find_spec('msgpack') is not None
+
+# API navegable de DRF (por defecto solo con DEBUG)
+API_BROWSABLE = os.getenv('API_BROWSABLE', str(DEBUG)) == 'True'
+
 REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.SessionAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        API_AUTHENTICATION_CLASSES[name.strip()] for name in API_AUTHENTICATION_ORDER
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
@@ -158,14 +177,57 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'helpers.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
-    ]
+        'helpers.streaming.StreamingJSONRenderer',
+        *(['helpers.messagepack.MessagePackRenderer'] if API_MSGPACK else []),
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if API_BROWSABLE else []),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+        *(['helpers.messagepack.MessagePackParser'] if API_MSGPACK else []),
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Listas grandes sin paginar escritas en streaming (helpers.streaming) y filas por bloque
+API_STREAMING_RESPONSES = os.getenv('API_STREAMING_RESPONSES', 'True') == 'True'
+STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', '500'))
+
+# Acciones de lectura async (helpers.async_views); simem/asgi.py las activa por defecto
+API_ASYNC_READS = os.getenv('API_ASYNC_READS', 'False') == 'True'
+
+# Listados de registros y hashtag-registros armados desde values_list() (helpers.projection)
+API_LIST_PROJECTIONS = os.getenv('API_LIST_PROJECTIONS', 'True') == 'True'
+
+# Máximo de hijos embebidos por padre en ?include= (helpers.includes)
+INCLUDE_MAX_CHILDREN = int(os.getenv('INCLUDE_MAX_CHILDREN', '50'))
+
+# Segundos que cada proceso conserva la copia en memoria del catálogo de hashtags
+HASHTAG_CATALOG_TTL = int(os.getenv('HASHTAG_CATALOG_TTL', '60'))
+
+# Segundos que se conserva en caché el conjunto de permisos de cada usuario
+USER_PERMISSIONS_CACHE_TTL = int(os.getenv('USER_PERMISSIONS_CACHE_TTL', '300'))
+
+# Caché de tokens validados (usuarios.authentication.CachedTokenAuthentication)
+TOKEN_AUTH_CACHE_ALIAS = os.getenv('TOKEN_AUTH_CACHE_ALIAS', 'default')
+TOKEN_AUTH_CACHE_TTL = int(os.getenv('TOKEN_AUTH_CACHE_TTL', '60'))
+
+# Segundos de vida de los tokens de acceso firmados (usuarios.authentication.SignedTokenAuthentication)
+ACCESS_TOKEN_TTL = int(os.getenv('ACCESS_TOKEN_TTL', '300'))
+
+# Tareas en segundo plano (tareas.queue): intentos, backoff de los reintentos y
+# segundos sin actividad tras los que una tarea en proceso se da por abandonada
+TAREAS_MAX_INTENTOS = int(os.getenv('TAREAS_MAX_INTENTOS', '5'))
+TAREAS_BACKOFF = int(os.getenv('TAREAS_BACKOFF', '10'))
+TAREAS_BACKOFF_MAX = int(os.getenv('TAREAS_BACKOFF_MAX', '3600'))
+TAREAS_TIMEOUT = int(os.getenv('TAREAS_TIMEOUT', '600'))
+
+# Registros eliminados por transacción en la purga de expedientes (movilizaciones.purge)
+PURGE_BATCH_SIZE = int(os.getenv('PURGE_BATCH_SIZE', '1000'))
+
 # CORS Configuration
 CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
@@ -0,0 +1,12 @@
+from django.contrib import admin
+from tareas.models import Tarea
+
+
+@admin.register(Tarea)
+class TareaAdmin(admin.ModelAdmin):
+    """Admin para el modelo Tarea"""
+    list_display = ['id', 'tipo', 'estado', 'intentos', 'max_intentos', 'creado_por', 'created_at', 'finalizada_en']
+    list_filter = ['estado', 'tipo', 'created_at']
+    search_fields = ['tipo', 'creado_por__username']
+    readonly_fields = ['progreso', 'resultado', 'error', 'worker', 'iniciada_en', 'finalizada_en', 'created_at', 'updated_at']
+    date_hierarchy = 'created_at'
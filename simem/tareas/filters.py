@@ -0,0 +1,12 @@
+import django_filters
+from tareas.models import Tarea
+
+
+class TareaFilter(django_filters.FilterSet):
+    """Filter para el modelo Tarea"""
+    estado = django_filters.ChoiceFilter(field_name='estado', choices=Tarea.ESTADOS)
+    tipo = django_filters.CharFilter(field_name='tipo')
+
+    class Meta:
+        model = Tarea
+        fields = ['estado', 'tipo']
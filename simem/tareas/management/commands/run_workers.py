@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+def _worker(nombre, detener, opciones):
+    # Con spawn/forkserver el proceso hijo arranca sin Django configurado
+    import django
+    django.setup()
+    from tareas.queue import trabajar
+
+    # Ctrl+C llega a todo el grupo de procesos: el padre coordina el apagado y
+    # el worker termina la tarea en curso
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    trabajar(nombre, detener, **opciones)
+
+
+class Command(BaseCommand):
+    help = 'Ejecuta N procesos worker que toman y ejecutan las tareas en segundo plano'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--procesos', type=int, default=2, help='Número de procesos worker')
+        parser.add_argument('--tipo', action='append', dest='tipos', help='Solo ejecuta estos tipos de tarea')
+        parser.add_argument('--espera', type=float, default=1.0, help='Segundos entre consultas cuando la cola está vacía')
+        parser.add_argument('--una-vez', action='store_true', help='Termina cuando no quedan tareas disponibles')
+
+    def handle(self, *args, **options):
+        from tareas.queue import HANDLERS, recuperar_abandonadas
+
+        if options['procesos'] < 1:
+            raise CommandError('--procesos debe ser mayor a 0')
+        if options['espera'] <= 0:
+            raise CommandError('--espera debe ser mayor a 0')
+        unknown = [tipo for tipo in options['tipos'] or [] if tipo not in HANDLERS]
+        if unknown:
+            raise CommandError(f"Tipos de tarea desconocidos: {', '.join(unknown)}")
+
+        opciones = {'tipos': options['tipos'], 'espera': options['espera'], 'una_vez': options['una_vez']}
+        detener = multiprocessing.Event()
+        prefijo = f'{socket.gethostname()}:{os.getpid()}'
+        procesos = {}
+
+        def iniciar(i):
+            # Los hijos no deben heredar las conexiones abiertas del padre
+            connections.close_all()
+            proceso = multiprocessing.Process(target=_worker, args=(f'{prefijo}:{i}', detener, opciones), daemon=True)
+            proceso.start()
+            procesos[i] = proceso
+
+        senales = []
+
+        def apagar(signum, frame):
+            # Solo se anota: Event.set() dentro del handler puede bloquearse si la
+            # señal llega mientras el ciclo principal espera en el mismo Event
+            senales.append(signum)
+
+        signal.signal(signal.SIGINT, apagar)
+        signal.signal(signal.SIGTERM, apagar)
+
+        recuperadas, fallidas = recuperar_abandonadas()
+        if recuperadas or fallidas:
+            self.stdout.write(f'{recuperadas} tareas abandonadas devueltas a pendiente, {fallidas} fallidas')
+        for i in range(options['procesos']):
+            iniciar(i)
+        self.stdout.write(self.style.SUCCESS(f"✓ {options['procesos']} workers en ejecución ({prefijo})"))
+
+        ultima_revision = time.monotonic()
+        while not senales:
+            if options['una_vez'] and not any(proceso.is_alive() for proceso in procesos.values()):
+                break
+            if not options['una_vez']:
+                for i, proceso in list(procesos.items()):
+                    if not proceso.is_alive():
+                        self.stderr.write(f'Worker {i} terminó con código {proceso.exitcode}, se reinicia')
+                        iniciar(i)
+                if time.monotonic() - ultima_revision > 60:
+                    recuperar_abandonadas()
+                    ultima_revision = time.monotonic()
+            time.sleep(1)
+
+        if senales:
+            self.stdout.write('Deteniendo workers (terminan la tarea en curso)...')
+        detener.set()
+        for proceso in procesos.values():
+            proceso.join()
+        self.stdout.write(self.style.SUCCESS('✓ Workers detenidos'))
@@ -0,0 +1,62 @@
+from django.db import models
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+User = get_user_model()
+
+
+class Tarea(models.Model):
+    """Trabajo en segundo plano; lo ejecutan los workers de `manage.py run_workers` (tareas.queue)"""
+    PENDIENTE = 'pendiente'
+    EN_PROCESO = 'en_proceso'
+    COMPLETADA = 'completada'
+    FALLIDA = 'fallida'
+    ESTADOS = [
+        (PENDIENTE, 'Pendiente'),
+        (EN_PROCESO, 'En proceso'),
+        (COMPLETADA, 'Completada'),
+        (FALLIDA, 'Fallida'),
+    ]
+
+    id = models.AutoField(primary_key=True)
+    tipo = models.CharField(max_length=100)
+    parametros = models.JSONField(default=dict, blank=True)
+    estado = models.CharField(max_length=20, choices=ESTADOS, default=PENDIENTE)
+    progreso = models.JSONField(null=True, blank=True)
+    resultado = models.JSONField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    intentos = models.PositiveIntegerField(default=0)
+    max_intentos = models.PositiveIntegerField(default=5)
+    # Momento a partir del cual un worker puede tomarla (backoff de los reintentos)
+    disponible_en = models.DateTimeField(default=timezone.now)
+    worker = models.CharField(max_length=255, null=True, blank=True)
+    iniciada_en = models.DateTimeField(null=True, blank=True)
+    finalizada_en = models.DateTimeField(null=True, blank=True)
+    creado_por = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='tareas', db_index=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # También registra la actividad de la tarea en proceso (ver tareas.queue.progreso)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'tarea'
+        verbose_name = 'Tarea'
+        verbose_name_plural = 'Tareas'
+        indexes = [
+            # Siguiente tarea disponible (tareas.queue.tomar)
+            models.Index(
+                fields=['disponible_en', 'id'],
+                name='tarea_pendiente_idx',
+                condition=models.Q(estado='pendiente'),
+            ),
+            # Tareas de un worker caído (tareas.queue.recuperar_abandonadas)
+            models.Index(
+                fields=['updated_at'],
+                name='tarea_en_proceso_idx',
+                condition=models.Q(estado='en_proceso'),
+            ),
+            # Listado /tareas/ de cada usuario
+            models.Index(fields=['creado_por', '-created_at'], name='tarea_creador_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"Tarea {self.id} - {self.tipo} ({self.estado})"
@@ -0,0 +1,165 @@
+"""
+Cola de tareas en la base de datos (tabla tarea).
+
+- Cada app registra sus tipos con @tarea('app.nombre') en su módulo jobs.py
+  (importado en su ready()). El handler recibe la Tarea y sus parámetros y
+  retorna el resultado (JSON).
+- encolar() inserta la fila en la transacción en curso: si la petición se
+  revierte, la tarea tampoco existe.
+- Los workers (`manage.py run_workers`) toman la siguiente tarea disponible con
+  SELECT ... FOR UPDATE SKIP LOCKED: varios procesos no se esperan entre sí ni
+  toman la misma fila. La tarea se marca en_proceso en esa transacción corta y
+  se ejecuta fuera de ella.
+- Un error programa otro intento con backoff exponencial (TAREAS_BACKOFF * 2^n,
+  hasta TAREAS_BACKOFF_MAX, con jitter) hasta max_intentos; después queda
+  fallida. TareaInvalida marca la tarea fallida sin reintentar.
+- Una tarea en_proceso sin actividad durante TAREAS_TIMEOUT (worker caído) vuelve
+  a pendiente. Las tareas largas llaman a progreso(), que renueva ese plazo.
+
+Un reintento repite el handler completo: los handlers deben ser idempotentes.
+"""
+import random
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from tareas.models import Tarea
+
+HANDLERS = {}
+
+
+class TareaInvalida(Exception):
+    """Error permanente del handler (parámetros inválidos...): no se reintenta"""
+
+
+def _max_intentos():
+    return getattr(settings, 'TAREAS_MAX_INTENTOS', 5)
+
+
+def _backoff(intentos):
+    base = getattr(settings, 'TAREAS_BACKOFF', 10)
+    delay = min(base * 2 ** (intentos - 1), getattr(settings, 'TAREAS_BACKOFF_MAX', 3600))
+    # Jitter: los reintentos de muchas tareas que fallaron juntas no coinciden
+    return timedelta(seconds=random.uniform(delay / 2, delay))
+
+
+def _timeout():
+    return timedelta(seconds=getattr(settings, 'TAREAS_TIMEOUT', 600))
+
+
+def tarea(tipo):
+    """Registra el handler de un tipo de tarea"""
+    def decorator(function):
+        HANDLERS[tipo] = function
+        return function
+    return decorator
+
+
+def encolar(tipo, parametros=None, usuario=None, max_intentos=None):
+    """Crea una tarea pendiente; parametros debe ser serializable a JSON"""
+    if tipo not in HANDLERS:
+        raise ValueError(f'Tipo de tarea desconocido: {tipo}')
+    return Tarea.objects.create(
+        tipo=tipo,
+        parametros=parametros or {},
+        creado_por=usuario,
+        max_intentos=max_intentos or _max_intentos(),
+    )
+
+
+def tomar(worker, tipos=None):
+    """Marca en_proceso y retorna la siguiente tarea disponible, o None si no hay"""
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = Tarea.objects.select_for_update(skip_locked=True).filter(
+            estado=Tarea.PENDIENTE, disponible_en__lte=now
+        )
+        if tipos:
+            queryset = queryset.filter(tipo__in=tipos)
+        tarea = queryset.order_by('disponible_en', 'id').first()
+        if tarea is None:
+            return None
+        # Con estado en la condición el UPDATE también es seguro en motores sin
+        # FOR UPDATE (SQLite): si otro worker la tomó no se actualiza ninguna fila
+        taken = Tarea.objects.filter(pk=tarea.pk, estado=Tarea.PENDIENTE).update(
+            estado=Tarea.EN_PROCESO,
+            intentos=F('intentos') + 1,
+            worker=worker,
+            iniciada_en=now,
+            updated_at=now,
+        )
+    if not taken:
+        return None
+    tarea.refresh_from_db()
+    return tarea
+
+
+def progreso(tarea, **datos):
+    """Guarda el avance visible en /tareas/{id}/ y renueva el plazo de TAREAS_TIMEOUT"""
+    tarea.progreso = {**(tarea.progreso or {}), **datos}
+    Tarea.objects.filter(pk=tarea.pk).update(progreso=tarea.progreso, updated_at=timezone.now())
+
+
+def _finalizar(tarea, **campos):
+    # Solo si la tarea sigue siendo de este worker (no se recuperó por TAREAS_TIMEOUT)
+    Tarea.objects.filter(pk=tarea.pk, estado=Tarea.EN_PROCESO, worker=tarea.worker).update(
+        updated_at=timezone.now(), **campos
+    )
+
+
+def ejecutar(tarea):
+    """Ejecuta una tarea ya tomada y registra el resultado o el error"""
+    handler = HANDLERS.get(tarea.tipo)
+    try:
+        if handler is None:
+            raise TareaInvalida(f'Tipo de tarea desconocido: {tarea.tipo}')
+        resultado = handler(tarea, **tarea.parametros)
+    except Exception as exc:
+        detalle = traceback.format_exc()
+        now = timezone.now()
+        if isinstance(exc, TareaInvalida) or tarea.intentos >= tarea.max_intentos:
+            _finalizar(tarea, estado=Tarea.FALLIDA, error=detalle, finalizada_en=now)
+        else:
+            _finalizar(tarea, estado=Tarea.PENDIENTE, error=detalle, worker=None, disponible_en=now + _backoff(tarea.intentos))
+        return False
+    _finalizar(tarea, estado=Tarea.COMPLETADA, resultado=resultado, error=None, finalizada_en=timezone.now())
+    return True
+
+
+def recuperar_abandonadas():
+    """Devuelve a pendiente (o marca fallidas) las tareas en_proceso sin actividad"""
+    now = timezone.now()
+    abandonadas = Tarea.objects.filter(estado=Tarea.EN_PROCESO, updated_at__lt=now - _timeout())
+    mensaje = 'Sin actividad del worker durante TAREAS_TIMEOUT'
+    recuperadas = abandonadas.filter(intentos__lt=F('max_intentos')).update(
+        estado=Tarea.PENDIENTE, worker=None, disponible_en=now, error=mensaje, updated_at=now
+    )
+    fallidas = abandonadas.update(estado=Tarea.FALLIDA, error=mensaje, finalizada_en=now, updated_at=now)
+    return recuperadas, fallidas
+
+
+def trabajar(worker, detener, tipos=None, espera=1.0, una_vez=False):
+    """
+    Ciclo de un worker: toma y ejecuta tareas hasta que se activa detener (un
+    Event). Sin tareas disponibles espera `espera` segundos, o termina si una_vez.
+    """
+    while not detener.is_set():
+        # Como al final de una petición: descarta conexiones rotas o vencidas
+        close_old_connections()
+        try:
+            tarea = tomar(worker, tipos)
+        except DatabaseError:
+            # Error transitorio (conexión perdida, SQLite bloqueada por otro worker):
+            # se vuelve a intentar después de la espera
+            detener.wait(espera)
+            continue
+        if tarea is None:
+            if una_vez:
+                return
+            detener.wait(espera)
+            continue
+        ejecutar(tarea)
@@ -0,0 +1,47 @@
+from rest_framework import serializers
+from tareas.models import Tarea
+from tareas.queue import HANDLERS
+
+
+class TareaSerializer(serializers.ModelSerializer):
+    """Estado de una tarea en segundo plano"""
+    class Meta:
+        model = Tarea
+        fields = [
+            'id',
+            'tipo',
+            'estado',
+            'parametros',
+            'progreso',
+            'resultado',
+            'error',
+            'intentos',
+            'max_intentos',
+            'disponible_en',
+            'iniciada_en',
+            'finalizada_en',
+            'creado_por',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        request = self.context.get('request')
+        if data['error'] and not (request and request.user.is_superuser):
+            # Fuera de los superusers solo se muestra la última línea del traceback
+            data['error'] = data['error'].strip().splitlines()[-1]
+        return data
+
+
+class TareaCreateSerializer(serializers.Serializer):
+    """Encolar una tarea de cualquier tipo registrado (solo superusers)"""
+    tipo = serializers.CharField(max_length=100)
+    parametros = serializers.DictField(required=False, default=dict)
+    max_intentos = serializers.IntegerField(required=False, min_value=1)
+
+    def validate_tipo(self, value):
+        if value not in HANDLERS:
+            raise serializers.ValidationError(f"Debe ser uno de: {', '.join(sorted(HANDLERS))}")
+        return value
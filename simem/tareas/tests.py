@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from tareas import queue
+from tareas.models import Tarea
+from tareas.queue import TareaInvalida, ejecutar, encolar, recuperar_abandonadas, tomar
+
+
+def _ok(tarea, valor=None):
+    return {'valor': valor}
+
+
+def _error(tarea):
+    raise RuntimeError('falla transitoria')
+
+
+def _invalida(tarea):
+    raise TareaInvalida('parámetros inválidos')
+
+
+class QueueTests(TestCase):
+    """Toma, reintentos con backoff y recuperación de tareas abandonadas (tareas.queue)"""
+
+    def setUp(self):
+        handlers = {'test.ok': _ok, 'test.error': _error, 'test.invalida': _invalida}
+        self.addCleanup(lambda: [queue.HANDLERS.pop(tipo, None) for tipo in handlers])
+        queue.HANDLERS.update(handlers)
+
+    def test_una_tarea_se_toma_una_sola_vez(self):
+        tarea = encolar('test.ok', {'valor': 1})
+        tomada = tomar('worker-1')
+        self.assertEqual(tomada.pk, tarea.pk)
+        self.assertEqual(tomada.estado, Tarea.EN_PROCESO)
+        self.assertEqual(tomada.intentos, 1)
+        self.assertEqual(tomada.worker, 'worker-1')
+        self.assertIsNone(tomar('worker-2'))
+
+    def test_solo_toma_los_tipos_pedidos(self):
+        encolar('test.ok')
+        self.assertIsNone(tomar('worker-1', tipos=['test.error']))
+        self.assertIsNotNone(tomar('worker-1', tipos=['test.ok']))
+
+    def test_completada(self):
+        encolar('test.ok', {'valor': 7})
+        self.assertTrue(ejecutar(tomar('worker-1')))
+        tarea = Tarea.objects.get()
+        self.assertEqual(tarea.estado, Tarea.COMPLETADA)
+        self.assertEqual(tarea.resultado, {'valor': 7})
+        self.assertIsNotNone(tarea.finalizada_en)
+
+    def test_error_programa_un_reintento(self):
+        encolar('test.error', max_intentos=3)
+        antes = timezone.now()
+        self.assertFalse(ejecutar(tomar('worker-1')))
+        tarea = Tarea.objects.get()
+        self.assertEqual(tarea.estado, Tarea.PENDIENTE)
+        self.assertIsNone(tarea.worker)
+        self.assertGreater(tarea.disponible_en, antes)
+        self.assertIn('falla transitoria', tarea.error)
+        # No está disponible hasta que pase el backoff
+        self.assertIsNone(tomar('worker-1'))
+
+    def test_tarea_invalida_falla_sin_reintentar(self):
+        encolar('test.invalida', max_intentos=3)
+        self.assertFalse(ejecutar(tomar('worker-1')))
+        tarea = Tarea.objects.get()
+        self.assertEqual(tarea.estado, Tarea.FALLIDA)
+        self.assertEqual(tarea.intentos, 1)
+        self.assertIn('parámetros inválidos', tarea.error)
+
+    def test_max_intentos_termina_en_fallida(self):
+        encolar('test.error', max_intentos=2)
+        for intento in range(2):
+            Tarea.objects.update(disponible_en=timezone.now())
+            tarea = tomar('worker-1')
+            self.assertEqual(tarea.intentos, intento + 1)
+            ejecutar(tarea)
+        tarea = Tarea.objects.get()
+        self.assertEqual(tarea.estado, Tarea.FALLIDA)
+        self.assertEqual(tarea.intentos, 2)
+        self.assertIsNotNone(tarea.finalizada_en)
+
+    def test_recupera_tareas_abandonadas(self):
+        encolar('test.ok', max_intentos=3)
+        tomada = tomar('worker-caido')
+        with self.settings(TAREAS_TIMEOUT=60):
+            self.assertEqual(recuperar_abandonadas(), (0, 0))
+            Tarea.objects.update(updated_at=timezone.now() - timedelta(seconds=120))
+            self.assertEqual(recuperar_abandonadas(), (1, 0))
+        tarea = Tarea.objects.get()
+        self.assertEqual(tarea.estado, Tarea.PENDIENTE)
+        self.assertIsNone(tarea.worker)
+
+        # El worker caído ya no puede cerrar la tarea que otro tomó
+        retomada = tomar('worker-2')
+        ejecutar(tomada)
+        self.assertEqual(Tarea.objects.get().estado, Tarea.EN_PROCESO)
+        ejecutar(retomada)
+        self.assertEqual(Tarea.objects.get().estado, Tarea.COMPLETADA)
+
+    def test_abandonada_sin_intentos_queda_fallida(self):
+        encolar('test.ok', max_intentos=1)
+        tomar('worker-caido')
+        Tarea.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+        with self.settings(TAREAS_TIMEOUT=60):
+            self.assertEqual(recuperar_abandonadas(), (0, 1))
+        self.assertEqual(Tarea.objects.get().estado, Tarea.FALLIDA)
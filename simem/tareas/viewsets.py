@@ -0,0 +1,89 @@
+import os
+
+from rest_framework import viewsets, permissions, mixins
+from rest_framework.decorators import action
+from rest_framework.reverse import reverse
+from django_filters.rest_framework import DjangoFilterBackend
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.storage import default_storage
+from django.http import FileResponse
+
+from tareas.models import Tarea
+from tareas.serializers import TareaSerializer, TareaCreateSerializer
+from tareas.filters import TareaFilter
+from tareas.queue import encolar
+from helpers.exceptions import BadRequest, NotFound, PermissionDenied
+from helpers.responses import ok_response, accepted_response
+from helpers.errors import error
+
+
+def tarea_aceptada(request, tarea, message=None):
+    """202 Accepted con el estado de la tarea y su URL de consulta en Location"""
+    data = TareaSerializer(tarea, context={'request': request}).data
+    response = accepted_response(data=data, **({'message': message} if message else {}))
+    response['Location'] = reverse('tareas-detail', args=[tarea.pk], request=request)
+    return response
+
+
+class TareasViewSet(mixins.ListModelMixin, mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    """
+    Estado de las tareas en segundo plano.
+    Cada usuario ve las suyas; los superusers ven todas y pueden encolar cualquier tipo registrado.
+    """
+    queryset = Tarea.objects.all()
+    serializer_class = TareaSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = TareaFilter
+
+    def get_queryset(self):
+        """Filtra tareas según permisos"""
+        queryset = Tarea.objects.order_by('-created_at', '-id')
+        if not self.request.user.is_superuser:
+            queryset = queryset.filter(creado_por=self.request.user)
+        return queryset
+
+    def get_object(self):
+        """Obtiene un objeto con manejo de excepciones"""
+        try:
+            return self.get_queryset().get(pk=self.kwargs.get('pk'))
+        except ObjectDoesNotExist:
+            return None
+
+    def list(self, request, *args, **kwargs):
+        """Lista tareas con paginación"""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return ok_response(data=self.get_paginated_response(serializer.data).data)
+        return ok_response(data=self.get_serializer(queryset, many=True).data)
+
+    def retrieve(self, request, pk=None):
+        """Estado, progreso y resultado de una tarea"""
+        instance = self.get_object()
+        if not instance:
+            raise NotFound()
+        return ok_response(data=self.get_serializer(instance).data)
+
+    def create(self, request, *args, **kwargs):
+        """Encola una tarea (solo superusers)"""
+        if not request.user.is_superuser:
+            raise PermissionDenied()
+        serializer = TareaCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            new_error = error(default_errors=serializer.errors)
+            raise BadRequest(new_error)
+        tarea = encolar(usuario=request.user, **serializer.validated_data)
+        return tarea_aceptada(request, tarea)
+
+    @action(detail=True, methods=['get'])
+    def descargar(self, request, pk=None):
+        """Descarga el archivo que generó la tarea (exportaciones)"""
+        instance = self.get_object()
+        if not instance:
+            raise NotFound()
+        archivo = (instance.resultado or {}).get('archivo')
+        if instance.estado != Tarea.COMPLETADA or not archivo or not default_storage.exists(archivo):
+            raise NotFound()
+        return FileResponse(default_storage.open(archivo, 'rb'), as_attachment=True, filename=os.path.basename(archivo))
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class UsuariosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'usuarios'
+
+    def ready(self):
+        from usuarios import authentication, permissions_cache
+
+        authentication.connect_signals()
+        permissions_cache.connect_signals()
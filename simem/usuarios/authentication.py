@@ -0,0 +1,239 @@
+"""
+Autenticación de la API.
+
+CachedTokenAuthentication: guarda token -> copia del usuario en la caché de
+Django (alias TOKEN_AUTH_CACHE_ALIAS, con TTL TOKEN_AUTH_CACHE_TTL), así una
+petición autenticada no consulta authtoken_token ni usuarios. La entrada se
+elimina al borrar el token (logout) y al guardar el usuario (desactivación,
+cambio de contraseña, edición). El tamaño lo acota la propia caché (MAX_ENTRIES
+en LocMemCache).
+
+SignedTokenAuthentication: tokens de acceso firmados con HMAC (django.core.signing,
+SECRET_KEY) y de vida corta (ACCESS_TOKEN_TTL), enviados como
+"Authorization: Bearer <token>". Llevan id de usuario, is_superuser y la versión
+de token del usuario; no se consulta la base de datos por petición. El authtoken
+existente sirve como token de refresco. Para revocar se incrementa
+Usuarios.token_version (logout, desactivación, cambio de contraseña o de
+is_superuser); la versión vigente se lee de la caché.
+
+Con una caché compartida (Redis, Memcached) las invalidaciones alcanzan a todos
+los procesos; con la caché local por defecto el TTL limita cuánto tarda otro
+proceso en verlas.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.cache import caches
+from django.db import router, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from helpers.async_views import run_read
+
+# La contraseña no se copia; si una vista guarda request.user, save() solo
+# escribe los campos cargados
+EXCLUDED_FIELDS = {'password'}
+
+ACCESS_TOKEN_SALT = 'usuarios.authentication.access'
+# Cambios en estos campos revocan los tokens de acceso del usuario
+REVOKING_FIELDS = ('is_active', 'is_superuser', 'password')
+
+
+def _cache():
+    return caches[getattr(settings, 'TOKEN_AUTH_CACHE_ALIAS', 'default')]
+
+
+def _ttl():
+    return getattr(settings, 'TOKEN_AUTH_CACHE_TTL', 60)
+
+
+def _key(token_key):
+    # No se usa el token en claro como llave de la caché
+    return 'usuarios:token:' + hashlib.sha256(token_key.encode()).hexdigest()
+
+
+def _snapshot_fields():
+    return [
+        field.attname for field in get_user_model()._meta.concrete_fields
+        if field.attname not in EXCLUDED_FIELDS
+    ]
+
+
+def _snapshot(token):
+    fields = _snapshot_fields()
+    return {
+        'created': token.created,
+        'fields': tuple(fields),
+        'values': tuple(getattr(token.user, field) for field in fields),
+    }
+
+
+def _restore(token_key, snapshot):
+    User = get_user_model()
+    if list(snapshot['fields']) != _snapshot_fields():
+        # La copia es de otra versión del modelo
+        return None
+    user = User.from_db(router.db_for_read(User), snapshot['fields'], snapshot['values'])
+    token = Token(key=token_key, user_id=user.pk, created=snapshot['created'])
+    token.user = user
+    return user, token
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication que sirve desde la caché los tokens ya validados"""
+
+    def authenticate_credentials(self, key):
+        cache = _cache()
+        snapshot = cache.get(_key(key))
+        if snapshot is not None:
+            restored = _restore(key, snapshot)
+            if restored is not None:
+                return restored
+
+        model = self.get_model()
+        try:
+            token = model.objects.select_related('user').get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        cache.set(_key(key), _snapshot(token), timeout=_ttl())
+        return (token.user, token)
+
+
+def _access_ttl():
+    return getattr(settings, 'ACCESS_TOKEN_TTL', 300)
+
+
+def _version_key(user_id):
+    return f'usuarios:token_version:{user_id}'
+
+
+def issue_access_token(user):
+    """Token de acceso firmado (con marca de tiempo) para el usuario"""
+    payload = {'uid': user.pk, 'usr': user.username, 'su': user.is_superuser, 'tv': user.token_version}
+    return signing.dumps(payload, salt=ACCESS_TOKEN_SALT, compress=False)
+
+
+def token_version(user_id):
+    """Versión de token vigente del usuario, o None si está inactivo o no existe"""
+    cache = _cache()
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = get_user_model()._base_manager.filter(pk=user_id, is_active=True).values_list(
+            'token_version', flat=True
+        ).first()
+        if version is not None:
+            cache.set(_version_key(user_id), version, timeout=_access_ttl())
+    return version
+
+
+def load_full_user(user):
+    """Carga los campos que el token de acceso no trae (una sola consulta)"""
+    deferred = user.get_deferred_fields()
+    if deferred:
+        user.refresh_from_db(fields=deferred)
+    return user
+
+
+async def aload_full_user(user):
+    """load_full_user para las acciones async (helpers.async_views.run_read)"""
+    deferred = user.get_deferred_fields()
+    if deferred:
+        await run_read(user.refresh_from_db, fields=deferred)
+    return user
+
+
+class SignedTokenAuthentication(TokenAuthentication):
+    """
+    Autenticación con token de acceso firmado, sin consultar la base de datos.
+    request.user solo trae id, username, is_superuser, is_active y token_version;
+    los demás campos se cargan al accederlos (ver load_full_user).
+    """
+    keyword = 'Bearer'
+
+    def authenticate_credentials(self, key):
+        try:
+            payload = signing.loads(key, salt=ACCESS_TOKEN_SALT, max_age=_access_ttl())
+        except signing.SignatureExpired:
+            raise exceptions.AuthenticationFailed('Token de acceso expirado.')
+        except signing.BadSignature:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if token_version(payload['uid']) != payload['tv']:
+            raise exceptions.AuthenticationFailed('Token de acceso revocado.')
+
+        User = get_user_model()
+        values = {
+            'id': payload['uid'],
+            'username': payload['usr'],
+            'is_superuser': payload['su'],
+            'is_active': True,
+            'token_version': payload['tv'],
+        }
+        field_names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+        user = User.from_db(router.db_for_read(User), field_names, [values[name] for name in field_names])
+        return (user, payload)
+
+
+def revoke_access_tokens(user_ids):
+    """Incrementa la versión de token; los tokens de acceso emitidos dejan de valer"""
+    get_user_model()._base_manager.filter(pk__in=user_ids).update(token_version=F('token_version') + 1)
+    _on_commit(invalidate_versions, user_ids)
+
+
+def invalidate_versions(user_ids):
+    _cache().delete_many([_version_key(user_id) for user_id in user_ids])
+
+
+def invalidate_tokens(token_keys):
+    _cache().delete_many([_key(token_key) for token_key in token_keys])
+
+
+def invalidate_users(user_ids):
+    invalidate_tokens(Token.objects.filter(user_id__in=user_ids).values_list('key', flat=True))
+
+
+# --- Señales de invalidación ----------------------------------------------------
+
+def _on_commit(function, *args):
+    # Se elimina de inmediato y de nuevo al confirmar, por si otra petición
+    # guardó en caché el valor anterior antes del commit
+    function(*args)
+    transaction.on_commit(lambda: function(*args))
+
+
+def _token_deleted(sender, instance, **kwargs):
+    _on_commit(invalidate_tokens, [instance.key])
+
+
+def _remember_user(sender, instance, **kwargs):
+    # Solo lee atributos ya cargados para no provocar consultas en campos diferidos
+    instance._token_original = {
+        field: instance.__dict__[field] for field in REVOKING_FIELDS if field in instance.__dict__
+    }
+
+
+def _user_saved(sender, instance, created, raw=False, **kwargs):
+    original = getattr(instance, '_token_original', {})
+    _remember_user(sender, instance)
+    if created or raw:
+        return
+    _on_commit(invalidate_users, [instance.pk])
+    if any(instance.__dict__.get(field, value) != value for field, value in original.items()):
+        revoke_access_tokens([instance.pk])
+
+
+def connect_signals():
+    User = get_user_model()
+    post_delete.connect(_token_deleted, sender=Token, dispatch_uid='token_cache_token_delete')
+    post_init.connect(_remember_user, sender=User, dispatch_uid='token_cache_user_init')
+    post_save.connect(_user_saved, sender=User, dispatch_uid='token_cache_user_save')
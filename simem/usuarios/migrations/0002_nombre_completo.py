@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 00:52
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from helpers.trigram import TrigramIndexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usuarios', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usuarios',
+            name='nombre_completo',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'apellido_paterno', models.Value(' '), 'apellido_materno'), output_field=models.CharField(max_length=352)),
+        ),
+        TrigramIndexes('usuarios', [
+            'username', 'email', 'first_name', 'apellido_paterno', 'apellido_materno', 'nombre_completo',
+        ]),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usuarios', '0002_nombre_completo'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usuarios',
+            name='registros_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
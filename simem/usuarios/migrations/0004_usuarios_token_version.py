@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 01:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('usuarios', '0003_usuarios_registros_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usuarios',
+            name='token_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,21 +1,42 @@
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat
 from django.contrib.auth.models import AbstractUser
 
+# Columnas que solo cambian con UPDATE ... SET col = col + n; un save() completo
+# no debe reescribirlas con el valor (quizá viejo) que tiene la instancia
+COUNTER_FIELDS = frozenset({'registros_count', 'token_version'})
+
 
 class Usuarios(AbstractUser):
     """Modelo personalizado de Usuario que extiende AbstractUser"""
     apellido_paterno = models.CharField(max_length=100)
     apellido_materno = models.CharField(max_length=100)
     numero_empleado = models.IntegerField(unique=True, null=True, blank=True)
-    
+    # Registros creados por el usuario (movilizaciones.counters)
+    registros_count = models.PositiveIntegerField(default=0, editable=False)
+    # Se incrementa para revocar los tokens de acceso firmados (usuarios.authentication)
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+    # Columna almacenada para buscar por nombre con un solo índice trigram
+    nombre_completo = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'apellido_paterno', Value(' '), 'apellido_materno'),
+        output_field=models.CharField(max_length=352),
+        db_persist=True,
+    )
+
     class Meta:
         db_table = 'usuarios'
         verbose_name = 'Usuario'
         verbose_name_plural = 'Usuarios'
 
-    def __str__(self):
-        return f"{self.first_name} {self.apellido_paterno} {self.apellido_materno}"
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key and not field.generated
+                and field.attname in self.__dict__ and field.attname not in COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
-    @property
-    def nombre_completo(self):
+    def __str__(self):
         return f"{self.first_name} {self.apellido_paterno} {self.apellido_materno}"
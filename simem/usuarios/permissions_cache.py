@@ -0,0 +1,201 @@
+"""
+Perfil de acceso por usuario: conjunto de permisos ('app_label.codename'),
+equivalente a get_all_permissions() de ModelBackend, y nombres de sus grupos.
+Se calcula por lote y se guarda en la caché de Django.
+
+- Cambios en los grupos o permisos directos de un usuario invalidan su entrada.
+- Cambios en los permisos de un grupo, o en grupos/permisos (incluido renombrar
+  un grupo), incrementan una versión global que invalida todas las entradas.
+Con una caché compartida (Redis, Memcached) la invalidación alcanza a todos los
+procesos; con la caché local por defecto, USER_PERMISSIONS_CACHE_TTL limita
+cuánto puede tardar otro proceso en ver el cambio.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+VERSION_KEY = 'usuarios:perfil:version'
+
+
+def _ttl():
+    return getattr(settings, 'USER_PERMISSIONS_CACHE_TTL', 300)
+
+
+def _version():
+    return cache.get_or_set(VERSION_KEY, 1, timeout=None)
+
+
+def _key(version, user_id):
+    return f'usuarios:perfil:{version}:{user_id}'
+
+
+def _compute(users):
+    """Calcula el perfil de varios usuarios con a lo sumo cuatro consultas"""
+    from usuarios.models import Usuarios
+
+    groups = defaultdict(list)
+    rows = Usuarios.groups.through.objects.filter(usuarios_id__in=[user.pk for user in users]).order_by(
+        'group_id'
+    ).values_list('usuarios_id', 'group__name')
+    for user_id, name in rows:
+        groups[user_id].append(name)
+
+    return {
+        pk: {'permisos': perms, 'grupos': tuple(groups[pk])}
+        for pk, perms in _compute_permissions(users).items()
+    }
+
+
+def _compute_permissions(users):
+    from usuarios.models import Usuarios
+
+    result = {}
+    regular_ids = []
+    for user in users:
+        if not user.is_active:
+            result[user.pk] = frozenset()
+        elif user.is_superuser:
+            result[user.pk] = None
+        else:
+            regular_ids.append(user.pk)
+
+    if any(perms is None for perms in result.values()):
+        all_perms = frozenset(
+            f'{app_label}.{codename}'
+            for app_label, codename in Permission.objects.values_list('content_type__app_label', 'codename')
+        )
+        result = {pk: all_perms if perms is None else perms for pk, perms in result.items()}
+
+    if regular_ids:
+        perms = defaultdict(set)
+        direct = Usuarios.user_permissions.through.objects.filter(usuarios_id__in=regular_ids).values_list(
+            'usuarios_id', 'permission__content_type__app_label', 'permission__codename'
+        )
+        by_group = Usuarios.groups.through.objects.filter(
+            usuarios_id__in=regular_ids, group__permissions__isnull=False
+        ).values_list(
+            'usuarios_id', 'group__permissions__content_type__app_label', 'group__permissions__codename'
+        )
+        for rows in (direct, by_group):
+            for user_id, app_label, codename in rows:
+                perms[user_id].add(f'{app_label}.{codename}')
+        for user_id in regular_ids:
+            result[user_id] = frozenset(perms[user_id])
+    return result
+
+
+def profiles(users):
+    """Retorna {user_id: {'permisos', 'grupos'}} leyendo la caché en una sola operación"""
+    users = list(users)
+    if not users:
+        return {}
+    version = _version()
+    keys = {user.pk: _key(version, user.pk) for user in users}
+    cached = cache.get_many(keys.values())
+    result = {pk: cached[key] for pk, key in keys.items() if key in cached}
+
+    missing = [user for user in users if user.pk not in result]
+    if missing:
+        computed = _compute(missing)
+        cache.set_many({keys[pk]: profile for pk, profile in computed.items()}, timeout=_ttl())
+        result.update(computed)
+    return result
+
+
+def permission_sets(users):
+    """Retorna {user_id: frozenset de permisos}"""
+    return {pk: profile['permisos'] for pk, profile in profiles(users).items()}
+
+
+def user_profile(user):
+    """Perfil de un usuario (usa el valor precargado si existe)"""
+    profile = getattr(user, '_perfil', None)
+    if profile is None:
+        profile = profiles([user])[user.pk]
+    return profile
+
+
+def user_permissions(user):
+    return user_profile(user)['permisos']
+
+
+def user_groups(user):
+    """Nombres de los grupos del usuario, ordenados por id de grupo"""
+    return list(user_profile(user)['grupos'])
+
+
+def prefetch_profiles(users):
+    """Precarga en cada usuario su perfil (atributo _perfil)"""
+    loaded = profiles(users)
+    for user in users:
+        user._perfil = loaded[user.pk]
+    return users
+
+
+def invalidate_users(user_ids):
+    version = _version()
+    cache.delete_many([_key(version, user_id) for user_id in user_ids])
+
+
+def invalidate_all():
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+
+
+# --- Señales de invalidación ----------------------------------------------------
+
+def _on_commit(function, *args):
+    # Se invalida de inmediato y de nuevo al confirmar, por si otra petición
+    # guardó en caché el valor anterior antes del commit
+    function(*args)
+    transaction.on_commit(lambda: function(*args))
+
+
+def _user_membership_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear', 'pre_clear'):
+        return
+    if not reverse:
+        _on_commit(invalidate_users, [instance.pk])
+    elif action == 'pre_clear':
+        # grupo.user_set.clear(): pk_set no incluye a los usuarios afectados
+        _on_commit(invalidate_all)
+    elif pk_set:
+        _on_commit(invalidate_users, list(pk_set))
+
+
+def _group_permissions_changed(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        _on_commit(invalidate_all)
+
+
+def _global_change(sender, **kwargs):
+    _on_commit(invalidate_all)
+
+
+def _user_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created:
+        return
+    if update_fields is not None and not {'is_active', 'is_superuser'} & set(update_fields):
+        return
+    _on_commit(invalidate_users, [instance.pk])
+
+
+def connect_signals():
+    from usuarios.models import Usuarios
+
+    m2m_changed.connect(_user_membership_changed, sender=Usuarios.groups.through, dispatch_uid='permisos_groups')
+    m2m_changed.connect(
+        _user_membership_changed, sender=Usuarios.user_permissions.through, dispatch_uid='permisos_user_perms'
+    )
+    m2m_changed.connect(_group_permissions_changed, sender=Group.permissions.through, dispatch_uid='permisos_group_perms')
+    post_save.connect(_global_change, sender=Group, dispatch_uid='permisos_group_save')
+    post_delete.connect(_global_change, sender=Group, dispatch_uid='permisos_group_delete')
+    post_save.connect(_global_change, sender=Permission, dispatch_uid='permisos_permission_save')
+    post_delete.connect(_global_change, sender=Permission, dispatch_uid='permisos_permission_delete')
+    post_save.connect(_user_saved, sender=Usuarios, dispatch_uid='permisos_user_save')
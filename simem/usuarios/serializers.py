@@ -1,16 +1,28 @@
 from rest_framework import serializers
 from usuarios.models import Usuarios
+from usuarios.permissions_cache import prefetch_profiles, user_groups, user_permissions
 from django.contrib.auth.models import Group
+from helpers.sparse import SparseFieldsetMixin
 
 
-class UsuariosSerializer(serializers.ModelSerializer):
+class UsuariosListSerializerMany(serializers.ListSerializer):
+    """Precarga grupos y permisos de toda la página en lote antes de serializar"""
+
+    def to_representation(self, data):
+        users = list(data.all() if hasattr(data, 'all') else data)
+        if {'role', 'permissions'} & self.child.fields.keys():
+            prefetch_profiles(users)
+        return super().to_representation(users)
+
+
+class UsuariosSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador completo para el modelo Usuarios"""
     class Meta:
         model = Usuarios
         fields = '__all__'
 
 
-class UsuariosListSerializer(serializers.ModelSerializer):
+class UsuariosListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador para listar usuarios"""
     created_at = serializers.DateTimeField(source='date_joined', read_only=True)
     nombre_completo = serializers.SerializerMethodField()
@@ -31,6 +43,7 @@ class UsuariosListSerializer(serializers.ModelSerializer):
             'is_superuser',
             'is_staff',
             'numero_empleado',
+            'registros_count',
             'created_at',
             'role',
             'permissions',
@@ -39,18 +52,28 @@ class UsuariosListSerializer(serializers.ModelSerializer):
             'is_superuser': {'default': False},
             'is_active': {'default': True},
         }
+        list_serializer_class = UsuariosListSerializerMany
+        # El perfil (role, permissions) depende de is_active e is_superuser
+        field_dependencies = {
+            'nombre_completo': ['first_name', 'apellido_paterno', 'apellido_materno'],
+            'role': ['is_active', 'is_superuser'],
+            'permissions': ['is_active', 'is_superuser'],
+        }
 
     def get_nombre_completo(self, obj):
         return f'{obj.first_name} {obj.apellido_paterno} {obj.apellido_materno}'
 
     def get_role(self, obj):
-        return obj.groups.first().name if obj.groups.exists() else None
+        # Primer grupo (menor id) del perfil precargado por UsuariosListSerializerMany
+        groups = user_groups(obj)
+        return groups[0] if groups else None
 
     def get_permissions(self, obj):
-        return list(obj.get_all_permissions())
+        # Conjunto precargado por UsuariosListSerializerMany o leído de la caché
+        return sorted(user_permissions(obj))
 
 
-class UsuariosRetrieveSerializer(serializers.ModelSerializer):
+class UsuariosRetrieveSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializador para obtener detalles de un usuario"""
     created_at = serializers.DateTimeField(source='date_joined', read_only=True)
     nombre_completo = serializers.SerializerMethodField()
@@ -75,6 +98,9 @@ class UsuariosRetrieveSerializer(serializers.ModelSerializer):
             'is_superuser': {'default': False},
             'is_active': {'default': True},
         }
+        field_dependencies = {
+            'nombre_completo': ['first_name', 'apellido_paterno', 'apellido_materno'],
+        }
 
     def get_nombre_completo(self, obj):
         return f'{obj.first_name} {obj.apellido_paterno} {obj.apellido_materno}'
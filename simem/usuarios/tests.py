@@ -1,3 +1,84 @@
+import time
+from unittest import mock
+
+from django.core.cache import caches
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from usuarios.authentication import issue_access_token
+from usuarios.models import Usuarios
+
+
+class SignedTokenAuthenticationTests(TestCase):
+    """Tokens de acceso firmados (Authorization: Bearer) y su revocación con token_version"""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.usuario = Usuarios.objects.create_user(
+            username='firmado', password='clave-antigua', apellido_paterno='Pérez', apellido_materno='López'
+        )
+        self.client = APIClient()
+
+    def login(self, password='clave-antigua'):
+        response = self.client.post('/api/v1/auth/access/', {'username': 'firmado', 'password': password}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def me(self, access):
+        return self.client.get('/api/v1/usuarios/me/', HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_token_valido(self):
+        data = self.login()
+        response = self.me(data['access'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['username'], 'firmado')
+
+    def test_token_expirado(self):
+        with mock.patch('django.core.signing.time.time', return_value=time.time() - 3600):
+            access = issue_access_token(self.usuario)
+        with self.settings(ACCESS_TOKEN_TTL=300):
+            self.assertEqual(self.me(access).status_code, 401)
+
+    def test_firma_invalida(self):
+        access = self.login()['access']
+        self.assertEqual(self.me(access[:-2] + ('AA' if not access.endswith('AA') else 'BB')).status_code, 401)
+        # Firmado con otra SECRET_KEY
+        with self.settings(SECRET_KEY='otra-clave'):
+            access = issue_access_token(self.usuario)
+        self.assertEqual(self.me(access).status_code, 401)
+
+    def test_logout_revoca_el_token(self):
+        data = self.login()
+        response = self.client.delete('/api/v1/auth/logout/', HTTP_AUTHORIZATION=f"Bearer {data['access']}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.me(data['access']).status_code, 401)
+        # El logout también elimina el authtoken que sirve de refresco
+        response = self.client.post('/api/v1/auth/refresh/', {'refresh': data['refresh']}, format='json')
+        self.assertEqual(response.status_code, 401)
+
+    def test_cambio_de_contraseña_revoca_el_token(self):
+        access = self.login()['access']
+        self.usuario.set_password('clave-nueva')
+        self.usuario.save()
+        self.assertEqual(self.me(access).status_code, 401)
+        self.assertEqual(self.me(self.login('clave-nueva')['access']).status_code, 200)
+
+    def test_desactivar_revoca_el_token(self):
+        access = self.login()['access']
+        self.usuario.is_active = False
+        self.usuario.save()
+        self.assertEqual(self.me(access).status_code, 401)
+
+    def test_refresh(self):
+        data = self.login()
+        response = self.client.post('/api/v1/auth/refresh/', {'refresh': data['refresh']}, format='json')
+        self.assertEqual(response.status_code, 200)
+        refreshed = response.json()['data']
+        self.assertEqual(refreshed['refresh'], data['refresh'])
+        self.assertEqual(self.me(refreshed['access']).status_code, 200)
 
-# Create your tests here.
+    def test_refresh_invalido(self):
+        response = self.client.post('/api/v1/auth/refresh/', {}, format='json')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/v1/auth/refresh/', {'refresh': 'no-existe'}, format='json')
+        self.assertEqual(response.status_code, 401)
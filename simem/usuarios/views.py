@@ -1,17 +1,27 @@
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
 
+from helpers.async_views import ThreadedViewMixin
+from helpers.exceptions import BadRequest, Unauthorized
 from helpers.responses import ok_response, ok_logout, permission_denied_response
+from usuarios.authentication import issue_access_token, revoke_access_tokens
+from usuarios.permissions_cache import user_profile
 
 User = get_user_model()
 
 
-class CustomAuthToken(ObtainAuthToken):
+class CustomAuthToken(ThreadedViewMixin, ObtainAuthToken):
+    """
+    Login por token. Después de validar la contraseña solo consulta el token y
+    escribe last_login; grupos y permisos salen del perfil en caché. Bajo ASGI
+    corre en un hilo propio (helpers.async_views.ThreadedViewMixin).
+    """
 
     def post(self, request, *args, **kwargs):
         serializer = self.serializer_class(data=request.data, context={'request': request})
@@ -20,8 +30,9 @@ class CustomAuthToken(ObtainAuthToken):
 
         token, created = Token.objects.get_or_create(user=user)
 
-        permisos = list(user.get_all_permissions())
-        grupos = list(user.groups.values_list('name', flat=True))
+        perfil = user_profile(user)
+        permisos = list(perfil['permisos'])
+        grupos = list(perfil['grupos'])
         nombre_completo = f'{user.first_name} {user.apellido_paterno} {user.apellido_materno}'.strip()
 
         data = {
@@ -39,15 +50,59 @@ class CustomAuthToken(ObtainAuthToken):
             'grupos': grupos,
             'permisos': permisos,
         }
-        user.last_login = timezone.now()
-        user.save()
+        # Solo se escribe last_login (UPDATE de una columna, sin reescribir la fila)
+        User.objects.filter(pk=user.pk).update(last_login=timezone.now())
         return ok_response(data)
 
 
+def access_token_data(user, refresh):
+    return {
+        'user_id': user.pk,
+        'is_superuser': user.is_superuser,
+        'token_type': 'Bearer',
+        'access': issue_access_token(user),
+        'expires_in': settings.ACCESS_TOKEN_TTL,
+        'refresh': refresh,
+    }
+
+
+class AccessTokenLogin(ThreadedViewMixin, ObtainAuthToken):
+    """
+    Login con token de acceso firmado (Authorization: Bearer) de vida corta.
+    El authtoken del usuario se entrega como token de refresco.
+    """
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.serializer_class(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        user = serializer.validated_data['user']
+
+        token, created = Token.objects.get_or_create(user=user)
+        User.objects.filter(pk=user.pk).update(last_login=timezone.now())
+        return ok_response(access_token_data(user, token.key))
+
+
+class RefreshAccessToken(APIView):
+    """Emite un nuevo token de acceso a partir del token de refresco (authtoken)"""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        refresh = request.data.get('refresh')
+        if not refresh:
+            raise BadRequest({'refresh': 'Este campo es requerido'})
+        token = Token.objects.select_related('user').filter(key=refresh).first()
+        if token is None or not token.user.is_active:
+            raise Unauthorized()
+        return ok_response(access_token_data(token.user, token.key))
+
+
 class Logout(APIView):
     permission_classes = [IsAuthenticated]
 
     def delete(self, request, *args, **kwargs):
         user = request.user
         Token.objects.filter(user=user).delete()
+        # También deja sin efecto los tokens de acceso firmados ya emitidos
+        revoke_access_tokens([user.pk])
         return ok_logout(None)
\ No newline at end of file
@@ -1,8 +1,9 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
+from asgiref.sync import sync_to_async
 from django.db import transaction
 from django.db.models import Q
 from django.core.exceptions import ObjectDoesNotExist
@@ -16,6 +17,8 @@ from usuarios.serializers import (
     UsuariosUpdateSerializer,
 )
 from usuarios.filters import UsuariosFilter
+from usuarios.authentication import aload_full_user, load_full_user
+from helpers.async_views import AsyncReadMixin
 from helpers.exceptions import BadRequest, NotFound, Unauthorized
 from helpers.responses import (
     ok_response,
@@ -25,9 +28,11 @@ from helpers.responses import (
     no_content_response,
 )
 from helpers.errors import error
+from helpers.query_plans import QueryPlanMixin
+from helpers.trigram import TrigramSearchFilter
 
 
-class UsuariosViewSet(viewsets.ModelViewSet):
+class UsuariosViewSet(AsyncReadMixin, QueryPlanMixin, viewsets.ModelViewSet):
     """
     ViewSet para gestionar usuarios.
     Permite CRUD completo sobre usuarios del sistema con control de permisos.
@@ -35,11 +40,14 @@ class UsuariosViewSet(viewsets.ModelViewSet):
     queryset = Usuarios.objects.all()
     serializer_class = UsuariosSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, TrigramSearchFilter, OrderingFilter]
     filterset_class = UsuariosFilter
-    search_fields = ['username', 'email', 'first_name', 'apellido_paterno', 'apellido_materno']
-    ordering_fields = ['date_joined', 'username']
+    search_fields = ['nombre_completo', 'username', 'email']
+    ordering_fields = ['date_joined', 'username', 'registros_count']
     ordering = ['-date_joined']
+    async_actions = ('list', 'retrieve', 'me')
+    # role y permissions salen del perfil en caché (usuarios.permissions_cache), sin prefetch de grupos
+    query_plans = {}
 
     def get_serializer_class(self):
         """Retorna el serializador según la acción"""
@@ -61,8 +69,10 @@ class UsuariosViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filtra usuarios según permisos del usuario actual"""
         if self.request.user.is_superuser:
-            return Usuarios.objects.all().order_by('-date_joined')
-        return Usuarios.objects.filter(is_active=True).order_by('-date_joined')
+            queryset = Usuarios.objects.all().order_by('-date_joined')
+        else:
+            queryset = Usuarios.objects.filter(is_active=True).order_by('-date_joined')
+        return self.apply_query_plan(queryset)
 
     def get_object(self):
         """Obtiene un objeto con manejo de excepciones"""
@@ -76,17 +86,23 @@ class UsuariosViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         """Lista usuarios con paginación"""
-        queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.get_list_queryset()
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return ok_response(data=self.get_paginated_response(serializer.data).data)
-        serializer = self.get_serializer(queryset, many=True)
-        return ok_response(data=serializer.data)
+            return self.list_response(page, paginated=True)
+        return self.list_response(queryset)
+
+    def list_response(self, objects, paginated=False):
+        data = self.get_serializer(objects, many=True).data
+        if paginated:
+            data = self.get_paginated_response(data).data
+        return ok_response(data=data)
 
     def retrieve(self, request, pk=None):
         """Obtiene un usuario específico"""
-        instance = self.get_object()
+        return self.retrieve_response(self.get_object())
+
+    def retrieve_response(self, instance):
         if not instance:
             raise NotFound()
         serializer = self.get_serializer(instance)
@@ -134,14 +150,28 @@ class UsuariosViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def me(self, request):
         """Obtiene el usuario actual"""
-        serializer = UsuariosRetrieveSerializer(request.user)
+        return self.me_response(load_full_user(request.user))
+
+    async def ame(self, request):
+        return await sync_to_async(self.me_response)(await aload_full_user(request.user))
+
+    def me_response(self, user):
+        serializer = UsuariosRetrieveSerializer(user, context=self.get_serializer_context())
         return ok_response(data=serializer.data)
 
     @action(detail=False, methods=['get'])
     def activos(self, request):
-        """Obtiene solo usuarios activos"""
-        usuarios_activos = Usuarios.objects.filter(is_active=True).order_by('username')
-        serializer = UsuariosListSerializer(usuarios_activos, many=True)
+        """Obtiene solo usuarios activos con paginación"""
+        usuarios_activos = self.apply_query_plan(
+            Usuarios.objects.filter(is_active=True).order_by('username'),
+            serializer_class=UsuariosListSerializer,
+        )
+        context = self.get_serializer_context()
+        page = self.paginate_queryset(usuarios_activos)
+        if page is not None:
+            serializer = UsuariosListSerializer(page, many=True, context=context)
+            return ok_response(data=self.get_paginated_response(serializer.data).data)
+        serializer = UsuariosListSerializer(usuarios_activos, many=True, context=context)
         return ok_response(data=serializer.data)
 
     @action(detail=True, methods=['post'], permission_classes=[permissions.IsAuthenticated])